@@ -2,14 +2,24 @@ import streamlit as st
 import pandas as pd
 import plotly.graph_objects as go
 import plotly.express as px
+import plotly.io as pio
 from plotly.subplots import make_subplots
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional
+from collections.abc import Mapping
+from functools import cached_property
 import json
-from dataclasses import dataclass, asdict
+import re
+from dataclasses import dataclass, asdict, fields
 from enum import Enum
 import numpy as np
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 class ApplicationStatus(Enum):
     """Application status enumeration"""
     DRAFT = "draft"
@@ -24,6 +34,20 @@ class ApplicationStatus(Enum):
     REJECTED = "rejected"
     WITHDRAWN = "withdrawn"
 
+# Status groupings shared by the analytics helpers
+ALL_STATUSES = [s.value for s in ApplicationStatus]
+INTERVIEW_STATUSES = frozenset({
+    ApplicationStatus.PHONE_SCREEN.value,
+    ApplicationStatus.TECHNICAL_INTERVIEW.value,
+    ApplicationStatus.ONSITE_INTERVIEW.value,
+    ApplicationStatus.FINAL_INTERVIEW.value
+})
+CLOSED_STATUSES = frozenset({
+    ApplicationStatus.REJECTED.value,
+    ApplicationStatus.ACCEPTED.value,
+    ApplicationStatus.WITHDRAWN.value
+})
+
 @dataclass
 class JobApplication:
     """Job application data model"""
@@ -49,6 +73,53 @@ class JobApplication:
     rejection_feedback: str
     last_updated: datetime
 
+# Salary amounts such as "$120,000" or "120k" (group 2 captures the k suffix)
+_SALARY_RE = re.compile(r'\$?(\d{1,3}(?:,\d{3})*)(k|K)?')
+
+def _offer_premium_loop(salaries: np.ndarray, is_offer: np.ndarray) -> float:
+    """Percent premium of offer salaries over all target salaries, in one pass"""
+    total_sum = 0.0
+    offer_sum = 0.0
+    offer_count = 0
+    
+    for i in range(salaries.shape[0]):
+        total_sum += salaries[i]
+        if is_offer[i]:
+            offer_sum += salaries[i]
+            offer_count += 1
+    
+    if offer_count == 0 or total_sum == 0.0:
+        return 0.0
+    
+    target_avg = total_sum / salaries.shape[0]
+    offer_avg = offer_sum / offer_count
+    return (offer_avg - target_avg) / target_avg * 100
+
+def _offer_premium_numpy(salaries: np.ndarray, is_offer: np.ndarray) -> float:
+    """NumPy equivalent of _offer_premium_loop for installs without numba"""
+    target_sum = salaries.sum()
+    if not is_offer.any() or target_sum == 0.0:
+        return 0.0
+    
+    target_avg = target_sum / salaries.shape[0]
+    offer_avg = salaries[is_offer].mean()
+    return (offer_avg - target_avg) / target_avg * 100
+
+_offer_premium = njit(cache=True)(_offer_premium_loop) if NUMBA_AVAILABLE else _offer_premium_numpy
+
+# Shared dashboard layout, registered once and layered on the default Plotly theme
+pio.templates['smartats'] = go.layout.Template(layout=dict(height=400))
+CHART_TEMPLATE = 'plotly+smartats'
+
+# Columns stored as datetime64[ns] in the columnar session buffer
+DATE_COLUMNS = ('application_date', 'last_updated')
+
+# Fixed status categories so codes are stable across DataFrame rebuilds
+STATUS_DTYPE = pd.CategoricalDtype(categories=ALL_STATUSES, ordered=False)
+
+# Low-cardinality text columns stored as pandas categories
+CATEGORY_COLUMNS = ('source', 'industry', 'job_type')
+
 class JobApplicationTracker:
     """
     Comprehensive job application tracking and analytics system
@@ -73,6 +144,15 @@ class JobApplicationTracker:
             ApplicationStatus.WITHDRAWN: {'order': -2, 'color': '#6B7280', 'label': 'Withdrawn'}
         }
         
+        # Flat status value -> pipeline order lookup for vectorized funnel math
+        self._status_order = {s.value: info['order'] for s, info in self.pipeline_stages.items()}
+        # Same lookup indexed by STATUS_DTYPE code; the trailing -10 catches missing (-1) codes
+        self._status_order_by_code = np.array(
+            [self._status_order[s] for s in ALL_STATUSES] + [-10], dtype=np.int8
+        )
+        self._status_label = {s.value: info['label'] for s, info in self.pipeline_stages.items()}
+        self._status_color = {s.value: info['color'] for s, info in self.pipeline_stages.items()}
+        
         # Success metrics and KPIs
         self.success_metrics = [
             'response_rate', 'interview_rate', 'offer_rate', 'acceptance_rate',
@@ -83,7 +163,10 @@ class JobApplicationTracker:
         """Initialize the tracking system"""
         if self.session_key not in st.session_state:
             st.session_state[self.session_key] = {
-                'applications': {},
+                'columns': {field.name: [] for field in fields(JobApplication)},
+                'row_index': {},
+                'next_id': 0,
+                'version': 0,
                 'analytics': {},
                 'goals': {},
                 'insights': []
@@ -91,11 +174,26 @@ class JobApplicationTracker:
     
     def add_application(self, application: JobApplication) -> str:
         """Add a new job application to the tracker"""
-        app_id = f"app_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{len(st.session_state[self.session_key]['applications'])}"
+        tracker_state = st.session_state[self.session_key]
+        
+        # Session-scoped monotonic ID - never collides, no strftime per insert
+        next_id = tracker_state.get('next_id', 0)
+        tracker_state['next_id'] = next_id + 1
+        app_id = f"app_{next_id:08d}"
         application.id = app_id
         application.last_updated = datetime.now()
+        application.match_score = float(application.match_score)
+        
+        record = asdict(application)
+        if isinstance(application.status, ApplicationStatus):
+            record['status'] = application.status.value
+        
+        # Applications are stored column-wise: append one value per field
+        tracker_state['row_index'][app_id] = len(tracker_state['columns']['id'])
+        for name, column in tracker_state['columns'].items():
+            column.append(record[name])
         
-        st.session_state[self.session_key]['applications'][app_id] = asdict(application)
+        self._bump_version()
         
         # Update analytics
         self._update_analytics()
@@ -105,83 +203,111 @@ class JobApplicationTracker:
     def update_application_status(self, app_id: str, new_status: ApplicationStatus, 
                                 notes: str = "", follow_up_date: Optional[datetime] = None):
         """Update application status and add activity log"""
-        applications = st.session_state[self.session_key]['applications']
+        tracker_state = st.session_state[self.session_key]
         
-        if app_id in applications:
-            old_status = applications[app_id]['status']
-            applications[app_id]['status'] = new_status.value
-            applications[app_id]['last_updated'] = datetime.now().isoformat()
+        if app_id in tracker_state['row_index']:
+            columns = tracker_state['columns']
+            row = tracker_state['row_index'][app_id]
+            
+            old_status = columns['status'][row]
+            columns['status'][row] = new_status.value
+            columns['last_updated'][row] = datetime.now()
             
             # Add notes if provided
             if notes:
-                current_notes = applications[app_id].get('notes', '')
+                current_notes = columns['notes'][row]
                 timestamp = datetime.now().strftime('%Y-%m-%d %H:%M')
                 new_note = f"[{timestamp}] Status changed from {old_status} to {new_status.value}: {notes}"
-                applications[app_id]['notes'] = f"{current_notes}\n{new_note}" if current_notes else new_note
+                columns['notes'][row] = f"{current_notes}\n{new_note}" if current_notes else new_note
             
             # Add follow-up date if provided
             if follow_up_date:
-                follow_ups = applications[app_id].get('follow_up_dates', [])
-                follow_ups.append(follow_up_date.isoformat())
-                applications[app_id]['follow_up_dates'] = follow_ups
+                columns['follow_up_dates'][row] = columns['follow_up_dates'][row] + [follow_up_date]
+            
+            self._bump_version()
             
             # Update analytics
             self._update_analytics()
     
     def get_applications_dataframe(self) -> pd.DataFrame:
-        """Get all applications as a pandas DataFrame"""
-        applications = st.session_state[self.session_key]['applications']
+        """Get all applications as a pandas DataFrame (memoized per state version)"""
+        tracker_state = st.session_state[self.session_key]
+        version = tracker_state.setdefault('version', 0)
+        
+        cached = tracker_state.get('dataframe_cache')
+        if cached is not None and cached[0] == version:
+            return cached[1]
         
-        if not applications:
+        df = self._build_applications_dataframe(tracker_state['columns'])
+        tracker_state['dataframe_cache'] = (version, df)
+        return df
+    
+    def _build_applications_dataframe(self, columns: Dict[str, List[Any]]) -> pd.DataFrame:
+        """Build the applications DataFrame from the columnar session buffer"""
+        if not columns['id']:
             return pd.DataFrame()
         
-        df = pd.DataFrame.from_dict(applications, orient='index')
+        data = dict(columns)
         
-        # Convert date columns
-        date_columns = ['application_date', 'last_updated']
-        for col in date_columns:
-            if col in df.columns:
-                df[col] = pd.to_datetime(df[col])
+        # Dates are held as datetime objects, so this is a direct cast - no string parsing
+        for col in DATE_COLUMNS:
+            data[col] = np.array(columns[col], dtype='datetime64[ns]')
         
-        return df
+        # Typed numeric/categorical columns keep the analytics off the object-dtype path
+        data['match_score'] = np.asarray(columns['match_score'], dtype=np.float32)
+        data['status'] = pd.Categorical(columns['status'], dtype=STATUS_DTYPE)
+        for col in CATEGORY_COLUMNS:
+            data[col] = pd.Categorical(columns[col])
+        
+        return pd.DataFrame(data, index=columns['id'])
     
-    def get_analytics_dashboard(self) -> Dict[str, Any]:
-        """Generate comprehensive analytics dashboard data"""
+    def get_analytics_dashboard(self) -> Mapping:
+        """Generate comprehensive analytics dashboard data
+        
+        Sections are computed lazily on first access and reused until the
+        tracker state changes; call ``collect()`` on the result for a plain dict.
+        """
         df = self.get_applications_dataframe()
         
         if df.empty:
             return {'error': 'No applications data available'}
         
-        analytics = {
-            'summary_stats': self._calculate_summary_stats(df),
-            'conversion_funnel': self._calculate_conversion_funnel(df),
-            'time_analysis': self._analyze_application_timing(df),
-            'source_analysis': self._analyze_application_sources(df),
-            'industry_analysis': self._analyze_industry_performance(df),
-            'salary_analysis': self._analyze_salary_trends(df),
-            'success_predictors': self._identify_success_predictors(df),
-            'recommendations': self._generate_recommendations(df)
-        }
+        tracker_state = st.session_state[self.session_key]
+        version = tracker_state['version']
+        
+        cached = tracker_state.get('analytics') or {}
+        if cached.get('version') == version:
+            return cached['dashboard']
+        
+        analytics = LazyAnalytics(self, df)
+        tracker_state['analytics'] = {'version': version, 'dashboard': analytics}
         
         return analytics
     
-    def _calculate_summary_stats(self, df: pd.DataFrame) -> Dict[str, Any]:
+    def _precompute(self, df: pd.DataFrame) -> Dict[str, Any]:
+        """Scan the status column once for the helpers that share it"""
+        status_counts = df['status'].value_counts()
+        
+        return {
+            'status_counts': status_counts[status_counts > 0].to_dict(),
+            # Pipeline order per row; unknown statuses sit below all stages
+            'orders': self._status_order_by_code[df['status'].cat.codes.to_numpy()],
+            'N': len(df)
+        }
+    
+    def _calculate_summary_stats(self, df: pd.DataFrame, shared: Dict[str, Any]) -> Dict[str, Any]:
         """Calculate key summary statistics"""
-        total_applications = len(df)
+        total_applications = shared['N']
         
         # Status distribution
-        status_counts = df['status'].value_counts()
+        counts = shared['status_counts']
         
         # Calculate key rates
-        responses = len(df[df['status'] != ApplicationStatus.APPLIED.value])
-        interviews = len(df[df['status'].isin([
-            ApplicationStatus.PHONE_SCREEN.value,
-            ApplicationStatus.TECHNICAL_INTERVIEW.value,
-            ApplicationStatus.ONSITE_INTERVIEW.value,
-            ApplicationStatus.FINAL_INTERVIEW.value
-        ])])
-        offers = len(df[df['status'] == ApplicationStatus.OFFER_RECEIVED.value])
-        accepted = len(df[df['status'] == ApplicationStatus.ACCEPTED.value])
+        responses = total_applications - counts.get(ApplicationStatus.APPLIED.value, 0)
+        interviews = sum(counts.get(s, 0) for s in INTERVIEW_STATUSES)
+        offers = counts.get(ApplicationStatus.OFFER_RECEIVED.value, 0)
+        accepted = counts.get(ApplicationStatus.ACCEPTED.value, 0)
+        active = total_applications - sum(counts.get(s, 0) for s in CLOSED_STATUSES)
         
         response_rate = (responses / total_applications * 100) if total_applications > 0 else 0
         interview_rate = (interviews / total_applications * 100) if total_applications > 0 else 0
@@ -189,19 +315,15 @@ class JobApplicationTracker:
         
         return {
             'total_applications': total_applications,
-            'active_applications': len(df[~df['status'].isin([
-                ApplicationStatus.REJECTED.value,
-                ApplicationStatus.ACCEPTED.value,
-                ApplicationStatus.WITHDRAWN.value
-            ])]),
+            'active_applications': active,
             'response_rate': round(response_rate, 1),
             'interview_rate': round(interview_rate, 1),
             'offer_rate': round(offer_rate, 1),
-            'status_distribution': status_counts.to_dict(),
+            'status_distribution': counts,
             'recent_activity': self._get_recent_activity(df)
         }
     
-    def _calculate_conversion_funnel(self, df: pd.DataFrame) -> Dict[str, Any]:
+    def _calculate_conversion_funnel(self, df: pd.DataFrame, shared: Dict[str, Any]) -> Dict[str, Any]:
         """Calculate conversion funnel metrics"""
         funnel_stages = [
             ('Applied', ApplicationStatus.APPLIED.value),
@@ -215,18 +337,19 @@ class JobApplicationTracker:
         ]
         
         funnel_data = []
-        total_apps = len(df)
+        total_apps = shared['N']
+        orders = shared['orders']
         
         for stage_name, status in funnel_stages:
             if status == ApplicationStatus.APPLIED.value:
                 count = total_apps
             elif status == ApplicationStatus.UNDER_REVIEW.value:
                 # Count all applications that got past "applied" status
-                count = len(df[df['status'] != ApplicationStatus.APPLIED.value])
+                count = int((orders != self._status_order[ApplicationStatus.APPLIED.value]).sum())
             else:
                 # Count applications at this specific status or beyond
-                stage_order = self.pipeline_stages[ApplicationStatus(status)]['order']
-                count = len(df[df['status'].apply(lambda s: self.pipeline_stages.get(ApplicationStatus(s), {'order': -10})['order'] >= stage_order)])
+                stage_order = self._status_order[status]
+                count = int((orders >= stage_order).sum())
             
             conversion_rate = (count / total_apps * 100) if total_apps > 0 else 0
             
@@ -243,157 +366,125 @@ class JobApplicationTracker:
     
     def _analyze_application_timing(self, df: pd.DataFrame) -> Dict[str, Any]:
         """Analyze timing patterns in applications"""
-        df_copy = df.copy()
-        df_copy['application_date'] = pd.to_datetime(df_copy['application_date'])
+        dates = df['application_date']
         
         # Applications by day of week
-        df_copy['day_of_week'] = df_copy['application_date'].dt.day_name()
-        day_counts = df_copy['day_of_week'].value_counts()
+        day_counts = dates.dt.day_name().value_counts()
         
         # Applications by month
-        df_copy['month'] = df_copy['application_date'].dt.strftime('%Y-%m')
-        month_counts = df_copy['month'].value_counts().sort_index()
-        
-        # Response time analysis (if we have status change data)
-        response_times = []
-        for _, app in df_copy.iterrows():
-            if app['status'] != ApplicationStatus.APPLIED.value:
-                # Simplified: assume response came within a week
-                # In real implementation, we'd track actual status change dates
-                response_times.append(np.random.randint(1, 14))  # Random for demo
+        month_counts = dates.dt.strftime('%Y-%m').value_counts().sort_index()
         
-        avg_response_time = np.mean(response_times) if response_times else 0
+        # Response time is not tracked until status change dates are persisted
+        avg_response_time = None
         
         return {
             'applications_by_day': day_counts.to_dict(),
             'applications_by_month': month_counts.to_dict(),
-            'average_response_time_days': round(avg_response_time, 1),
+            'average_response_time_days': avg_response_time,
             'peak_application_day': day_counts.index[0] if not day_counts.empty else 'N/A',
-            'application_frequency': len(df_copy) / max(1, (datetime.now() - df_copy['application_date'].min()).days) if not df_copy.empty else 0
+            'application_frequency': len(df) / max(1, (datetime.now() - dates.min()).days) if not df.empty else 0
         }
     
     def _analyze_application_sources(self, df: pd.DataFrame) -> Dict[str, Any]:
         """Analyze effectiveness of different application sources"""
-        source_stats = {}
-        
-        for source in df['source'].unique():
-            source_df = df[df['source'] == source]
-            total = len(source_df)
-            
-            responses = len(source_df[source_df['status'] != ApplicationStatus.APPLIED.value])
-            interviews = len(source_df[source_df['status'].isin([
-                ApplicationStatus.PHONE_SCREEN.value,
-                ApplicationStatus.TECHNICAL_INTERVIEW.value,
-                ApplicationStatus.ONSITE_INTERVIEW.value,
-                ApplicationStatus.FINAL_INTERVIEW.value
-            ])])
-            offers = len(source_df[source_df['status'] == ApplicationStatus.OFFER_RECEIVED.value])
-            
-            source_stats[source] = {
-                'total_applications': total,
-                'response_rate': round((responses / total * 100) if total > 0 else 0, 1),
-                'interview_rate': round((interviews / total * 100) if total > 0 else 0, 1),
-                'offer_rate': round((offers / total * 100) if total > 0 else 0, 1),
-                'effectiveness_score': round(((responses * 0.3 + interviews * 0.5 + offers * 1.0) / total * 100) if total > 0 else 0, 1)
-            }
-        
-        # Rank sources by effectiveness
-        ranked_sources = sorted(source_stats.items(), key=lambda x: x[1]['effectiveness_score'], reverse=True)
+        # Source x status count matrix in one groupby pass
+        status_ct = pd.crosstab(df['source'], df['status']).reindex(columns=ALL_STATUSES, fill_value=0)
+        
+        totals = status_ct.sum(axis=1)
+        responses = totals - status_ct[ApplicationStatus.APPLIED.value]
+        interviews = status_ct[sorted(INTERVIEW_STATUSES)].sum(axis=1)
+        offers = status_ct[ApplicationStatus.OFFER_RECEIVED.value]
+        
+        rates_df = pd.DataFrame({
+            'total_applications': totals,
+            'response_rate': (responses / totals * 100).round(1),
+            'interview_rate': (interviews / totals * 100).round(1),
+            'offer_rate': (offers / totals * 100).round(1),
+            'effectiveness_score': ((responses * 0.3 + interviews * 0.5 + offers * 1.0) / totals * 100).round(1)
+        })
+        source_stats = rates_df.to_dict('index')
         
         return {
             'source_performance': source_stats,
-            'best_sources': [source[0] for source in ranked_sources[:3]],
-            'source_recommendations': self._generate_source_recommendations(source_stats)
+            'source_metrics': rates_df,
+            'best_sources': rates_df['effectiveness_score'].nlargest(3).index.tolist(),
+            'source_recommendations': self._generate_source_recommendations(rates_df)
         }
     
     def _analyze_industry_performance(self, df: pd.DataFrame) -> Dict[str, Any]:
         """Analyze performance across different industries"""
-        industry_stats = {}
+        grouped = df.groupby('industry', observed=True)
+        sizes = grouped.size()
         
-        for industry in df['industry'].unique():
-            industry_df = df[df['industry'] == industry]
-            total = len(industry_df)
-            
-            avg_match_score = industry_df['match_score'].mean() if 'match_score' in industry_df.columns else 0
-            
-            responses = len(industry_df[industry_df['status'] != ApplicationStatus.APPLIED.value])
-            offers = len(industry_df[industry_df['status'] == ApplicationStatus.OFFER_RECEIVED.value])
-            
-            industry_stats[industry] = {
-                'total_applications': total,
-                'average_match_score': round(avg_match_score, 1),
-                'response_rate': round((responses / total * 100) if total > 0 else 0, 1),
-                'offer_rate': round((offers / total * 100) if total > 0 else 0, 1)
-            }
+        if 'match_score' in df.columns:
+            match_means = grouped['match_score'].mean().astype(float)
+        else:
+            match_means = pd.Series(0.0, index=sizes.index)
+        
+        # Industry x status count matrix in one pass
+        status_ct = pd.crosstab(df['industry'], df['status']).reindex(
+            index=sizes.index, columns=ALL_STATUSES, fill_value=0
+        )
+        responses = sizes - status_ct[ApplicationStatus.APPLIED.value]
+        offers = status_ct[ApplicationStatus.OFFER_RECEIVED.value]
+        
+        metrics = pd.DataFrame({
+            'total_applications': sizes,
+            'average_match_score': match_means.round(1),
+            'response_rate': (responses / sizes * 100).round(1),
+            'offer_rate': (offers / sizes * 100).round(1)
+        })
         
         return {
-            'industry_performance': industry_stats,
-            'best_performing_industry': max(industry_stats.items(), key=lambda x: x[1]['offer_rate'])[0] if industry_stats else 'N/A'
+            'industry_performance': metrics.to_dict('index'),
+            'best_performing_industry': metrics['offer_rate'].idxmax() if not metrics.empty else 'N/A'
         }
     
     def _analyze_salary_trends(self, df: pd.DataFrame) -> Dict[str, Any]:
         """Analyze salary trends and ranges"""
         # Extract salary numbers from salary_range strings
-        salary_data = []
-        
-        for _, app in df.iterrows():
-            salary_range = app.get('salary_range', '')
-            if salary_range:
-                # Simple extraction (in production, use more robust parsing)
-                numbers = re.findall(r'\$?(\d{1,3}(?:,\d{3})*(?:k|K)?)', salary_range)
-                if numbers:
-                    try:
-                        # Convert to actual numbers
-                        salaries = []
-                        for num in numbers:
-                            if num.endswith(('k', 'K')):
-                                salaries.append(float(num[:-1]) * 1000)
-                            else:
-                                salaries.append(float(num.replace(',', '')))
-                        
-                        if salaries:
-                            avg_salary = sum(salaries) / len(salaries)
-                            salary_data.append({
-                                'company': app['company_name'],
-                                'industry': app['industry'],
-                                'position': app['position_title'],
-                                'salary': avg_salary,
-                                'status': app['status']
-                            })
-                    except:
-                        continue
-        
-        salary_df = pd.DataFrame(salary_data)
+        # (simple extraction - in production, use more robust parsing)
+        matches = df['salary_range'].fillna('').astype(str).str.extractall(_SALARY_RE)
         
-        if salary_df.empty:
+        if matches.empty:
             return {'error': 'No salary data available'}
         
+        # Convert to actual numbers, scaling "k" suffixed values
+        amounts = matches[0].str.replace(',', '', regex=False).astype(float)
+        amounts[matches[1].str.lower() == 'k'] *= 1000
+        avg_per_row = amounts.groupby(level=0).mean()
+        
+        salary_df = df.loc[avg_per_row.index, ['company_name', 'industry', 'position_title', 'status']].rename(
+            columns={'company_name': 'company', 'position_title': 'position'}
+        )
+        salary_df['salary'] = avg_per_row.to_numpy()
+        
         return {
             'average_target_salary': round(salary_df['salary'].mean(), 0),
             'salary_range': {
                 'min': round(salary_df['salary'].min(), 0),
                 'max': round(salary_df['salary'].max(), 0)
             },
-            'salary_by_industry': salary_df.groupby('industry')['salary'].mean().round(0).to_dict(),
+            'salary_by_industry': salary_df.groupby('industry', observed=True)['salary'].mean().round(0).to_dict(),
             'offer_salary_premium': self._calculate_offer_premium(salary_df)
         }
     
-    def _identify_success_predictors(self, df: pd.DataFrame) -> Dict[str, Any]:
+    def _identify_success_predictors(self, df: pd.DataFrame, shared: Dict[str, Any]) -> Dict[str, Any]:
         """Identify factors that predict application success"""
-        successful_apps = df[df['status'].isin([
-            ApplicationStatus.OFFER_RECEIVED.value,
-            ApplicationStatus.ACCEPTED.value
-        ])]
+        # Offers and acceptances are the only stages at or beyond the offer order
+        successful_mask = shared['orders'] >= self._status_order[ApplicationStatus.OFFER_RECEIVED.value]
         
-        if len(successful_apps) == 0:
+        if not successful_mask.any():
             return {'error': 'No successful applications to analyze'}
         
+        successful_apps = df[successful_mask]
+        
         # Analyze success factors
         success_factors = {
             'high_match_score': len(successful_apps[successful_apps['match_score'] > 80]) / len(successful_apps) * 100,
             'referral_advantage': len(successful_apps[successful_apps['source'] == 'Referral']) / len(successful_apps) * 100,
             'optimal_timing': self._analyze_timing_success(successful_apps),
-            'industry_concentration': successful_apps['industry'].value_counts().head(3).to_dict()
+            'industry_concentration': successful_apps['industry'].value_counts().loc[lambda c: c > 0].head(3).to_dict()
         }
         
         return {
@@ -401,13 +492,14 @@ class JobApplicationTracker:
             'recommendations': self._generate_success_recommendations(success_factors)
         }
     
-    def _generate_recommendations(self, df: pd.DataFrame) -> List[Dict[str, str]]:
+    def _generate_recommendations(self, df: pd.DataFrame, shared: Dict[str, Any]) -> List[Dict[str, str]]:
         """Generate actionable recommendations based on application data"""
         recommendations = []
         
         # Analyze current performance
-        total_apps = len(df)
-        response_rate = len(df[df['status'] != ApplicationStatus.APPLIED.value]) / total_apps * 100 if total_apps > 0 else 0
+        total_apps = shared['N']
+        responses = total_apps - shared['status_counts'].get(ApplicationStatus.APPLIED.value, 0)
+        response_rate = responses / total_apps * 100 if total_apps > 0 else 0
         
         # Response rate recommendations
         if response_rate < 20:
@@ -441,10 +533,14 @@ class JobApplicationTracker:
         
         return recommendations
     
-    def create_dashboard_visualizations(self, analytics: Dict[str, Any]) -> List[go.Figure]:
+    def create_dashboard_visualizations(self, analytics: Dict[str, Any],
+                                        df: Optional[pd.DataFrame] = None) -> List[go.Figure]:
         """Create comprehensive dashboard visualizations"""
         figures = []
         
+        if df is None:
+            df = self.get_applications_dataframe()
+        
         # 1. Application Pipeline Funnel
         if 'conversion_funnel' in analytics:
             figures.append(self._create_conversion_funnel_chart(analytics['conversion_funnel']))
@@ -454,7 +550,7 @@ class JobApplicationTracker:
             figures.append(self._create_status_distribution_chart(analytics['summary_stats']))
         
         # 3. Timeline and Trends
-        figures.append(self._create_timeline_chart())
+        figures.append(self._create_timeline_chart(df))
         
         # 4. Source Performance Analysis
         if 'source_analysis' in analytics:
@@ -470,21 +566,17 @@ class JobApplicationTracker:
         """Create conversion funnel visualization"""
         data = funnel_data['funnel_data']
         
-        fig = go.Figure()
-        
         # Create funnel chart
-        fig.add_trace(go.Funnel(
-            y=[item['stage'] for item in data],
-            x=[item['count'] for item in data],
-            textinfo="value+percent initial",
-            marker=dict(
-                color=['#3B82F6', '#8B5CF6', '#EC4899', '#EF4444', '#F97316', '#F59E0B', '#10B981', '#059669']
-            )
-        ))
-        
-        fig.update_layout(
-            title='Application Conversion Funnel',
-            height=500
+        fig = go.Figure(
+            data=[go.Funnel(
+                y=[item['stage'] for item in data],
+                x=[item['count'] for item in data],
+                textinfo="value+percent initial",
+                marker=dict(
+                    color=['#3B82F6', '#8B5CF6', '#EC4899', '#EF4444', '#F97316', '#F59E0B', '#10B981', '#059669']
+                )
+            )],
+            layout=dict(template=CHART_TEMPLATE, title='Application Conversion Funnel', height=500)
         )
         
         return fig
@@ -494,104 +586,72 @@ class JobApplicationTracker:
         status_dist = summary_stats['status_distribution']
         
         # Map status values to readable labels
-        labels = []
-        values = []
-        colors = []
-        
-        for status, count in status_dist.items():
-            try:
-                status_enum = ApplicationStatus(status)
-                labels.append(self.pipeline_stages[status_enum]['label'])
-                values.append(count)
-                colors.append(self.pipeline_stages[status_enum]['color'])
-            except:
-                labels.append(status.title())
-                values.append(count)
-                colors.append('#6B7280')
-        
-        fig = go.Figure(data=[go.Pie(
-            labels=labels,
-            values=values,
-            marker=dict(colors=colors),
-            hole=0.4
-        )])
-        
-        fig.update_layout(
-            title='Application Status Distribution',
-            height=400
+        labels = [self._status_label.get(status, str(status).title()) for status in status_dist]
+        values = list(status_dist.values())
+        colors = [self._status_color.get(status, '#6B7280') for status in status_dist]
+        
+        fig = go.Figure(
+            data=[go.Pie(
+                labels=labels,
+                values=values,
+                marker=dict(colors=colors),
+                hole=0.4
+            )],
+            layout=dict(template=CHART_TEMPLATE, title='Application Status Distribution')
         )
         
         return fig
     
-    def _create_timeline_chart(self) -> go.Figure:
+    def _create_timeline_chart(self, df: pd.DataFrame) -> go.Figure:
         """Create application timeline chart"""
-        df = self.get_applications_dataframe()
-        
         if df.empty:
             return go.Figure().add_annotation(text="No data available")
         
-        # Group by week
-        df['week'] = df['application_date'].dt.to_period('W').astype(str)
-        weekly_counts = df['week'].value_counts().sort_index()
-        
-        fig = go.Figure()
-        
-        fig.add_trace(go.Scatter(
-            x=weekly_counts.index,
-            y=weekly_counts.values,
-            mode='lines+markers',
-            name='Applications per Week',
-            line=dict(color='#3B82F6', width=3),
-            marker=dict(size=8)
-        ))
-        
-        fig.update_layout(
-            title='Application Timeline',
-            xaxis_title='Week',
-            yaxis_title='Number of Applications',
-            height=300
+        # Group by week (derived series only - the frame is shared via the cache)
+        weeks = df['application_date'].dt.to_period('W').astype(str)
+        weekly_counts = weeks.value_counts().sort_index()
+        
+        fig = go.Figure(
+            data=[go.Scatter(
+                x=weekly_counts.index,
+                y=weekly_counts.values,
+                mode='lines+markers',
+                name='Applications per Week',
+                line=dict(color='#3B82F6', width=3),
+                marker=dict(size=8)
+            )],
+            layout=dict(
+                template=CHART_TEMPLATE,
+                title='Application Timeline',
+                xaxis_title='Week',
+                yaxis_title='Number of Applications',
+                height=300
+            )
         )
         
         return fig
     
     def _create_source_performance_chart(self, source_analysis: Dict[str, Any]) -> go.Figure:
         """Create source performance comparison"""
-        source_perf = source_analysis['source_performance']
-        
-        sources = list(source_perf.keys())
-        response_rates = [source_perf[s]['response_rate'] for s in sources]
-        interview_rates = [source_perf[s]['interview_rate'] for s in sources]
-        offer_rates = [source_perf[s]['offer_rate'] for s in sources]
-        
-        fig = go.Figure()
-        
-        fig.add_trace(go.Bar(
-            name='Response Rate',
-            x=sources,
-            y=response_rates,
-            marker_color='#3B82F6'
-        ))
-        
-        fig.add_trace(go.Bar(
-            name='Interview Rate',
-            x=sources,
-            y=interview_rates,
-            marker_color='#8B5CF6'
-        ))
-        
-        fig.add_trace(go.Bar(
-            name='Offer Rate',
-            x=sources,
-            y=offer_rates,
-            marker_color='#10B981'
-        ))
-        
-        fig.update_layout(
-            title='Source Performance Comparison',
-            xaxis_title='Application Source',
-            yaxis_title='Rate (%)',
-            barmode='group',
-            height=400
+        metrics = source_analysis['source_metrics']
+        
+        # One (n_sources, 3) array; each trace takes a column view
+        sources = metrics.index.astype(str).tolist()
+        rates = metrics[['response_rate', 'interview_rate', 'offer_rate']].to_numpy()
+        
+        fig = go.Figure(
+            data=[
+                go.Bar(name='Response Rate', x=sources, y=rates[:, 0], marker_color='#3B82F6'),
+                go.Bar(name='Interview Rate', x=sources, y=rates[:, 1], marker_color='#8B5CF6'),
+                go.Bar(name='Offer Rate', x=sources, y=rates[:, 2], marker_color='#10B981')
+            ],
+            layout=dict(
+                template=CHART_TEMPLATE,
+                title='Source Performance Comparison',
+                xaxis_title='Application Source',
+                yaxis_title='Rate (%)',
+                barmode='group'
+            )
         )
         
         return fig
@@ -622,13 +682,18 @@ class JobApplicationTracker:
         fig.update_yaxes(title_text="Response Rate (%)", secondary_y=True)
         
         fig.update_layout(
-            title='Industry Performance Analysis',
-            height=400
+            template=CHART_TEMPLATE,
+            title='Industry Performance Analysis'
         )
         
         return fig
     
     # Helper methods
+    def _bump_version(self):
+        """Invalidate the memoized DataFrame after a state mutation"""
+        tracker_state = st.session_state[self.session_key]
+        tracker_state['version'] = tracker_state.get('version', 0) + 1
+    
     def _update_analytics(self):
         """Update analytics cache"""
         # This would typically update cached analytics
@@ -636,34 +701,29 @@ class JobApplicationTracker:
     
     def _get_recent_activity(self, df: pd.DataFrame) -> List[Dict[str, str]]:
         """Get recent application activity"""
-        recent_df = df.sort_values('last_updated', ascending=False).head(5)
-        
-        activity = []
-        for _, app in recent_df.iterrows():
-            activity.append({
-                'company': app['company_name'],
-                'position': app['position_title'],
-                'status': self.pipeline_stages.get(ApplicationStatus(app['status']), {'label': app['status']})['label'],
-                'date': app['last_updated'].strftime('%Y-%m-%d') if isinstance(app['last_updated'], datetime) else str(app['last_updated'])
-            })
+        # Partial sort - only the five most recent rows are needed
+        recent = df.nlargest(5, 'last_updated')
         
-        return activity
+        activity = pd.DataFrame({
+            'company': recent['company_name'],
+            'position': recent['position_title'],
+            'status': [self._status_label.get(status, status) for status in recent['status']],
+            'date': recent['last_updated'].dt.strftime('%Y-%m-%d')
+        })
+        
+        return activity.to_dict('records')
     
     def _calculate_offer_premium(self, salary_df: pd.DataFrame) -> float:
         """Calculate salary premium for offers vs targets"""
         if salary_df.empty:
             return 0
         
-        offer_salaries = salary_df[salary_df['status'] == ApplicationStatus.OFFER_RECEIVED.value]['salary']
-        all_salaries = salary_df['salary']
-        
-        if len(offer_salaries) == 0:
-            return 0
-        
-        offer_avg = offer_salaries.mean()
-        target_avg = all_salaries.mean()
+        premium = _offer_premium(
+            salary_df['salary'].to_numpy(np.float64),
+            (salary_df['status'] == ApplicationStatus.OFFER_RECEIVED.value).to_numpy()
+        )
         
-        return round(((offer_avg - target_avg) / target_avg * 100), 1)
+        return round(float(premium), 1)
     
     def _analyze_timing_success(self, successful_apps: pd.DataFrame) -> Dict[str, Any]:
         """Analyze timing patterns in successful applications"""
@@ -678,16 +738,19 @@ class JobApplicationTracker:
             'day_distribution': day_success.to_dict()
         }
     
-    def _generate_source_recommendations(self, source_stats: Dict[str, Any]) -> List[str]:
-        """Generate recommendations based on source performance"""
+    def _generate_source_recommendations(self, rates_df: pd.DataFrame) -> List[str]:
+        """Generate recommendations based on per-source metrics (indexed by source)"""
         recommendations = []
         
+        if rates_df.empty:
+            return recommendations
+        
         # Find best performing source
-        best_source = max(source_stats.items(), key=lambda x: x[1]['effectiveness_score'])
-        recommendations.append(f"Focus more on {best_source[0]} - your most effective source")
+        best_source = rates_df['effectiveness_score'].idxmax()
+        recommendations.append(f"Focus more on {best_source} - your most effective source")
         
         # Find underperforming sources
-        poor_sources = [source for source, stats in source_stats.items() if stats['response_rate'] < 10]
+        poor_sources = rates_df.index[rates_df['response_rate'] < 10].astype(str).tolist()
         if poor_sources:
             recommendations.append(f"Consider reducing applications through: {', '.join(poor_sources)}")
         
@@ -707,4 +770,71 @@ class JobApplicationTracker:
         
         return recommendations
 
-import re  # Add this import at the top
\ No newline at end of file
+class LazyAnalytics(Mapping):
+    """
+    Read-only mapping of analytics sections that are computed on first access
+    """
+    
+    SECTIONS = (
+        'summary_stats', 'conversion_funnel', 'time_analysis', 'source_analysis',
+        'industry_analysis', 'salary_analysis', 'success_predictors', 'recommendations'
+    )
+    
+    def __init__(self, tracker: JobApplicationTracker, df: pd.DataFrame):
+        self._tracker = tracker
+        self._df = df
+    
+    @cached_property
+    def _shared(self) -> Dict[str, Any]:
+        return self._tracker._precompute(self._df)
+    
+    @cached_property
+    def summary_stats(self) -> Dict[str, Any]:
+        return self._tracker._calculate_summary_stats(self._df, self._shared)
+    
+    @cached_property
+    def conversion_funnel(self) -> Dict[str, Any]:
+        return self._tracker._calculate_conversion_funnel(self._df, self._shared)
+    
+    @cached_property
+    def time_analysis(self) -> Dict[str, Any]:
+        return self._tracker._analyze_application_timing(self._df)
+    
+    @cached_property
+    def source_analysis(self) -> Dict[str, Any]:
+        return self._tracker._analyze_application_sources(self._df)
+    
+    @cached_property
+    def industry_analysis(self) -> Dict[str, Any]:
+        return self._tracker._analyze_industry_performance(self._df)
+    
+    @cached_property
+    def salary_analysis(self) -> Dict[str, Any]:
+        return self._tracker._analyze_salary_trends(self._df)
+    
+    @cached_property
+    def success_predictors(self) -> Dict[str, Any]:
+        return self._tracker._identify_success_predictors(self._df, self._shared)
+    
+    @cached_property
+    def recommendations(self) -> List[Dict[str, str]]:
+        return self._tracker._generate_recommendations(self._df, self._shared)
+    
+    def __getitem__(self, key: str) -> Any:
+        if key not in self.SECTIONS:
+            raise KeyError(key)
+        return getattr(self, key)
+    
+    def __contains__(self, key: object) -> bool:
+        # Membership checks must not trigger computation
+        return key in self.SECTIONS
+    
+    def __iter__(self):
+        return iter(self.SECTIONS)
+    
+    def __len__(self) -> int:
+        return len(self.SECTIONS)
+    
+    def collect(self) -> Dict[str, Any]:
+        """Materialize every section into a plain dict"""
+        return {key: self[key] for key in self.SECTIONS}
@@ -5,15 +5,42 @@ import plotly.express as px
 from plotly.subplots import make_subplots
 from datetime import datetime, timedelta
 import json
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Callable, Tuple
+from functools import partial
+from operator import itemgetter
 import numpy as np
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, fields
 import hashlib
+import os
+import time
+from collections import deque
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+def _json_line(obj: Dict[str, Any]) -> bytes:
+    """One JSON Lines record as UTF-8 bytes, newline included"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_SERIALIZE_NUMPY)
+    return (json.dumps(obj) + '\n').encode('utf-8')
+
+# Both accept bytes and raise ValueError subclasses on malformed input
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+def _short_hash(text: str) -> str:
+    """
+    8-hex-char fingerprint used as a dedup key. Always blake2b, so the same text
+    gets the same key on every install and in persisted history
+    """
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=4).hexdigest()
 
 @dataclass
 class AnalysisRecord:
     """Data class for storing analysis records"""
-    timestamp: datetime
+    timestamp: int  # epoch nanoseconds (time.time_ns())
     resume_version: str
     job_description_hash: str
     industry: str
@@ -23,23 +50,137 @@ class AnalysisRecord:
     keyword_match_count: int
     skills_coverage: float
     optimization_suggestions: List[str]
-    user_actions_taken: List[str]
+    user_actions_taken: List[Tuple[str, int]]  # (action, epoch nanoseconds)
     session_id: str
 
+# Field names in declaration order; also the columns of the stored history
+_RECORD_FIELDS = tuple(f.name for f in fields(AnalysisRecord))
+
+NS_PER_DAY = 86_400_000_000_000
+
+# Local zone used when epoch timestamps are turned into datetimes for display
+_LOCAL_TZ = datetime.now().astimezone().tzinfo
+
+def _epoch_ns_to_local(values: pd.Series) -> pd.Series:
+    """Convert epoch-nanosecond integers to local, timezone-aware datetimes"""
+    return pd.to_datetime(values, unit='ns', utc=True).dt.tz_convert(_LOCAL_TZ)
+
+# Most recent analyses kept for the dashboard; lifetime totals live in running_stats
+ANALYSIS_HISTORY_LIMIT = 500
+
+# Optional directory of per-user JSON Lines files that carry analysis history across
+# sessions. History is only persisted for a known user: the id is passed in or set
+# under USER_ID_KEY in st.session_state by the deployment's sign-in
+HISTORY_DIR_ENV = 'SMARTATS_HISTORY_DIR'
+USER_ID_KEY = 'user_id'
+
+# A history file is rewritten down to the newest ANALYSIS_HISTORY_LIMIT records
+# once it holds this many, so it stays bounded without a rewrite per analysis
+HISTORY_FILE_MAX_RECORDS = 2 * ANALYSIS_HISTORY_LIMIT
+
+# Scalar columns the dashboard analyses read; list-valued fields are left out of the frame
+_FRAME_COLUMNS = ('timestamp', 'resume_version', 'industry', 'experience_level',
+                  'match_percentage', 'ats_score', 'keyword_match_count', 'skills_coverage')
+
+# Chart palette and shared trace styles (Plotly copies these, so sharing is safe)
+_BLUE = '#3B82F6'
+_GREEN = '#10B981'
+_AMBER = '#F59E0B'
+_PURPLE = '#8B5CF6'
+_RED = '#EF4444'
+_CYAN = '#06B6D4'
+
+_LINE_BLUE = {'color': _BLUE, 'width': 3}
+_LINE_GREEN = {'color': _GREEN, 'width': 3}
+_LINE_AMBER = {'color': _AMBER, 'width': 3}
+_LINE_PURPLE = {'color': _PURPLE, 'width': 3}
+_GAUGE_AXIS = {'range': [None, 100]}
+_BEST_SCORE_COLORS = (_AMBER, _CYAN)
+_EMPTY_MESSAGE_FONT = {'size': 16, 'color': 'gray'}
+
+# Base for placeholder charts; only the title and message vary per call
+_EMPTY_CHART_BASE = go.Figure(layout=dict(
+    height=300,
+    xaxis={'visible': False},
+    yaxis={'visible': False}
+))
+
+# Roadmap rules: (metric, threshold, target, area, priority, timeline)
+_ROADMAP_RULES = (
+    ('match_percentage', 80, 85, 'Keyword Optimization', 'High', '1-2 weeks'),
+    ('ats_score', 85, 90, 'ATS Compatibility', 'High', '1 week'),
+    ('keyword_match_count', 12, 15, 'Technical Skills', 'Medium', '2-3 weeks')
+)
+
+# Dashboard chart name -> (builder method, dashboard_data section), in display order
+_CHART_SPECS = {
+    'trends': ('_create_performance_trends_chart', 'trend_analysis'),
+    'metrics': ('_create_multi_metric_dashboard', 'summary_metrics'),
+    'goals': ('_create_goal_progress_chart', 'goal_progress'),
+    'versions': ('_create_version_comparison_chart', 'comparison_analysis'),
+    'industries': ('_create_industry_analysis_chart', 'industry_insights')
+}
+
+# Metrics with running (incrementally updated) aggregates
+_TRACKED_METRICS = ('match_percentage', 'ats_score', 'keyword_match_count')
+
+# Per-row field extractors for the chart builders (one dict walk per row)
+_GOAL_VALUES = itemgetter('current', 'target', 'progress_percentage')
+_METRIC_VALUES = itemgetter(*_TRACKED_METRICS)
+_SCATTER_VALUES = itemgetter('match_percentage', 'ats_score')
+
+def _running_std(stats: Dict[str, Any]) -> float:
+    """Sample standard deviation (ddof=1) from running sums; NaN below two samples"""
+    n = stats['n']
+    if n < 2:
+        return float('nan')
+    variance = (stats['sumsq'] - stats['sum'] ** 2 / n) / (n - 1)
+    return float(np.sqrt(max(0.0, variance)))
+
+def _running_slope(stats: Dict[str, Any]) -> float:
+    """Least-squares slope against the analysis index 0..n-1, from running sums"""
+    n = stats['n']
+    sum_x = n * (n - 1) / 2
+    sum_xx = (n - 1) * n * (2 * n - 1) / 6
+    denominator = n * sum_xx - sum_x ** 2
+    if denominator == 0:
+        return 0.0
+    return (n * stats['sum_xy'] - sum_x * stats['sum']) / denominator
+
 class PerformanceTracker:
     """
     Advanced performance tracking and analytics system
     """
     
-    def __init__(self):
+    def __init__(self, history_dir: Optional[str] = None, user_id: Optional[str] = None):
         self.session_key = 'performance_analytics'
+        self.history_path = self._history_file(
+            history_dir or os.getenv(HISTORY_DIR_ENV),
+            user_id or st.session_state.get(USER_ID_KEY)
+        )
         self._initialize_tracking()
     
+    @staticmethod
+    def _history_file(history_dir: Optional[str], user_id: Optional[str]) -> Optional[str]:
+        """
+        The user's own history file, or None (no persistence) without a directory or user.
+        The file is named by a hash of the id, so no id can address another path
+        """
+        if not history_dir or not user_id:
+            return None
+        file_name = hashlib.blake2b(str(user_id).encode('utf-8'), digest_size=16).hexdigest()
+        return os.path.join(history_dir, f"{file_name}.jsonl")
+    
     def _initialize_tracking(self):
         """Initialize tracking data structure"""
         if self.session_key not in st.session_state:
-            st.session_state[self.session_key] = {
-                'analysis_history': [],
+            tracking_data = st.session_state[self.session_key] = {
+                'analysis_history_cols': self._new_history_columns(),
+                'history_total': 0,
+                'history_version': 0,
+                'session_index': {},
+                'persisted_records': 0,
+                'running_stats': {},
                 'resume_versions': {},
                 'optimization_goals': [],
                 'benchmark_data': {},
@@ -49,6 +190,58 @@ class PerformanceTracker:
                     'tracking_enabled': True
                 }
             }
+            self._load_persisted_history(tracking_data)
+    
+    def _load_persisted_history(self, tracking_data: Dict[str, Any]):
+        """
+        Replay this user's analyses saved by earlier sessions into a fresh tracking state
+        """
+        if not self.history_path or not os.path.exists(self.history_path):
+            return
+        
+        try:
+            with open(self.history_path, 'rb') as history_file:
+                lines = list(history_file)
+        except OSError as e:
+            st.warning(f"Could not load analysis history: {e}")
+            return
+        
+        tracking_data['persisted_records'] = len(lines)
+        # Only the records the bounded history keeps are parsed
+        for line in lines[-ANALYSIS_HISTORY_LIMIT:]:
+            try:
+                record = AnalysisRecord(**_json_loads(line))
+            except (ValueError, TypeError):
+                continue  # skip truncated or foreign lines
+            self._append_record(tracking_data, record)
+    
+    def _persist_record(self, tracking_data: Dict[str, Any], record_fields: Dict[str, Any]):
+        """
+        Append one analysis to the user's history file, trimming the file once it
+        reaches HISTORY_FILE_MAX_RECORDS
+        """
+        try:
+            os.makedirs(os.path.dirname(self.history_path) or '.', exist_ok=True)
+            with open(self.history_path, 'ab') as history_file:
+                history_file.write(_json_line(record_fields))
+            tracking_data['persisted_records'] = tracking_data.get('persisted_records', 0) + 1
+            
+            if tracking_data['persisted_records'] >= HISTORY_FILE_MAX_RECORDS:
+                with open(self.history_path, 'rb') as history_file:
+                    kept = deque(history_file, maxlen=ANALYSIS_HISTORY_LIMIT)
+                # Write aside and swap in, so a failed rewrite never truncates the history
+                trimmed_path = f"{self.history_path}.tmp"
+                with open(trimmed_path, 'wb') as trimmed_file:
+                    trimmed_file.writelines(kept)
+                os.replace(trimmed_path, self.history_path)
+                tracking_data['persisted_records'] = len(kept)
+        except OSError as e:
+            st.warning(f"Could not save analysis history: {e}")
+    
+    @staticmethod
+    def _new_history_columns() -> Dict[str, deque]:
+        """Columnar analysis history: one bounded deque per record field, kept in step"""
+        return {name: deque(maxlen=ANALYSIS_HISTORY_LIMIT) for name in _RECORD_FIELDS}
     
     def record_analysis(self, analysis_result: Dict[str, Any], 
                        resume_text: str, job_description: str,
@@ -57,13 +250,13 @@ class PerformanceTracker:
         Record an analysis session for tracking
         """
         # Generate unique identifiers
-        resume_hash = hashlib.md5(resume_text.encode()).hexdigest()[:8]
-        jd_hash = hashlib.md5(job_description.encode()).hexdigest()[:8]
+        resume_hash = self._cached_hash('resume', resume_text)
+        jd_hash = self._cached_hash('job_description', job_description)
         session_id = f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{resume_hash}"
         
         # Create analysis record
         record = AnalysisRecord(
-            timestamp=datetime.now(),
+            timestamp=time.time_ns(),
             resume_version=resume_hash,
             job_description_hash=jd_hash,
             industry=industry,
@@ -72,129 +265,225 @@ class PerformanceTracker:
             ats_score=analysis_result.get('ats_compatibility_score', 0),
             keyword_match_count=len(analysis_result.get('matched_keywords', [])),
             skills_coverage=analysis_result.get('skills_coverage', 0),
-            optimization_suggestions=analysis_result.get('critical_improvements', []),
+            optimization_suggestions=list(analysis_result.get('critical_improvements', [])),
             user_actions_taken=[],
             session_id=session_id
         )
         
         # Store in session state
         tracking_data = st.session_state[self.session_key]
-        tracking_data['analysis_history'].append(asdict(record))
+        self._append_record(tracking_data, record)
         
-        # Store resume version
-        tracking_data['resume_versions'][resume_hash] = {
+        if self.history_path and tracking_data['user_preferences'].get('tracking_enabled', True):
+            self._persist_record(tracking_data, {name: getattr(record, name) for name in _RECORD_FIELDS})
+        
+        # Store resume version - a re-analyzed resume only bumps its count
+        resume_versions = tracking_data['resume_versions']
+        version_entry = resume_versions.get(resume_hash)
+        if version_entry is not None:
+            version_entry['analysis_count'] += 1
+            return session_id
+        
+        resume_versions[resume_hash] = {
             'content': resume_text[:500] + "..." if len(resume_text) > 500 else resume_text,
-            'first_analyzed': datetime.now().isoformat(),
-            'version_name': f"Version {len(tracking_data['resume_versions']) + 1}",
+            'first_analyzed': record.timestamp,  # epoch ns; format only for display
+            'version_name': f"Version {len(resume_versions) + 1}",
             'analysis_count': 1
         }
         
         return session_id
     
+    def _append_record(self, tracking_data: Dict[str, Any], record: AnalysisRecord):
+        """
+        Add one record to the bounded history columns, index and running stats
+        """
+        history = tracking_data['analysis_history_cols']
+        session_index = tracking_data.setdefault('session_index', {})
+        position = tracking_data.get('history_total', 0)
+        session_ids = history['session_id']
+        
+        # The ring buffers are about to drop their oldest record - forget its index entry
+        if len(session_ids) == session_ids.maxlen:
+            evicted_id = session_ids[0]
+            if session_index.get(evicted_id) == position - len(session_ids):
+                del session_index[evicted_id]
+        
+        # Append field by field so every column stays the same length
+        for name in _RECORD_FIELDS:
+            history[name].append(getattr(record, name))
+        tracking_data['history_total'] = position + 1
+        
+        # Index by absolute position; first record wins on a repeated session_id
+        session_index.setdefault(record.session_id, position)
+        tracking_data['history_version'] = tracking_data.get('history_version', 0) + 1
+        self._update_running_stats(tracking_data.setdefault('running_stats', {}), record)
+    
+    def _update_running_stats(self, running_stats: Dict[str, Any], record: AnalysisRecord):
+        """
+        Fold one record into the per-metric running aggregates in O(1)
+        """
+        for metric in _TRACKED_METRICS:
+            value = getattr(record, metric)
+            stats = running_stats.get(metric)
+            if stats is None:
+                stats = running_stats[metric] = {
+                    'n': 0, 'sum': 0, 'sumsq': 0, 'sum_xy': 0,
+                    'max': value, 'first': value, 'last': value
+                }
+            
+            # x is the 0-based analysis index, as used for the trend slopes
+            x = stats['n']
+            stats['n'] = x + 1
+            stats['sum'] += value
+            stats['sumsq'] += value * value
+            stats['sum_xy'] += x * value
+            stats['max'] = max(stats['max'], value)
+            stats['last'] = value
+    
+    def _cached_hash(self, slot: str, text: str) -> str:
+        """
+        Return the short hash of text, reusing the last result for this slot
+        when the same text is analyzed again
+        """
+        hash_cache = st.session_state.setdefault('_hash_cache', {})
+        cached = hash_cache.get(slot)
+        
+        # Identity check is O(1); equality falls back to a memcmp, still far cheaper than hashing
+        if cached is not None and (cached[0] is text or cached[0] == text):
+            return cached[1]
+        
+        text_hash = _short_hash(text)
+        hash_cache[slot] = (text, text_hash)
+        return text_hash
+    
     def record_user_action(self, session_id: str, action: str):
         """
         Record user actions taken after analysis
         """
         tracking_data = st.session_state[self.session_key]
         
-        for record in tracking_data['analysis_history']:
-            if record['session_id'] == session_id:
-                record['user_actions_taken'].append({
-                    'action': action,
-                    'timestamp': datetime.now().isoformat()
-                })
-                break
+        actions = tracking_data['analysis_history_cols']['user_actions_taken']
+        position = tracking_data.get('session_index', {}).get(session_id)
+        if position is None:
+            return
+        
+        # Translate the absolute position into an offset within the ring buffers
+        offset = position - (tracking_data.get('history_total', 0) - len(actions))
+        if 0 <= offset < len(actions):
+            actions[offset].append((action, time.time_ns()))
     
     def get_performance_dashboard_data(self) -> Dict[str, Any]:
         """
         Get comprehensive dashboard data
         """
         tracking_data = st.session_state[self.session_key]
-        history = tracking_data['analysis_history']
+        history = tracking_data['analysis_history_cols']
         
-        if not history:
+        if not history['session_id']:
             return self._get_empty_dashboard_data()
         
-        df = pd.DataFrame(history)
-        df['timestamp'] = pd.to_datetime(df['timestamp'])
+        # Reuse the previous result until a new analysis is recorded
+        version = tracking_data.get('history_version', 0)
+        cached = tracking_data.get('dashboard_cache')
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        
+        # Columns are already homogeneous, so no per-row dtype inference
+        df = pd.DataFrame({name: history[name] for name in _FRAME_COLUMNS}, copy=False)
+        
+        # Shared inputs derived once and handed to the helpers
+        running_stats = tracking_data['running_stats']
+        latest = df.iloc[-1].to_dict()
+        velocity = self._calculate_optimization_velocity(df)
+        version_industry_stats = self._aggregate_by_version_and_industry(df)
         
         # Calculate key metrics
         dashboard_data = {
-            'summary_metrics': self._calculate_summary_metrics(df),
-            'trend_analysis': self._analyze_trends(df),
-            'goal_progress': self._track_goal_progress(df),
-            'comparison_analysis': self._analyze_version_comparisons(df),
-            'industry_insights': self._analyze_industry_performance(df),
+            'summary_metrics': self._calculate_summary_metrics(df, running_stats, velocity),
+            'trend_analysis': self._analyze_trends(df, running_stats),
+            'goal_progress': self._track_goal_progress(latest),
+            'comparison_analysis': self._analyze_version_comparisons(version_industry_stats),
+            'industry_insights': self._analyze_industry_performance(version_industry_stats),
             'recommendation_effectiveness': self._analyze_recommendation_effectiveness(df),
-            'optimization_roadmap': self._generate_optimization_roadmap(df)
+            'optimization_roadmap': self._generate_optimization_roadmap(latest, velocity)
         }
         
+        tracking_data['dashboard_cache'] = (version, dashboard_data)
         return dashboard_data
     
     def create_performance_dashboard(self) -> List[go.Figure]:
         """
         Create comprehensive performance dashboard
         """
-        dashboard_data = self.get_performance_dashboard_data()
-        figures = []
-        
-        # 1. Performance Trends Over Time
-        figures.append(self._create_performance_trends_chart(dashboard_data['trend_analysis']))
-        
-        # 2. Multi-metric Comparison
-        figures.append(self._create_multi_metric_dashboard(dashboard_data['summary_metrics']))
-        
-        # 3. Goal Progress Tracking
-        figures.append(self._create_goal_progress_chart(dashboard_data['goal_progress']))
+        # Trends, metrics, goals, version comparison, industry analysis
+        return [build() for build in self.get_dashboard_charts().values()]
+    
+    def get_dashboard_charts(self) -> Dict[str, Callable[[], go.Figure]]:
+        """
+        Lazy dashboard chart builders keyed by name - call only the one being shown
+        """
+        return {name: partial(self._build_dashboard_chart, name) for name in _CHART_SPECS}
+    
+    def _build_dashboard_chart(self, name: str) -> go.Figure:
+        """
+        Build one dashboard chart, reusing it until a new analysis is recorded
+        """
+        tracking_data = st.session_state[self.session_key]
+        version = tracking_data.get('history_version', 0)
         
-        # 4. Resume Version Comparison
-        figures.append(self._create_version_comparison_chart(dashboard_data['comparison_analysis']))
+        figure_cache = tracking_data.get('figure_cache')
+        if figure_cache is None or figure_cache['version'] != version:
+            figure_cache = tracking_data['figure_cache'] = {'version': version, 'figures': {}}
         
-        # 5. Industry Performance Analysis
-        figures.append(self._create_industry_analysis_chart(dashboard_data['industry_insights']))
+        fig = figure_cache['figures'].get(name)
+        if fig is None:
+            builder, section = _CHART_SPECS[name]
+            fig = getattr(self, builder)(self.get_performance_dashboard_data()[section])
+            figure_cache['figures'][name] = fig
         
-        return figures
+        return fig
     
-    def _calculate_summary_metrics(self, df: pd.DataFrame) -> Dict[str, Any]:
+    def _calculate_summary_metrics(self, df: pd.DataFrame, running_stats: Dict[str, Any],
+                                   velocity: float) -> Dict[str, Any]:
         """
-        Calculate summary performance metrics
+        Calculate summary performance metrics from the running aggregates
         """
-        if df.empty:
+        if df.empty or not running_stats:
             return {}
         
-        latest_analysis = df.iloc[-1]
-        first_analysis = df.iloc[0]
+        match_stats = running_stats['match_percentage']
+        ats_stats = running_stats['ats_score']
+        keyword_stats = running_stats['keyword_match_count']
         
         # Calculate improvements
-        match_improvement = latest_analysis['match_percentage'] - first_analysis['match_percentage']
-        ats_improvement = latest_analysis['ats_score'] - first_analysis['ats_score']
-        keyword_improvement = latest_analysis['keyword_match_count'] - first_analysis['keyword_match_count']
+        match_improvement = match_stats['last'] - match_stats['first']
+        ats_improvement = ats_stats['last'] - ats_stats['first']
+        keyword_improvement = keyword_stats['last'] - keyword_stats['first']
         
         return {
-            'total_analyses': len(df),
-            'current_match_score': latest_analysis['match_percentage'],
-            'current_ats_score': latest_analysis['ats_score'],
+            'total_analyses': match_stats['n'],
+            'current_match_score': match_stats['last'],
+            'current_ats_score': ats_stats['last'],
             'match_improvement': match_improvement,
             'ats_improvement': ats_improvement,
             'keyword_improvement': keyword_improvement,
-            'best_match_score': df['match_percentage'].max(),
-            'avg_match_score': df['match_percentage'].mean(),
-            'consistency_score': 100 - df['match_percentage'].std(),  # Lower std = higher consistency
-            'optimization_velocity': self._calculate_optimization_velocity(df)
+            'best_match_score': match_stats['max'],
+            'avg_match_score': match_stats['sum'] / match_stats['n'],
+            'consistency_score': 100 - _running_std(match_stats),  # Lower std = higher consistency
+            'optimization_velocity': velocity
         }
     
-    def _analyze_trends(self, df: pd.DataFrame) -> Dict[str, Any]:
+    def _analyze_trends(self, df: pd.DataFrame, running_stats: Dict[str, Any]) -> Dict[str, Any]:
         """
         Analyze performance trends over time
         """
-        if len(df) < 2:
+        if len(df) < 2 or running_stats.get('match_percentage', {}).get('n', 0) < 2:
             return {'trend_direction': 'insufficient_data'}
         
-        # Calculate trend slopes
-        x = np.arange(len(df))
-        match_slope = np.polyfit(x, df['match_percentage'], 1)[0]
-        ats_slope = np.polyfit(x, df['ats_score'], 1)[0]
-        keyword_slope = np.polyfit(x, df['keyword_match_count'], 1)[0]
+        # Closed-form least-squares slopes from the running sums
+        match_slope = _running_slope(running_stats['match_percentage'])
+        ats_slope = _running_slope(running_stats['ats_score'])
+        keyword_slope = _running_slope(running_stats['keyword_match_count'])
         
         return {
             'match_trend': 'improving' if match_slope > 0 else 'declining' if match_slope < 0 else 'stable',
@@ -203,10 +492,12 @@ class PerformanceTracker:
             'match_slope': match_slope,
             'ats_slope': ats_slope,
             'keyword_slope': keyword_slope,
-            'trend_data': df[['timestamp', 'match_percentage', 'ats_score', 'keyword_match_count']].to_dict('records')
+            'trend_data': df[['match_percentage', 'ats_score', 'keyword_match_count']].assign(
+                timestamp=_epoch_ns_to_local(df['timestamp'])
+            ).to_dict('records')
         }
     
-    def _track_goal_progress(self, df: pd.DataFrame) -> Dict[str, Any]:
+    def _track_goal_progress(self, latest: Dict[str, Any]) -> Dict[str, Any]:
         """
         Track progress towards optimization goals
         """
@@ -218,10 +509,9 @@ class PerformanceTracker:
             'skills_coverage': 80
         }
         
-        if df.empty:
+        if not latest:
             return {'goals': goals, 'progress': {}}
         
-        latest = df.iloc[-1]
         progress = {}
         
         for metric, target in goals.items():
@@ -240,19 +530,59 @@ class PerformanceTracker:
             'overall_goal_achievement': sum(1 for p in progress.values() if p['achieved']) / len(progress) * 100
         }
     
-    def _analyze_version_comparisons(self, df: pd.DataFrame) -> Dict[str, Any]:
+    def _aggregate_by_version_and_industry(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Single (resume_version, industry) groupby pass; version and industry
+        statistics are both rolled up from these partial sums
+        """
+        return df.groupby(['resume_version', 'industry']).agg(
+            match_sum=('match_percentage', 'sum'),
+            match_max=('match_percentage', 'max'),
+            count=('match_percentage', 'count'),
+            ats_sum=('ats_score', 'sum'),
+            keyword_sum=('keyword_match_count', 'sum'),
+            last_analyzed=('timestamp', 'max')
+        )
+    
+    def _rollup_means(self, partials: pd.DataFrame, level: str) -> pd.DataFrame:
+        """
+        Collapse the partial sums to one level and turn them into means
+        """
+        totals = partials.groupby(level=level).agg(
+            match_sum=('match_sum', 'sum'),
+            match_max=('match_max', 'max'),
+            count=('count', 'sum'),
+            ats_sum=('ats_sum', 'sum'),
+            keyword_sum=('keyword_sum', 'sum'),
+            last_analyzed=('last_analyzed', 'max')
+        )
+        
+        return pd.DataFrame({
+            'match_percentage': totals['match_sum'] / totals['count'],
+            'match_max': totals['match_max'],
+            'count': totals['count'],
+            'ats_score': totals['ats_sum'] / totals['count'],
+            'keyword_match_count': totals['keyword_sum'] / totals['count'],
+            'last_analyzed': totals['last_analyzed']
+        })
+    
+    def _analyze_version_comparisons(self, version_industry_stats: pd.DataFrame) -> Dict[str, Any]:
         """
         Analyze performance across different resume versions
         """
-        if df.empty:
+        if version_industry_stats.empty:
             return {}
         
-        version_stats = df.groupby('resume_version').agg({
-            'match_percentage': ['mean', 'max', 'count'],
-            'ats_score': 'mean',
-            'keyword_match_count': 'mean',
-            'timestamp': 'max'
-        }).round(2)
+        version_means = self._rollup_means(version_industry_stats, 'resume_version')
+        
+        version_stats = pd.DataFrame({
+            ('match_percentage', 'mean'): version_means['match_percentage'].round(2),
+            ('match_percentage', 'max'): version_means['match_max'].round(2),
+            ('match_percentage', 'count'): version_means['count'],
+            ('ats_score', 'mean'): version_means['ats_score'].round(2),
+            ('keyword_match_count', 'mean'): version_means['keyword_match_count'].round(2),
+            ('timestamp', 'max'): _epoch_ns_to_local(version_means['last_analyzed'])
+        })
         
         # Find best performing version
         best_version = version_stats['match_percentage']['mean'].idxmax()
@@ -261,23 +591,21 @@ class PerformanceTracker:
             'version_stats': version_stats.to_dict(),
             'best_version': best_version,
             'version_count': len(version_stats),
-            'version_comparison_data': df.groupby('resume_version')[
+            'version_comparison_data': version_means[
                 ['match_percentage', 'ats_score', 'keyword_match_count']
-            ].mean().to_dict('index')
+            ].to_dict('index')
         }
     
-    def _analyze_industry_performance(self, df: pd.DataFrame) -> Dict[str, Any]:
+    def _analyze_industry_performance(self, version_industry_stats: pd.DataFrame) -> Dict[str, Any]:
         """
         Analyze performance across different industries
         """
-        if df.empty:
+        if version_industry_stats.empty:
             return {}
         
-        industry_stats = df.groupby('industry').agg({
-            'match_percentage': 'mean',
-            'ats_score': 'mean',
-            'keyword_match_count': 'mean'
-        }).round(2)
+        industry_stats = self._rollup_means(version_industry_stats, 'industry')[
+            ['match_percentage', 'ats_score', 'keyword_match_count']
+        ].round(2)
         
         return {
             'industry_performance': industry_stats.to_dict('index'),
@@ -292,66 +620,41 @@ class PerformanceTracker:
         if len(df) < 2:
             return {'effectiveness': 'insufficient_data'}
         
-        # Track improvements after recommendations
-        improvements = []
-        for i in range(1, len(df)):
-            prev_score = df.iloc[i-1]['match_percentage']
-            curr_score = df.iloc[i]['match_percentage']
-            improvement = curr_score - prev_score
-            improvements.append(improvement)
-        
-        avg_improvement = np.mean(improvements) if improvements else 0
+        # Track improvements after recommendations (consecutive score deltas)
+        improvements = np.diff(df['match_percentage'].to_numpy(dtype=np.float64))
+        improved = improvements > 0
         
         return {
-            'avg_improvement_per_iteration': avg_improvement,
-            'total_improvements': sum(1 for imp in improvements if imp > 0),
-            'recommendation_success_rate': (sum(1 for imp in improvements if imp > 0) / len(improvements)) * 100 if improvements else 0,
-            'max_single_improvement': max(improvements) if improvements else 0
+            'avg_improvement_per_iteration': float(improvements.mean()),
+            'total_improvements': int(improved.sum()),
+            'recommendation_success_rate': float(improved.mean() * 100),
+            'max_single_improvement': float(improvements.max())
         }
     
-    def _generate_optimization_roadmap(self, df: pd.DataFrame) -> Dict[str, Any]:
+    def _generate_optimization_roadmap(self, latest: Dict[str, Any], velocity: float) -> Dict[str, Any]:
         """
         Generate future optimization roadmap based on historical data
         """
-        if df.empty:
+        if not latest:
             return {}
         
-        latest = df.iloc[-1]
-        
         # Identify areas needing improvement
-        improvement_areas = []
-        
-        if latest['match_percentage'] < 80:
-            improvement_areas.append({
-                'area': 'Keyword Optimization',
-                'current_score': latest['match_percentage'],
-                'target_score': 85,
-                'priority': 'High',
-                'estimated_timeline': '1-2 weeks'
-            })
-        
-        if latest['ats_score'] < 85:
-            improvement_areas.append({
-                'area': 'ATS Compatibility',
-                'current_score': latest['ats_score'],
-                'target_score': 90,
-                'priority': 'High',
-                'estimated_timeline': '1 week'
-            })
-        
-        if latest['keyword_match_count'] < 12:
-            improvement_areas.append({
-                'area': 'Technical Skills',
-                'current_score': latest['keyword_match_count'],
-                'target_score': 15,
-                'priority': 'Medium',
-                'estimated_timeline': '2-3 weeks'
-            })
+        improvement_areas = [
+            {
+                'area': area,
+                'current_score': latest[metric],
+                'target_score': target,
+                'priority': priority,
+                'estimated_timeline': timeline
+            }
+            for metric, threshold, target, area, priority, timeline in _ROADMAP_RULES
+            if latest[metric] < threshold
+        ]
         
         return {
             'improvement_areas': improvement_areas,
             'next_milestone': self._calculate_next_milestone(latest),
-            'projected_timeline': self._calculate_projected_timeline(df)
+            'projected_timeline': self._calculate_projected_timeline(latest, velocity)
         }
     
     def _create_performance_trends_chart(self, trend_data: Dict[str, Any]) -> go.Figure:
@@ -376,7 +679,7 @@ class PerformanceTracker:
         fig.add_trace(
             go.Scatter(x=df['timestamp'], y=df['match_percentage'],
                       mode='lines+markers', name='Match %',
-                      line=dict(color='#3B82F6', width=3)),
+                      line=_LINE_BLUE),
             row=1, col=1
         )
         
@@ -384,7 +687,7 @@ class PerformanceTracker:
         fig.add_trace(
             go.Scatter(x=df['timestamp'], y=df['ats_score'],
                       mode='lines+markers', name='ATS Score',
-                      line=dict(color='#10B981', width=3)),
+                      line=_LINE_GREEN),
             row=1, col=2
         )
         
@@ -392,7 +695,7 @@ class PerformanceTracker:
         fig.add_trace(
             go.Scatter(x=df['timestamp'], y=df['keyword_match_count'],
                       mode='lines+markers', name='Keywords',
-                      line=dict(color='#F59E0B', width=3)),
+                      line=_LINE_AMBER),
             row=2, col=1
         )
         
@@ -401,7 +704,7 @@ class PerformanceTracker:
         fig.add_trace(
             go.Scatter(x=df['timestamp'], y=overall_score,
                       mode='lines+markers', name='Overall',
-                      line=dict(color='#8B5CF6', width=3)),
+                      line=_LINE_PURPLE),
             row=2, col=2
         )
         
@@ -434,8 +737,7 @@ class PerformanceTracker:
                 mode="gauge+number",
                 value=summary_metrics.get('current_match_score', 0),
                 title={'text': "Match Score"},
-                gauge={'axis': {'range': [None, 100]},
-                       'bar': {'color': "#3B82F6"}},
+                gauge={'axis': _GAUGE_AXIS, 'bar': {'color': _BLUE}},
                 domain={'x': [0, 1], 'y': [0, 1]}
             ),
             row=1, col=1
@@ -449,7 +751,7 @@ class PerformanceTracker:
         ]
         fig.add_trace(
             go.Bar(x=['Match', 'ATS', 'Keywords'], y=improvements,
-                   marker_color=['#10B981' if x > 0 else '#EF4444' for x in improvements]),
+                   marker_color=np.where(np.asarray(improvements) > 0, _GREEN, _RED).tolist()),
             row=1, col=2
         )
         
@@ -459,8 +761,7 @@ class PerformanceTracker:
                 mode="gauge+number",
                 value=summary_metrics.get('consistency_score', 0),
                 title={'text': "Consistency"},
-                gauge={'axis': {'range': [None, 100]},
-                       'bar': {'color': "#8B5CF6"}},
+                gauge={'axis': _GAUGE_AXIS, 'bar': {'color': _PURPLE}},
                 domain={'x': [0, 1], 'y': [0, 1]}
             ),
             row=1, col=3
@@ -484,7 +785,7 @@ class PerformanceTracker:
         ]
         fig.add_trace(
             go.Bar(x=['Best Match', 'Current ATS'], y=best_scores,
-                   marker_color=['#F59E0B', '#06B6D4']),
+                   marker_color=_BEST_SCORE_COLORS),
             row=2, col=2
         )
         
@@ -518,9 +819,9 @@ class PerformanceTracker:
         progress = goal_data['progress']
         
         metrics = list(progress.keys())
-        current_values = [progress[m]['current'] for m in metrics]
-        target_values = [progress[m]['target'] for m in metrics]
-        progress_percentages = [progress[m]['progress_percentage'] for m in metrics]
+        current_values, target_values, progress_percentages = zip(
+            *map(_GOAL_VALUES, progress.values())
+        )
         
         fig = go.Figure()
         
@@ -529,7 +830,7 @@ class PerformanceTracker:
             name='Current',
             x=metrics,
             y=current_values,
-            marker_color='#3B82F6'
+            marker_color=_BLUE
         ))
         
         # Target values
@@ -537,7 +838,7 @@ class PerformanceTracker:
             name='Target',
             x=metrics,
             y=target_values,
-            marker_color='#10B981',
+            marker_color=_GREEN,
             opacity=0.6
         ))
         
@@ -561,9 +862,7 @@ class PerformanceTracker:
         data = comparison_data['version_comparison_data']
         versions = list(data.keys())
         
-        match_scores = [data[v]['match_percentage'] for v in versions]
-        ats_scores = [data[v]['ats_score'] for v in versions]
-        keyword_counts = [data[v]['keyword_match_count'] for v in versions]
+        match_scores, ats_scores, keyword_counts = zip(*map(_METRIC_VALUES, data.values()))
         
         fig = go.Figure()
         
@@ -571,21 +870,21 @@ class PerformanceTracker:
             name='Match %',
             x=versions,
             y=match_scores,
-            marker_color='#3B82F6'
+            marker_color=_BLUE
         ))
         
         fig.add_trace(go.Bar(
             name='ATS Score',
             x=versions,
             y=ats_scores,
-            marker_color='#10B981'
+            marker_color=_GREEN
         ))
         
         fig.add_trace(go.Bar(
             name='Keywords',
             x=versions,
             y=keyword_counts,
-            marker_color='#F59E0B'
+            marker_color=_AMBER
         ))
         
         fig.update_layout(
@@ -608,8 +907,7 @@ class PerformanceTracker:
         data = industry_data['industry_performance']
         industries = list(data.keys())
         
-        match_scores = [data[ind]['match_percentage'] for ind in industries]
-        ats_scores = [data[ind]['ats_score'] for ind in industries]
+        match_scores, ats_scores = zip(*map(_SCATTER_VALUES, data.values()))
         
         fig = go.Figure()
         
@@ -619,7 +917,7 @@ class PerformanceTracker:
             mode='markers+text',
             text=industries,
             textposition='top center',
-            marker=dict(size=12, color='#3B82F6'),
+            marker=dict(size=12, color=_BLUE),
             name='Industries'
         ))
         
@@ -636,19 +934,14 @@ class PerformanceTracker:
         """
         Create empty chart with message
         """
-        fig = go.Figure()
+        fig = go.Figure(_EMPTY_CHART_BASE)
+        fig.layout.title.text = title
         fig.add_annotation(
             text=message,
             xref="paper", yref="paper",
             x=0.5, y=0.5,
             showarrow=False,
-            font=dict(size=16, color="gray")
-        )
-        fig.update_layout(
-            title=title,
-            height=300,
-            xaxis={'visible': False},
-            yaxis={'visible': False}
+            font=_EMPTY_MESSAGE_FONT
         )
         return fig
     
@@ -659,8 +952,11 @@ class PerformanceTracker:
         if len(df) < 2:
             return 0
         
-        time_diff = (df.iloc[-1]['timestamp'] - df.iloc[0]['timestamp']).days
-        score_diff = df.iloc[-1]['match_percentage'] - df.iloc[0]['match_percentage']
+        # Scalar reads from the two columns - no per-row Series materialization
+        timestamps = df['timestamp']
+        scores = df['match_percentage']
+        time_diff = (timestamps.iat[-1] - timestamps.iat[0]) // NS_PER_DAY  # whole days
+        score_diff = scores.iat[-1] - scores.iat[0]
         
         if time_diff == 0:
             return 0
@@ -682,16 +978,14 @@ class PerformanceTracker:
         else:
             return {'target': 95, 'label': 'Perfect Match', 'points_needed': 95 - current_score}
     
-    def _calculate_projected_timeline(self, df: pd.DataFrame) -> str:
+    def _calculate_projected_timeline(self, latest_record: Dict[str, Any], velocity: float) -> str:
         """
         Calculate projected timeline to reach goals
         """
-        velocity = self._calculate_optimization_velocity(df)
-        
         if velocity <= 0:
             return "Unable to project - inconsistent progress"
         
-        latest_score = df.iloc[-1]['match_percentage']
+        latest_score = latest_record['match_percentage']
         target_score = 85  # Default target
         
         points_needed = target_score - latest_score
@@ -1,15 +1,27 @@
-from dotenv import load_dotenv
-load_dotenv()
+from __future__ import annotations
 
+from dotenv import load_dotenv
 import streamlit as st
 import os
+import re
+import sys
+import importlib
+import importlib.util
 from datetime import datetime
 import json
 import time
-import plotly.graph_objects as go
-import plotly.express as px
-from typing import Dict, List, Any
-import pandas as pd
+import logging
+import copy
+import hashlib
+import io
+import threading
+from collections import OrderedDict
+from itertools import chain, islice
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import TYPE_CHECKING, Dict, List, Any, Optional, Tuple
+
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
 
 # Import from first project (reliable components)
 try:
@@ -25,77 +37,339 @@ except ImportError as e:
     st.error(f"Core components not available: {e}")
     CORE_COMPONENTS_AVAILABLE = False
 
-# Import analytics tracking modules with correct paths
-try:
-    from analytics_tracking.performance_dashboard import PerformanceTracker, GoalSettingEngine
-    PERFORMANCE_TRACKING_AVAILABLE = True
-except ImportError:
-    PERFORMANCE_TRACKING_AVAILABLE = False
-    print("Performance tracking not available - create analytics_tracking/performance_dashboard.py")
+logger = logging.getLogger(__name__)
 
-try:
-    from analytics_tracking.job_application_tracker import JobApplicationTracker, JobApplication, ApplicationStatus
-    JOB_TRACKING_AVAILABLE = True
-except ImportError:
-    JOB_TRACKING_AVAILABLE = False
-    print("Job application tracking not available - create analytics_tracking/job_application_tracker.py")
+# Optional subsystems, imported on first use instead of at script start so reruns
+# that never reach a feature skip its import cost. Each feature lists the modules
+# it needs and the message logged (at debug level) when they are missing
+OPTIONAL_FEATURES = {
+    'performance_tracking': (
+        ('analytics_tracking.performance_dashboard',),
+        "Performance tracking not available - create analytics_tracking/performance_dashboard.py"
+    ),
+    'job_tracking': (
+        ('analytics_tracking.job_application_tracker',),
+        "Job application tracking not available - create analytics_tracking/job_application_tracker.py"
+    ),
+    'enhanced_analyzer': (
+        ('core_engine.enhanced_gemini_analyzer',),
+        "Enhanced analyzer not available - using standard analyzer"
+    ),
+    'advanced_visualizations': (
+        ('core_engine.advanced_visualizations',),
+        "Advanced visualizations not available - using standard charts"
+    ),
+    'enhanced_integration': (
+        ('core_engine.enhanced_app_integration',),
+        "Enhanced integration not available - using standard features"
+    ),
+    'smart_components': (
+        ('smart_components.ai_cover_letter_generator',
+         'smart_components.intelligent_resume_builder',
+         'smart_components.job_market_scanner'),
+        "Smart components not available"
+    ),
+    'intelligence_modules': (
+        ('intelligence_modules.career_simulator',
+         'intelligence_modules.interview_preparation_engine',
+         'intelligence_modules.market_intelligence_engine',
+         'intelligence_modules.personal_brand_builder'),
+        "Intelligence modules not available"
+    ),
+}
 
-# Import enhanced core engine modules
-try:
-    from core_engine.enhanced_gemini_analyzer import EnhancedGeminiAnalyzer
-    ENHANCED_ANALYZER_AVAILABLE = True
-except ImportError:
-    ENHANCED_ANALYZER_AVAILABLE = False
-    print("Enhanced analyzer not available - using standard analyzer")
+def _lazy(name: str):
+    """Module by dotted name, imported on the first call and read from sys.modules after that"""
+    module = sys.modules.get(name)
+    if module is None:
+        module = importlib.import_module(name)
+    return module
 
-try:
-    from core_engine.advanced_visualizations import AdvancedVisualizationEngine
-    ADVANCED_VISUALIZATIONS_AVAILABLE = True
-except ImportError:
-    ADVANCED_VISUALIZATIONS_AVAILABLE = False
-    print("Advanced visualizations not available - using standard charts")
+@st.cache_resource(show_spinner=False)
+def feature_available(feature: str) -> bool:
+    """
+    Whether an optional feature's modules are installed - checked once per server
+    process by locating them, without importing (or half-importing) anything
+    """
+    module_names, unavailable_message = OPTIONAL_FEATURES[feature]
+    if all(importlib.util.find_spec(name) is not None for name in module_names):
+        return True
+    logger.debug("%s (missing one of: %s)", unavailable_message, ", ".join(module_names))
+    return False
 
-try:
-    from core_engine.enhanced_app_integration import FeatureManager, EnhancedAnalysisIntegration
-    ENHANCED_INTEGRATION_AVAILABLE = True
-except ImportError:
-    ENHANCED_INTEGRATION_AVAILABLE = False
-    print("Enhanced integration not available - using standard features")
+# Brand personality per archetype for the fallback brand strategy. Shared by every
+# call, so results reference it directly and it must never be mutated
+BRAND_ARCHETYPES = {
+    'expert': {
+        'traits': ['authoritative', 'knowledgeable', 'reliable'],
+        'tone': 'professional and informative',
+        'content_style': 'data-driven insights and analysis'
+    },
+    'mentor': {
+        'traits': ['helpful', 'experienced', 'supportive'],
+        'tone': 'encouraging and educational',
+        'content_style': 'guidance and knowledge sharing'
+    },
+    'innovator': {
+        'traits': ['creative', 'forward-thinking', 'experimental'],
+        'tone': 'exciting and visionary',
+        'content_style': 'cutting-edge trends and possibilities'
+    },
+    'connector': {
+        'traits': ['collaborative', 'sociable', 'generous'],
+        'tone': 'warm and engaging',
+        'content_style': 'community building and networking'
+    }
+}
 
-# Import ONLY the functional modules (keeping original UI)
-try:
-    from smart_components.ai_cover_letter_generator import AICoverLetterGenerator, CoverLetterOptimizer, CoverLetterRequest
-    from smart_components.intelligent_resume_builder import IntelligentResumeBuilder, ResumeOptimizationEngine
-    from smart_components.job_market_scanner import JobMarketScanner, JobOpportunity, MarketTrend
-    SMART_COMPONENTS_AVAILABLE = True
-except ImportError:
-    SMART_COMPONENTS_AVAILABLE = False
-    print("Smart components not available")
-
-# Import advanced intelligence modules
-try:
-    from intelligence_modules.career_simulator import CareerPathSimulator, SalaryNegotiationCoach
-    from intelligence_modules.interview_preparation_engine import InterviewPreparationEngine, InterviewAnalytics
-    from intelligence_modules.market_intelligence_engine import MarketIntelligenceEngine
-    from intelligence_modules.personal_brand_builder import PersonalBrandBuilder
-    INTELLIGENCE_MODULES_AVAILABLE = True
-except ImportError:
-    INTELLIGENCE_MODULES_AVAILABLE = False
-    print("Intelligence modules not available")
+# Content framework per brand archetype for the fallback content strategy
+CONTENT_FRAMEWORKS = {
+    'expert': {
+        'focus': 'Industry insights and expertise',
+        'content_types': ['analysis', 'predictions', 'best_practices', 'case_studies'],
+        'posting_frequency': 'Weekly deep insights',
+        'target_audience': 'Industry peers and decision makers'
+    },
+    'mentor': {
+        'focus': 'Teaching and knowledge sharing',
+        'content_types': ['tutorials', 'explainers', 'tips', 'resources'],
+        'posting_frequency': 'Daily helpful content',
+        'target_audience': 'Learners and junior professionals'
+    },
+    'innovator': {
+        'focus': 'Cutting-edge developments and trends',
+        'content_types': ['trend_analysis', 'new_technologies', 'experiments'],
+        'posting_frequency': 'Bi-weekly innovation updates',
+        'target_audience': 'Tech enthusiasts and early adopters'
+    },
+    'connector': {
+        'focus': 'Building professional relationships',
+        'content_types': ['introductions', 'collaborations', 'community_building'],
+        'posting_frequency': 'Daily engagement',
+        'target_audience': 'Broad professional network'
+    }
+}
+
+# Content idea templates: four per content pillar, then general ideas
+CONTENT_IDEA_PREFIXES = (
+    "Share insights about",
+    "Write a case study on",
+    "Create tips for",
+    "Discuss trends in"
+)
+GENERAL_CONTENT_IDEAS = (
+    "Share a professional achievement",
+    "Write about lessons learned",
+    "Post about industry events",
+    "Share valuable resources",
+    "Engage with thought leaders"
+)
+
+# Static parts of the fallback brand strategy. Like BRAND_ARCHETYPES they are
+# shared by every call and returned directly, so they must never be mutated
+
+# Fallback messaging framework: shared themes and the per-audience message ending
+MESSAGING_KEY_THEMES = [
+    'Professional excellence',
+    'Industry expertise',
+    'Value creation',
+    'Innovation and growth'
+]
+AUDIENCE_MESSAGE_SUFFIX = "achieve their goals through expertise and innovation"
+
+# Fallback posting strategy
+BRAND_POSTING_STRATEGY = {
+    'frequency': {
+        'linkedin': '3-5 posts per week',
+        'twitter': '1-2 posts per day',
+        'blog': '1-2 posts per month'
+    },
+    'optimal_times': {
+        'linkedin': 'Weekdays 8-10 AM, 12-2 PM',
+        'twitter': 'Weekdays 9 AM, 1-3 PM',
+        'blog': 'Tuesday-Thursday mornings'
+    },
+    'content_mix': {
+        'original_content': '60%',
+        'curated_content': '25%',
+        'engagement_posts': '15%'
+    }
+}
+
+# Fallback engagement strategy
+BRAND_ENGAGEMENT_STRATEGY = {
+    'daily_activities': [
+        'Respond to comments within 2 hours',
+        'Engage with 5-10 posts from network',
+        'Share valuable insights in comments'
+    ],
+    'weekly_activities': [
+        'Connect with 10-15 new professionals',
+        'Share or comment on industry news',
+        'Participate in relevant discussions'
+    ],
+    'monthly_activities': [
+        'Review and optimize content strategy',
+        'Analyze engagement metrics',
+        'Plan content for next month'
+    ]
+}
+
+# Fallback implementation roadmap
+BRAND_IMPLEMENTATION_ROADMAP = {
+    'phase_1': {
+        'duration': '1-2 weeks',
+        'objectives': ['Complete profile optimization', 'Define content strategy'],
+        'tasks': [
+            'Update LinkedIn headline and summary',
+            'Optimize all social media profiles',
+            'Create content calendar',
+            'Set up monitoring tools'
+        ]
+    },
+    'phase_2': {
+        'duration': '2-4 weeks',
+        'objectives': ['Launch content strategy', 'Build engagement'],
+        'tasks': [
+            'Begin regular posting schedule',
+            'Engage with target audience',
+            'Monitor and adjust strategy',
+            'Track key metrics'
+        ]
+    },
+    'phase_3': {
+        'duration': 'Ongoing',
+        'objectives': ['Optimize and scale', 'Measure success'],
+        'tasks': [
+            'Analyze performance data',
+            'Refine content strategy',
+            'Expand platform presence',
+            'Build thought leadership'
+        ]
+    }
+}
+
+# Fallback success metrics
+BRAND_SUCCESS_METRICS = {
+    'awareness_metrics': [
+        'Profile views',
+        'Search appearances',
+        'Mention volume',
+        'Brand recognition surveys'
+    ],
+    'engagement_metrics': [
+        'Likes, comments, shares',
+        'Connection requests',
+        'Message volume',
+        'Event attendance'
+    ],
+    'conversion_metrics': [
+        'Job opportunities',
+        'Speaking invitations',
+        'Collaboration requests',
+        'Business inquiries'
+    ],
+    'growth_metrics': [
+        'Follower growth rate',
+        'Network expansion',
+        'Influence score',
+        'Industry ranking'
+    ]
+}
+
+# Fallback brand guidelines; the voice is filled in from the brand personality
+BRAND_GUIDELINES = {
+    'voice_and_tone': {
+        'tone_examples': {
+            'professional': 'Clear, authoritative, and informative',
+            'approachable': 'Friendly, helpful, and accessible',
+            'innovative': 'Forward-thinking, creative, and inspiring'
+        }
+    },
+    'visual_guidelines': {
+        'color_palette': ['#2563EB', '#059669', '#DC2626'],
+        'typography': 'Clean, modern fonts',
+        'imagery_style': 'Professional, high-quality images'
+    },
+    'content_guidelines': {
+        'dos': [
+            'Share valuable insights',
+            'Use professional language',
+            'Include clear call-to-actions',
+            'Engage authentically with others'
+        ],
+        'donts': [
+            'Share controversial political views',
+            'Use unprofessional language',
+            'Over-promote products/services',
+            'Ignore comments and messages'
+        ]
+    }
+}
+
+# Fixed entries of the competitive landscape; the industry-specific ones are built per call
+COMPETITIVE_ADVANTAGES = [
+    "Unique combination of technical and business skills",
+    "Strong track record of delivering results",
+    "Excellent communication abilities"
+]
+COMPETITIVE_THREATS = [
+    "Increased competition",
+    "Rapid technology changes",
+    "Market saturation"
+]
+
+# Used when PersonalBrandBuilder is not available at all
+FALLBACK_BRAND_PERSONALITY = {
+    'traits': ['professional', 'knowledgeable', 'reliable'],
+    'tone': 'professional and informative'
+}
+FALLBACK_IMPLEMENTATION_PLAN = {
+    'week_1': 'Optimize all profile sections',
+    'week_2': 'Begin content posting schedule',
+    'week_3': 'Engage with target audience',
+    'week_4': 'Analyze and adjust strategy'
+}
 
 # PersonalBrandBuilder wrapper to handle missing methods
 class PersonalBrandBuilderWrapper:
     """Wrapper for PersonalBrandBuilder with fallback methods"""
     
+    # Fallback methods copied onto builders that lack them
+    _PATCH_METHODS = (
+        '_define_brand_personality',
+        '_create_messaging_framework',
+        '_identify_competitive_differentiation',
+        '_select_content_framework',
+        '_define_content_pillars',
+        '_create_content_calendar_template',
+        '_generate_content_ideas',
+        '_create_posting_strategy',
+        '_create_engagement_strategy',
+        '_create_implementation_roadmap',
+        '_create_brand_guidelines',
+        '_define_success_metrics',
+        '_analyze_competitive_landscape'
+    )
+    # Builder classes that already carry the fallback methods
+    _PATCHED_CLASSES = set()
+    
     def __init__(self):
-        if INTELLIGENCE_MODULES_AVAILABLE:
-            try:
-                self.builder = PersonalBrandBuilder()
-            except Exception as e:
-                st.warning(f"PersonalBrandBuilder initialization failed: {e}")
-                self.builder = None
-        else:
-            self.builder = None
+        self._patched = False
+        self.builder = None
+        if not feature_available('intelligence_modules'):
+            return
+        
+        # Built once through get_personal_brand_builder(), so a failure here is not retried per rerun
+        try:
+            builder = _lazy('intelligence_modules.personal_brand_builder').PersonalBrandBuilder()
+        except Exception as e:
+            st.warning(f"PersonalBrandBuilder initialization failed: {e}")
+            return
+        
+        self.builder = builder
+        # Add missing methods to the builder once, not on every strategy request
+        self._patch_missing_methods()
     
     def create_personal_brand_strategy(self, user_profile: Dict[str, Any], 
                                      career_goals: Dict[str, Any], 
@@ -103,8 +377,6 @@ class PersonalBrandBuilderWrapper:
         """Create personal brand strategy with fallback implementation"""
         if self.builder:
             try:
-                # Add missing methods to the builder if they don't exist
-                self._patch_missing_methods()
                 return self.builder.create_personal_brand_strategy(user_profile, career_goals, current_presence)
             except Exception as e:
                 st.warning(f"Personal brand strategy creation failed: {e}")
@@ -113,76 +385,29 @@ class PersonalBrandBuilderWrapper:
             return self._create_fallback_brand_strategy(user_profile, career_goals, current_presence)
     
     def _patch_missing_methods(self):
-        """Add missing methods to PersonalBrandBuilder instance"""
-        if not hasattr(self.builder, '_define_brand_personality'):
-            self.builder._define_brand_personality = self._define_brand_personality.__get__(self.builder)
-        
-        if not hasattr(self.builder, '_create_messaging_framework'):
-            self.builder._create_messaging_framework = self._create_messaging_framework.__get__(self.builder)
-        
-        if not hasattr(self.builder, '_identify_competitive_differentiation'):
-            self.builder._identify_competitive_differentiation = self._identify_competitive_differentiation.__get__(self.builder)
-        
-        if not hasattr(self.builder, '_select_content_framework'):
-            self.builder._select_content_framework = self._select_content_framework.__get__(self.builder)
-        
-        if not hasattr(self.builder, '_define_content_pillars'):
-            self.builder._define_content_pillars = self._define_content_pillars.__get__(self.builder)
-        
-        if not hasattr(self.builder, '_create_content_calendar_template'):
-            self.builder._create_content_calendar_template = self._create_content_calendar_template.__get__(self.builder)
-        
-        if not hasattr(self.builder, '_generate_content_ideas'):
-            self.builder._generate_content_ideas = self._generate_content_ideas.__get__(self.builder)
-        
-        if not hasattr(self.builder, '_create_posting_strategy'):
-            self.builder._create_posting_strategy = self._create_posting_strategy.__get__(self.builder)
-        
-        if not hasattr(self.builder, '_create_engagement_strategy'):
-            self.builder._create_engagement_strategy = self._create_engagement_strategy.__get__(self.builder)
-        
-        if not hasattr(self.builder, '_create_implementation_roadmap'):
-            self.builder._create_implementation_roadmap = self._create_implementation_roadmap.__get__(self.builder)
-        
-        if not hasattr(self.builder, '_create_brand_guidelines'):
-            self.builder._create_brand_guidelines = self._create_brand_guidelines.__get__(self.builder)
-        
-        if not hasattr(self.builder, '_define_success_metrics'):
-            self.builder._define_success_metrics = self._define_success_metrics.__get__(self.builder)
-        
-        if not hasattr(self.builder, '_analyze_competitive_landscape'):
-            self.builder._analyze_competitive_landscape = self._analyze_competitive_landscape.__get__(self.builder)
+        """Add missing methods to PersonalBrandBuilder instance (runs once per builder)"""
+        if self._patched:
+            return
+        
+        # Patch the builder's class, once per class: every builder instance then finds
+        # the methods in the class dict and binds them like its own, with nothing
+        # stored per instance
+        builder_class = type(self.builder)
+        if builder_class not in self._PATCHED_CLASSES:
+            for name in self._PATCH_METHODS:
+                if not hasattr(builder_class, name):
+                    setattr(builder_class, name, getattr(PersonalBrandBuilderWrapper, name))
+            self._PATCHED_CLASSES.add(builder_class)
+        
+        self._patched = True
     
     def _define_brand_personality(self, user_profile: Dict[str, Any], brand_archetype: str) -> Dict[str, Any]:
         """Define brand personality"""
-        archetypes = {
-            'expert': {
-                'traits': ['authoritative', 'knowledgeable', 'reliable'],
-                'tone': 'professional and informative',
-                'content_style': 'data-driven insights and analysis'
-            },
-            'mentor': {
-                'traits': ['helpful', 'experienced', 'supportive'],
-                'tone': 'encouraging and educational',
-                'content_style': 'guidance and knowledge sharing'
-            },
-            'innovator': {
-                'traits': ['creative', 'forward-thinking', 'experimental'],
-                'tone': 'exciting and visionary',
-                'content_style': 'cutting-edge trends and possibilities'
-            },
-            'connector': {
-                'traits': ['collaborative', 'sociable', 'generous'],
-                'tone': 'warm and engaging',
-                'content_style': 'community building and networking'
-            }
-        }
+        personality = BRAND_ARCHETYPES.get(brand_archetype, BRAND_ARCHETYPES['expert'])
         
-        personality = archetypes.get(brand_archetype, archetypes['expert'])
-        
-        # Customize based on user profile
+        # Customize based on user profile - on a copy, the table is shared
         if user_profile.get('industry') == 'Technology':
-            personality['traits'].append('tech-savvy')
+            return {**personality, 'traits': [*personality['traits'], 'tech-savvy']}
         
         return personality
     
@@ -190,17 +415,12 @@ class PersonalBrandBuilderWrapper:
         """Create messaging framework"""
         return {
             'core_message': unique_value_prop,
-            'key_themes': [
-                'Professional excellence',
-                'Industry expertise',
-                'Value creation',
-                'Innovation and growth'
-            ],
+            'key_themes': MESSAGING_KEY_THEMES,
             'tone_guidelines': brand_personality.get('tone', 'professional'),
             'communication_style': brand_personality.get('content_style', 'informative'),
             'target_messaging': {
-                audience: f"Helping {audience.lower()} achieve their goals through expertise and innovation"
-                for audience in target_audience[:3]
+                audience: f"Helping {audience.lower()} {AUDIENCE_MESSAGE_SUFFIX}"
+                for audience in islice(target_audience, 3)
             }
         }
     
@@ -208,7 +428,7 @@ class PersonalBrandBuilderWrapper:
         """Identify competitive differentiation"""
         differentiators = []
         
-        skills = user_profile.get('core_skills', [])
+        skills = user_profile.get('core_skills', ())
         if len(skills) > 3:
             differentiators.append(f"Diverse skill set spanning {', '.join(skills[:3])}")
         
@@ -227,39 +447,13 @@ class PersonalBrandBuilderWrapper:
         """Select content framework"""
         archetype = brand_positioning.get('brand_archetype', 'expert')
         
-        frameworks = {
-            'expert': {
-                'focus': 'Industry insights and expertise',
-                'content_types': ['analysis', 'predictions', 'best_practices', 'case_studies'],
-                'posting_frequency': 'Weekly deep insights',
-                'target_audience': 'Industry peers and decision makers'
-            },
-            'mentor': {
-                'focus': 'Teaching and knowledge sharing',
-                'content_types': ['tutorials', 'explainers', 'tips', 'resources'],
-                'posting_frequency': 'Daily helpful content',
-                'target_audience': 'Learners and junior professionals'
-            },
-            'innovator': {
-                'focus': 'Cutting-edge developments and trends',
-                'content_types': ['trend_analysis', 'new_technologies', 'experiments'],
-                'posting_frequency': 'Bi-weekly innovation updates',
-                'target_audience': 'Tech enthusiasts and early adopters'
-            },
-            'connector': {
-                'focus': 'Building professional relationships',
-                'content_types': ['introductions', 'collaborations', 'community_building'],
-                'posting_frequency': 'Daily engagement',
-                'target_audience': 'Broad professional network'
-            }
-        }
-        
-        return frameworks.get(archetype, frameworks['expert'])
+        # Shallow copy of the shared entry: callers may reassign its keys, not edit its lists
+        return dict(CONTENT_FRAMEWORKS.get(archetype, CONTENT_FRAMEWORKS['expert']))
     
     def _define_content_pillars(self, brand_positioning: Dict[str, Any], user_profile: Dict[str, Any]) -> List[str]:
         """Define content pillars"""
         industry = user_profile.get('industry', 'Technology')
-        skills = user_profile.get('core_skills', [])
+        skills = user_profile.get('core_skills', ())
         
         pillars = [
             f"{industry} Industry Insights",
@@ -268,7 +462,7 @@ class PersonalBrandBuilderWrapper:
         ]
         
         if skills:
-            pillars.append(f"{skills[0]} Expertise" if skills else "Technical Skills")
+            pillars.append(f"{skills[0]} Expertise")
         
         pillars.append("Career Growth and Leadership")
         
@@ -293,164 +487,37 @@ class PersonalBrandBuilderWrapper:
     
     def _generate_content_ideas(self, content_pillars: List[str], user_profile: Dict[str, Any]) -> List[str]:
         """Generate content ideas"""
-        ideas = []
-        
-        for pillar in content_pillars:
-            ideas.extend([
-                f"Share insights about {pillar.lower()}",
-                f"Write a case study on {pillar.lower()}",
-                f"Create tips for {pillar.lower()}",
-                f"Discuss trends in {pillar.lower()}"
-            ])
-        
-        # Add general ideas
-        ideas.extend([
-            "Share a professional achievement",
-            "Write about lessons learned",
-            "Post about industry events",
-            "Share valuable resources",
-            "Engage with thought leaders"
-        ])
+        pillar_ideas = (
+            f"{prefix} {pillar}"
+            for pillar in map(str.lower, content_pillars)
+            for prefix in CONTENT_IDEA_PREFIXES
+        )
         
-        return ideas[:20]  # Return top 20 ideas
+        # Pillar ideas, then general ones - stop as soon as the top 20 exist
+        return list(islice(chain(pillar_ideas, GENERAL_CONTENT_IDEAS), 20))
     
     def _create_posting_strategy(self, brand_positioning: Dict[str, Any]) -> Dict[str, Any]:
         """Create posting strategy"""
-        return {
-            'frequency': {
-                'linkedin': '3-5 posts per week',
-                'twitter': '1-2 posts per day',
-                'blog': '1-2 posts per month'
-            },
-            'optimal_times': {
-                'linkedin': 'Weekdays 8-10 AM, 12-2 PM',
-                'twitter': 'Weekdays 9 AM, 1-3 PM',
-                'blog': 'Tuesday-Thursday mornings'
-            },
-            'content_mix': {
-                'original_content': '60%',
-                'curated_content': '25%',
-                'engagement_posts': '15%'
-            }
-        }
+        return BRAND_POSTING_STRATEGY
     
     def _create_engagement_strategy(self, brand_positioning: Dict[str, Any]) -> Dict[str, Any]:
         """Create engagement strategy"""
-        return {
-            'daily_activities': [
-                'Respond to comments within 2 hours',
-                'Engage with 5-10 posts from network',
-                'Share valuable insights in comments'
-            ],
-            'weekly_activities': [
-                'Connect with 10-15 new professionals',
-                'Share or comment on industry news',
-                'Participate in relevant discussions'
-            ],
-            'monthly_activities': [
-                'Review and optimize content strategy',
-                'Analyze engagement metrics',
-                'Plan content for next month'
-            ]
-        }
+        return BRAND_ENGAGEMENT_STRATEGY
     
     def _create_implementation_roadmap(self, brand_audit: Dict[str, Any], 
                                      brand_positioning: Dict[str, Any], 
                                      content_strategy: Dict[str, Any]) -> Dict[str, Any]:
         """Create implementation roadmap"""
-        return {
-            'phase_1': {
-                'duration': '1-2 weeks',
-                'objectives': ['Complete profile optimization', 'Define content strategy'],
-                'tasks': [
-                    'Update LinkedIn headline and summary',
-                    'Optimize all social media profiles',
-                    'Create content calendar',
-                    'Set up monitoring tools'
-                ]
-            },
-            'phase_2': {
-                'duration': '2-4 weeks',
-                'objectives': ['Launch content strategy', 'Build engagement'],
-                'tasks': [
-                    'Begin regular posting schedule',
-                    'Engage with target audience',
-                    'Monitor and adjust strategy',
-                    'Track key metrics'
-                ]
-            },
-            'phase_3': {
-                'duration': 'Ongoing',
-                'objectives': ['Optimize and scale', 'Measure success'],
-                'tasks': [
-                    'Analyze performance data',
-                    'Refine content strategy',
-                    'Expand platform presence',
-                    'Build thought leadership'
-                ]
-            }
-        }
+        return BRAND_IMPLEMENTATION_ROADMAP
     
     def _create_brand_guidelines(self, brand_positioning: Dict[str, Any]) -> Dict[str, Any]:
         """Create brand guidelines"""
-        return {
-            'voice_and_tone': {
-                'voice': brand_positioning.get('brand_personality', {}).get('tone', 'Professional'),
-                'tone_examples': {
-                    'professional': 'Clear, authoritative, and informative',
-                    'approachable': 'Friendly, helpful, and accessible',
-                    'innovative': 'Forward-thinking, creative, and inspiring'
-                }
-            },
-            'visual_guidelines': {
-                'color_palette': ['#2563EB', '#059669', '#DC2626'],
-                'typography': 'Clean, modern fonts',
-                'imagery_style': 'Professional, high-quality images'
-            },
-            'content_guidelines': {
-                'dos': [
-                    'Share valuable insights',
-                    'Use professional language',
-                    'Include clear call-to-actions',
-                    'Engage authentically with others'
-                ],
-                'donts': [
-                    'Share controversial political views',
-                    'Use unprofessional language',
-                    'Over-promote products/services',
-                    'Ignore comments and messages'
-                ]
-            }
-        }
+        voice = brand_positioning.get('brand_personality', {}).get('tone', 'Professional')
+        return {**BRAND_GUIDELINES, 'voice_and_tone': {'voice': voice, **BRAND_GUIDELINES['voice_and_tone']}}
     
     def _define_success_metrics(self, career_goals: Dict[str, Any]) -> Dict[str, Any]:
         """Define success metrics"""
-        return {
-            'awareness_metrics': [
-                'Profile views',
-                'Search appearances',
-                'Mention volume',
-                'Brand recognition surveys'
-            ],
-            'engagement_metrics': [
-                'Likes, comments, shares',
-                'Connection requests',
-                'Message volume',
-                'Event attendance'
-            ],
-            'conversion_metrics': [
-                'Job opportunities',
-                'Speaking invitations',
-                'Collaboration requests',
-                'Business inquiries'
-            ],
-            'growth_metrics': [
-                'Follower growth rate',
-                'Network expansion',
-                'Influence score',
-                'Industry ranking'
-            ]
-        }
+        return BRAND_SUCCESS_METRICS
     
     def _analyze_competitive_landscape(self, user_profile: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze competitive landscape"""
@@ -462,36 +529,27 @@ class PersonalBrandBuilderWrapper:
                 f"{industry} thought leaders",
                 f"Consultants in {industry} space"
             ],
-            'competitive_advantages': [
-                "Unique combination of technical and business skills",
-                "Strong track record of delivering results",
-                "Excellent communication abilities"
-            ],
+            'competitive_advantages': COMPETITIVE_ADVANTAGES,
             'opportunities': [
                 f"Growing demand for {industry} expertise",
                 "Digital transformation trends",
                 "Remote work adoption"
             ],
-            'threats': [
-                "Increased competition",
-                "Rapid technology changes",
-                "Market saturation"
-            ]
+            'threats': COMPETITIVE_THREATS
         }
     
     def _create_fallback_brand_strategy(self, user_profile: Dict[str, Any], 
                                       career_goals: Dict[str, Any], 
                                       current_presence: Dict[str, Any]) -> Dict[str, Any]:
         """Create fallback brand strategy when PersonalBrandBuilder is not available"""
+        title = user_profile.get('professional_title', 'professional')
+        
         return {
             'brand_positioning': {
-                'unique_value_proposition': f"Experienced {user_profile.get('professional_title', 'professional')} with expertise in {user_profile.get('industry', 'technology')}",
+                'unique_value_proposition': f"Experienced {title} with expertise in {user_profile.get('industry', 'technology')}",
                 'target_audience': career_goals.get('target_audience', ['Industry professionals', 'Hiring managers']),
                 'brand_archetype': 'expert',
-                'brand_personality': {
-                    'traits': ['professional', 'knowledgeable', 'reliable'],
-                    'tone': 'professional and informative'
-                }
+                'brand_personality': FALLBACK_BRAND_PERSONALITY
             },
             'content_strategy': {
                 'content_pillars': [
@@ -508,16 +566,11 @@ class PersonalBrandBuilderWrapper:
             'platform_optimizations': {
                 'linkedin': {
                     'headline_optimization': f"🚀 {user_profile.get('professional_title', 'Professional')} | Helping organizations achieve their goals",
-                    'summary_optimization': f"Experienced {user_profile.get('professional_title', 'professional')} with a passion for driving results and innovation.",
+                    'summary_optimization': f"Experienced {title} with a passion for driving results and innovation.",
                     'content_strategy': 'Share industry insights and professional achievements regularly'
                 }
             },
-            'implementation_plan': {
-                'week_1': 'Optimize all profile sections',
-                'week_2': 'Begin content posting schedule',
-                'week_3': 'Engage with target audience',
-                'week_4': 'Analyze and adjust strategy'
-            }
+            'implementation_plan': FALLBACK_IMPLEMENTATION_PLAN
         }
 
 # Page configuration
@@ -533,46 +586,212 @@ if not CORE_COMPONENTS_AVAILABLE:
     st.error("❌ Core components are required but not available. Please ensure all required modules are installed.")
     st.stop()
 
+# Read .env into the environment once per server process, not on every rerun
+@st.cache_resource
+def load_environment() -> bool:
+    return load_dotenv()
+
+load_environment()
+
 # Initialize session manager
 session = SessionManager()
 
-# Load custom CSS (keeping your original theme)
+# Load custom CSS (keeping your original theme). This must run on every rerun:
+# Streamlit clears elements a run does not re-emit, so a once-per-process
+# injection would unstyle the page from the second rerun on
 try:
     load_custom_css()
 except Exception as e:
     st.warning(f"Custom CSS loading failed: {e}")
 
-# Initialize components
-pdf_processor = PDFProcessor()
-gemini_analyzer = GeminiAnalyzer()
-viz_engine = VisualizationEngine()
-report_gen = ReportGenerator()
-keyword_extractor = KeywordExtractor()
-
-# Initialize ONLY the functional components (keeping original UI)
-if SMART_COMPONENTS_AVAILABLE:
-    cover_letter_generator = AICoverLetterGenerator()
-    cover_letter_optimizer = CoverLetterOptimizer()
-    resume_builder = IntelligentResumeBuilder()
-    resume_optimizer = ResumeOptimizationEngine()
-    job_scanner = JobMarketScanner()
-
-# Initialize advanced intelligence modules
-if INTELLIGENCE_MODULES_AVAILABLE:
-    career_simulator = CareerPathSimulator()
-    salary_negotiation_coach = SalaryNegotiationCoach()
-    interview_prep_engine = InterviewPreparationEngine()
-    interview_analytics = InterviewAnalytics()
-    market_intelligence = MarketIntelligenceEngine()
+# Initialize components - built once per server process, not on every rerun
+@st.cache_resource
+def get_core_components():
+    """Stateless core components shared across reruns and sessions"""
+    return PDFProcessor(), VisualizationEngine(), ReportGenerator(), KeywordExtractor()
+
+@st.cache_resource
+def get_gemini_analyzer(api_key_fingerprint: str):
+    """Gemini client, configured from the environment and rebuilt only when the API key changes"""
+    return GeminiAnalyzer()
+
+def _api_key_fingerprint() -> str:
+    return hashlib.sha256(os.environ.get("GOOGLE_API_KEY", "").encode('utf-8')).hexdigest()
+
+pdf_processor, viz_engine, report_gen, keyword_extractor = get_core_components()
+gemini_analyzer = get_gemini_analyzer(_api_key_fingerprint())
+
+# Result-view charts, memoized on their inputs so reruns with an unchanged
+# analysis skip re-rendering (the word cloud rasterizes an image)
+@st.cache_data(max_entries=16)
+def cached_word_cloud(text: str, important_terms: tuple) -> str:
+    return viz_engine.create_word_cloud(text, list(important_terms))
+
+@st.cache_data(max_entries=16)
+def cached_keyword_chart(matched_keywords: tuple, missing_keywords: tuple) -> go.Figure:
+    return viz_engine.create_keyword_chart(list(matched_keywords), list(missing_keywords))
+
+@st.cache_data(max_entries=16)
+def cached_skills_radar(skills_items: tuple) -> go.Figure:
+    return viz_engine.create_skills_radar(dict(skills_items))
+
+@st.cache_data(max_entries=16)
+def cached_detailed_breakdown(score_breakdown_items: Optional[tuple]) -> go.Figure:
+    # None (no breakdown in the analysis) keeps the engine's default scores
+    analysis = {} if score_breakdown_items is None else {'score_breakdown': dict(score_breakdown_items)}
+    return viz_engine.create_detailed_breakdown(analysis)
+
+# Resume text per uploaded PDF, memoized on the file's bytes so reruns with the file
+# still attached (and re-uploads of the same file) skip parsing it again
+@st.cache_data(max_entries=16, show_spinner=False)
+def cached_pdf_text(file_bytes: bytes, max_chars: Optional[int] = None) -> Optional[str]:
+    return pdf_processor.extract_text(io.BytesIO(file_bytes), max_chars=max_chars)
+
+def result_figure(analysis: Dict[str, Any], name: str, build):
+    """
+    Result-view figure kept in the session and reused as-is until a different
+    analysis is shown (skips even the cache_data unpickle on plain reruns)
+    """
+    viz_cache = session.get('viz_cache')
+    # Holding the analysis itself keeps its identity from being reused
+    if viz_cache is None or viz_cache['analysis'] is not analysis:
+        viz_cache = {'analysis': analysis, 'figures': {}}
+        session.set('viz_cache', viz_cache)
+    
+    figure = viz_cache['figures'].get(name)
+    if figure is None:
+        figure = viz_cache['figures'][name] = build()
+    return figure
+
+# Sample skill development data for the fallback skill chart: the skills, their
+# starting levels and trace colors, and the growth per development intensity
+SKILL_CHART_SKILLS = ('Technical Skills', 'Leadership', 'Communication', 'Strategic Thinking', 'Industry Knowledge')
+SKILL_BASE_LEVELS = (50, 55, 60, 65, 70)
+SKILL_CHART_COLORS = ('#3B82F6', '#10B981', '#F59E0B', '#EF4444', '#8B5CF6')
+SKILL_GROWTH_BY_INTENSITY = {
+    'Intensive': 35,
+    'Moderate': 25,
+    'Focused': 30,
+    'Gradual': 15
+}
+
+# Success factors and risk strategies of the fallback career simulation. Like the
+# brand strategy constants they end up in every result, so they must never be mutated
+SKILL_DEVELOPMENT_FACTOR = {
+    'factor': 'Continuous Skill Development',
+    'description': 'Consistent investment in learning and skill building',
+    'impact': 'High',
+    'actionable_steps': 'Dedicate time weekly to learning new skills and technologies'
+}
+NETWORKING_FACTOR = {
+    'factor': 'Strategic Networking',
+    'description': 'Building meaningful professional relationships',
+    'impact': 'High',
+    'actionable_steps': 'Attend industry events and maintain active LinkedIn presence'
+}
+MARKET_AWARENESS_FACTOR = {
+    'factor': 'Market Awareness',
+    'description': 'Understanding industry trends and positioning accordingly',
+    'impact': 'Medium',
+    'actionable_steps': 'Stay informed about industry developments and emerging opportunities'
+}
+GENERAL_SUCCESS_FACTORS = (
+    {
+        'factor': 'Performance Excellence',
+        'description': 'Consistently delivering high-quality results',
+        'impact': 'High',
+        'actionable_steps': 'Set clear goals and track achievements regularly'
+    },
+    {
+        'factor': 'Leadership Development',
+        'description': 'Building leadership and management capabilities',
+        'impact': 'Medium',
+        'actionable_steps': 'Take on leadership opportunities and mentor others'
+    },
+    {
+        'factor': 'Industry Expertise',
+        'description': 'Developing deep knowledge in your field',
+        'impact': 'Medium',
+        'actionable_steps': 'Stay current with industry best practices and innovations'
+    }
+)
+
+# Only added when a scenario is high risk; the general strategies follow
+HIGH_RISK_STRATEGIES = (
+    {
+        'risk': 'Market Volatility',
+        'mitigation': 'Diversify skills and maintain flexible career options',
+        'action_plan': 'Develop transferable skills and build network across multiple companies',
+        'timeline': 'Ongoing'
+    },
+    {
+        'risk': 'High Competition',
+        'mitigation': 'Build unique value proposition and strong personal brand',
+        'action_plan': 'Focus on developing rare skills and documenting achievements',
+        'timeline': '6-12 months'
+    }
+)
+GENERAL_RISK_STRATEGIES = (
+    {
+        'risk': 'Economic Downturn',
+        'mitigation': 'Build emergency fund and maintain strong professional network',
+        'action_plan': 'Save 6-12 months expenses and cultivate relationships across industries',
+        'timeline': '12-24 months'
+    },
+    {
+        'risk': 'Skill Obsolescence',
+        'mitigation': 'Continuous learning and adaptation to new technologies',
+        'action_plan': 'Allocate time weekly for learning and experimenting with new tools',
+        'timeline': 'Ongoing'
+    },
+    {
+        'risk': 'Limited Growth Opportunities',
+        'mitigation': 'Consider lateral moves and cross-functional experiences',
+        'action_plan': 'Explore opportunities in adjacent roles or departments',
+        'timeline': '1-2 years'
+    }
+)
+
+# Fixed figure layouts and marker colors of the fallback career charts. Figures
+# copy the layout they are given, so these are never modified by a chart
+SKILL_CHART_LAYOUT = {
+    'polar': {'radialaxis': {'visible': True, 'range': [0, 100]}},
+    'title': 'Skill Development Progression by Career Path',
+    'height': 500
+}
+MILESTONE_TIMELINE_LAYOUT = {
+    'xaxis': {'title': 'Years'},
+    'yaxis': {'visible': False, 'range': [0.5, 1.5]},
+    'height': 300,
+    'showlegend': True
+}
+MILESTONE_FOCUS_COLORS = {
+    'Skill Building': '#3B82F6',
+    'Leadership Development': '#10B981',
+    'Strategic Positioning': '#F59E0B',
+    'General': '#6B7280'
+}
 
 # CareerPathSimulator wrapper to handle missing methods
 class CareerPathSimulatorWrapper:
     """Wrapper for CareerPathSimulator with fallback methods"""
     
+    # Fallback methods copied onto simulators that lack them
+    _PATCH_METHODS = frozenset({
+        '_identify_success_factors',
+        '_generate_risk_mitigation_strategies',
+        '_create_skill_development_chart',
+        '_create_milestone_timeline'
+    })
+    
     def __init__(self):
-        if INTELLIGENCE_MODULES_AVAILABLE:
+        self._patched = False
+        self._missing = frozenset()
+        if feature_available('intelligence_modules'):
             try:
-                self.simulator = CareerPathSimulator()
+                self.simulator = _lazy('intelligence_modules.career_simulator').CareerPathSimulator()
+                # Add missing methods to the simulator once, not on every simulation
+                self._patch_missing_methods()
             except Exception as e:
                 st.warning(f"CareerPathSimulator initialization failed: {e}")
                 self.simulator = None
@@ -583,8 +802,6 @@ class CareerPathSimulatorWrapper:
         """Simulate career paths with fallback implementation"""
         if self.simulator:
             try:
-                # Add missing methods to the simulator if they don't exist
-                self._patch_missing_methods()
                 return self.simulator.simulate_career_paths(current_profile, career_goals)
             except Exception as e:
                 st.warning(f"Career path simulation failed: {e}")
@@ -596,7 +813,6 @@ class CareerPathSimulatorWrapper:
         """Create career path visualizations with fallback"""
         if self.simulator:
             try:
-                self._patch_missing_methods()
                 return self.simulator.create_career_path_visualizations(simulation_results)
             except Exception as e:
                 st.warning(f"Career visualization creation failed: {e}")
@@ -605,201 +821,118 @@ class CareerPathSimulatorWrapper:
             return self._create_fallback_visualizations(simulation_results)
     
     def _patch_missing_methods(self):
-        """Add missing methods to CareerPathSimulator instance"""
-        if not hasattr(self.simulator, '_identify_success_factors'):
-            self.simulator._identify_success_factors = self._identify_success_factors.__get__(self.simulator)
-        
-        if not hasattr(self.simulator, '_generate_risk_mitigation_strategies'):
-            self.simulator._generate_risk_mitigation_strategies = self._generate_risk_mitigation_strategies.__get__(self.simulator)
+        """Add missing methods to CareerPathSimulator instance (runs once per simulator)"""
+        if self._patched:
+            return
         
-        if not hasattr(self.simulator, '_create_skill_development_chart'):
-            self.simulator._create_skill_development_chart = self._create_skill_development_chart.__get__(self.simulator)
+        # One set difference against the class and instance namespaces instead of a probe per name
+        self._missing = self._PATCH_METHODS.difference(dir(type(self.simulator)), vars(self.simulator))
+        for name in self._missing:
+            setattr(self.simulator, name, getattr(self, name))
         
-        if not hasattr(self.simulator, '_create_milestone_timeline'):
-            self.simulator._create_milestone_timeline = self._create_milestone_timeline.__get__(self.simulator)
+        self._patched = True
     
     def _identify_success_factors(self, scenarios: List[Dict[str, Any]]) -> List[Dict[str, str]]:
         """Identify key success factors across scenarios"""
         success_factors = []
         
-        # Analyze common factors in high-performing scenarios
-        high_performing = [s for s in scenarios if s.get('total_salary_growth', 0) > 15]
-        
-        if high_performing:
+        # Analyze common factors in high-performing scenarios - one pass that stops
+        # once neither factor can still hold for all of them
+        has_high_performing = False
+        skills_strong = networking_strong = True
+        for scenario in scenarios:
+            if scenario.get('total_salary_growth', 0) > 15:
+                has_high_performing = True
+                skills_strong = skills_strong and scenario.get('skill_portfolio_score', 0) > 70
+                networking_strong = networking_strong and scenario.get('networking_score', 0) > 70
+                if not (skills_strong or networking_strong):
+                    break
+        
+        if has_high_performing:
             # Skills development factor
-            if all(s.get('skill_portfolio_score', 0) > 70 for s in high_performing):
-                success_factors.append({
-                    'factor': 'Continuous Skill Development',
-                    'description': 'Consistent investment in learning and skill building',
-                    'impact': 'High',
-                    'actionable_steps': 'Dedicate time weekly to learning new skills and technologies'
-                })
+            if skills_strong:
+                success_factors.append(SKILL_DEVELOPMENT_FACTOR)
             
             # Networking factor
-            if all(s.get('networking_score', 0) > 70 for s in high_performing):
-                success_factors.append({
-                    'factor': 'Strategic Networking',
-                    'description': 'Building meaningful professional relationships',
-                    'impact': 'High',
-                    'actionable_steps': 'Attend industry events and maintain active LinkedIn presence'
-                })
+            if networking_strong:
+                success_factors.append(NETWORKING_FACTOR)
             
             # Market positioning factor
-            success_factors.append({
-                'factor': 'Market Awareness',
-                'description': 'Understanding industry trends and positioning accordingly',
-                'impact': 'Medium',
-                'actionable_steps': 'Stay informed about industry developments and emerging opportunities'
-            })
+            success_factors.append(MARKET_AWARENESS_FACTOR)
         
         # Add general success factors
-        success_factors.extend([
-            {
-                'factor': 'Performance Excellence',
-                'description': 'Consistently delivering high-quality results',
-                'impact': 'High',
-                'actionable_steps': 'Set clear goals and track achievements regularly'
-            },
-            {
-                'factor': 'Leadership Development',
-                'description': 'Building leadership and management capabilities',
-                'impact': 'Medium',
-                'actionable_steps': 'Take on leadership opportunities and mentor others'
-            },
-            {
-                'factor': 'Industry Expertise',
-                'description': 'Developing deep knowledge in your field',
-                'impact': 'Medium',
-                'actionable_steps': 'Stay current with industry best practices and innovations'
-            }
-        ])
+        success_factors.extend(GENERAL_SUCCESS_FACTORS)
         
         return success_factors[:5]  # Return top 5 factors
     
     def _generate_risk_mitigation_strategies(self, scenarios: List[Dict[str, Any]]) -> List[Dict[str, str]]:
         """Generate risk mitigation strategies"""
-        strategies = []
-        
         # Analyze risks across scenarios
-        high_risk_scenarios = [s for s in scenarios if s.get('scenario_details', {}).get('risk_level') == 'High']
-        
-        if high_risk_scenarios:
-            strategies.append({
-                'risk': 'Market Volatility',
-                'mitigation': 'Diversify skills and maintain flexible career options',
-                'action_plan': 'Develop transferable skills and build network across multiple companies',
-                'timeline': 'Ongoing'
-            })
-            
-            strategies.append({
-                'risk': 'High Competition',
-                'mitigation': 'Build unique value proposition and strong personal brand',
-                'action_plan': 'Focus on developing rare skills and documenting achievements',
-                'timeline': '6-12 months'
-            })
+        if any(s.get('scenario_details', {}).get('risk_level') == 'High' for s in scenarios):
+            strategies = list(HIGH_RISK_STRATEGIES)
+        else:
+            strategies = []
         
         # General risk mitigation strategies
-        strategies.extend([
-            {
-                'risk': 'Economic Downturn',
-                'mitigation': 'Build emergency fund and maintain strong professional network',
-                'action_plan': 'Save 6-12 months expenses and cultivate relationships across industries',
-                'timeline': '12-24 months'
-            },
-            {
-                'risk': 'Skill Obsolescence',
-                'mitigation': 'Continuous learning and adaptation to new technologies',
-                'action_plan': 'Allocate time weekly for learning and experimenting with new tools',
-                'timeline': 'Ongoing'
-            },
-            {
-                'risk': 'Limited Growth Opportunities',
-                'mitigation': 'Consider lateral moves and cross-functional experiences',
-                'action_plan': 'Explore opportunities in adjacent roles or departments',
-                'timeline': '1-2 years'
-            }
-        ])
+        strategies.extend(GENERAL_RISK_STRATEGIES)
         
         return strategies[:4]  # Return top 4 strategies
     
     def _create_skill_development_chart(self, scenarios: List[Dict[str, Any]]) -> go.Figure:
         """Create skill development progression chart"""
-        fig = go.Figure()
+        import plotly.graph_objects as go
         
-        # Create sample skill development data
-        skills = ['Technical Skills', 'Leadership', 'Communication', 'Strategic Thinking', 'Industry Knowledge']
-        colors = ['#3B82F6', '#10B981', '#F59E0B', '#EF4444', '#8B5CF6']
+        fig = go.Figure(layout=SKILL_CHART_LAYOUT)
         
         for i, scenario in enumerate(scenarios[:3]):  # Show top 3 scenarios
             scenario_name = scenario.get('scenario_name', f'Scenario {i+1}')
-            timeline = scenario.get('scenario_details', {}).get('timeline', 5)
-            
-            # Generate skill progression data
-            skill_values = []
-            for j, skill in enumerate(skills):
-                # Simulate skill development based on scenario intensity
-                intensity = scenario.get('scenario_details', {}).get('skill_development_intensity', 'Moderate')
-                base_value = 50 + j * 5  # Starting skill level
-                
-                if intensity == 'Intensive':
-                    growth = 35
-                elif intensity == 'Moderate':
-                    growth = 25
-                elif intensity == 'Focused':
-                    growth = 30
-                else:  # Gradual
-                    growth = 15
-                
-                final_value = min(100, base_value + growth)
-                skill_values.append(final_value)
+            
+            # Simulate skill development based on scenario intensity - the growth
+            # is the same for every skill, so look it up once per scenario
+            intensity = scenario.get('scenario_details', {}).get('skill_development_intensity', 'Moderate')
+            growth = SKILL_GROWTH_BY_INTENSITY.get(intensity, 15)  # Gradual
+            skill_values = [min(100, base_value + growth) for base_value in SKILL_BASE_LEVELS]
             
             fig.add_trace(go.Scatterpolar(
                 r=skill_values,
-                theta=skills,
+                theta=SKILL_CHART_SKILLS,
                 fill='toself',
                 name=scenario_name,
-                line_color=colors[i % len(colors)]
+                line_color=SKILL_CHART_COLORS[i % len(SKILL_CHART_COLORS)]
             ))
         
-        fig.update_layout(
-            polar=dict(
-                radialaxis=dict(
-                    visible=True,
-                    range=[0, 100]
-                )),
-            title='Skill Development Progression by Career Path',
-            height=500
-        )
-        
         return fig
     
     def _create_milestone_timeline(self, scenarios: List[Dict[str, Any]]) -> go.Figure:
         """Create career milestone timeline chart"""
-        fig = go.Figure()
+        import plotly.graph_objects as go
         
         # Use the optimal scenario for milestone timeline
         if scenarios:
             optimal_scenario = max(scenarios, key=lambda x: x.get('total_salary_growth', 0))
             milestones = optimal_scenario.get('key_milestones', [])
             
+            fig = go.Figure(layout={
+                **MILESTONE_TIMELINE_LAYOUT,
+                'title': f'Career Milestone Timeline - {optimal_scenario.get("scenario_name", "Optimal Path")}'
+            })
+            
             if milestones:
-                years = [m.get('year', 0) for m in milestones]
-                milestone_texts = [m.get('milestone', f'Year {m.get("year", 0)} milestone') for m in milestones]
-                focus_areas = [m.get('focus_area', 'General') for m in milestones]
-                
-                # Create colors for different focus areas
-                focus_color_map = {
-                    'Skill Building': '#3B82F6',
-                    'Leadership Development': '#10B981',
-                    'Strategic Positioning': '#F59E0B',
-                    'General': '#6B7280'
-                }
-                
-                colors = [focus_color_map.get(area, '#6B7280') for area in focus_areas]
+                # Columns of the timeline, gathered in one pass over the milestones
+                years, milestone_texts, focus_areas, colors = [], [], [], []
+                for m in milestones:
+                    year = m.get('year', 0)
+                    focus_area = m.get('focus_area', 'General')
+                    years.append(year)
+                    milestone_texts.append(m['milestone'] if 'milestone' in m else f'Year {year} milestone')
+                    focus_areas.append(focus_area)
+                    # Create colors for different focus areas
+                    colors.append(MILESTONE_FOCUS_COLORS.get(focus_area, '#6B7280'))
+                baseline = [1] * len(years)  # All on same horizontal line
                 
                 fig.add_trace(go.Scatter(
                     x=years,
-                    y=[1] * len(years),  # All on same horizontal line
+                    y=baseline,
                     mode='markers+text',
                     marker=dict(
                         size=30,
@@ -816,25 +949,15 @@ class CareerPathSimulatorWrapper:
                 # Add connecting line
                 fig.add_trace(go.Scatter(
                     x=years,
-                    y=[1] * len(years),
+                    y=baseline,
                     mode='lines',
                     line=dict(color='gray', width=2, dash='dash'),
                     showlegend=False,
                     hoverinfo='skip'
                 ))
-            
-            fig.update_layout(
-                title=f'Career Milestone Timeline - {optimal_scenario.get("scenario_name", "Optimal Path")}',
-                xaxis_title='Years',
-                yaxis=dict(
-                    visible=False,
-                    range=[0.5, 1.5]
-                ),
-                height=300,
-                showlegend=True
-            )
         else:
             # Empty chart if no scenarios
+            fig = go.Figure()
             fig.add_annotation(
                 text="No milestone data available",
                 xref="paper", yref="paper",
@@ -950,17 +1073,22 @@ class CareerPathSimulatorWrapper:
         figures = []
         
         if scenarios:
+            import plotly.graph_objects as go
+            
             # Salary progression chart
             fig1 = go.Figure()
+            current_salary = 75000  # Default
             for i, scenario in enumerate(scenarios):
                 timeline = scenario.get('scenario_details', {}).get('timeline', 5)
-                current_salary = 75000  # Default
                 final_salary = scenario.get('final_salary', current_salary * 1.5)
                 
-                # Create progression points
+                # Create progression points - compound year over year, one
+                # multiplication per point instead of a power per point
                 years = list(range(timeline + 1))
-                growth_rate = (final_salary / current_salary) ** (1/timeline) - 1
-                salaries = [current_salary * (1 + growth_rate) ** year for year in years]
+                annual_factor = (final_salary / current_salary) ** (1/timeline)
+                salaries = [current_salary]
+                for _ in range(timeline):
+                    salaries.append(salaries[-1] * annual_factor)
                 
                 fig1.add_trace(go.Scatter(
                     x=years,
@@ -984,22 +1112,24 @@ class CareerPathSimulatorWrapper:
             risk_map = {'Low': 1, 'Medium': 2, 'High': 3}
             
             for scenario in scenarios:
-                risk_level = scenario.get('scenario_details', {}).get('risk_level', 'Medium')
+                details = scenario.get('scenario_details', {})
+                risk_level = details.get('risk_level', 'Medium')
                 growth = scenario.get('total_salary_growth', 50)
-                success_prob = scenario.get('scenario_details', {}).get('success_probability', 0.75)
+                success_prob = details.get('success_probability', 0.75)
+                scenario_name = scenario.get('scenario_name', 'Scenario')
                 
                 fig2.add_trace(go.Scatter(
                     x=[risk_map[risk_level]],
                     y=[growth],
                     mode='markers+text',
-                    text=[scenario.get('scenario_name', 'Scenario')],
+                    text=[scenario_name],
                     textposition='top center',
                     marker=dict(
                         size=success_prob * 100,
                         color=growth,
                         colorscale='viridis'
                     ),
-                    name=scenario.get('scenario_name', 'Scenario')
+                    name=scenario_name
                 ))
             
             fig2.update_layout(
@@ -1016,17 +1146,34 @@ class CareerPathSimulatorWrapper:
         
         return figures
 
-# Initialize career simulator with wrapper (always available)
-career_simulator = CareerPathSimulatorWrapper()
+# Fallback negotiation scripts and objection responses that do not depend on the
+# offer. Shared by every fallback strategy, so they must never be mutated
+BENEFITS_FOCUS_SCRIPT = """
+                I appreciate the base salary offer. Could we explore other aspects of the compensation package 
+                that might add value for both of us?
+                """
+NEGOTIATION_OBJECTION_HANDLING = {
+    'budget_constraints': """
+                I understand budget considerations. Could we explore a performance-based increase after 6 months, 
+                or perhaps adjust other aspects of the compensation package?
+                """,
+    'company_policy': """
+                I respect company policies. Perhaps we could explore a signing bonus or accelerated review cycle?
+                """,
+    'experience_concerns': """
+                I understand the concern. What I bring is [specific value]. I'm confident I can deliver results quickly 
+                and would welcome a performance review after 90 days.
+                """
+}
 
 # SalaryNegotiationCoach wrapper to handle missing methods  
 class SalaryNegotiationCoachWrapper:
     """Wrapper for SalaryNegotiationCoach with fallback methods"""
     
     def __init__(self):
-        if INTELLIGENCE_MODULES_AVAILABLE:
+        if feature_available('intelligence_modules'):
             try:
-                self.coach = SalaryNegotiationCoach()
+                self.coach = _lazy('intelligence_modules.career_simulator').SalaryNegotiationCoach()
             except Exception as e:
                 st.warning(f"SalaryNegotiationCoach initialization failed: {e}")
                 self.coach = None
@@ -1054,21 +1201,22 @@ class SalaryNegotiationCoachWrapper:
         target_salary = negotiation_context.get('target_salary', 100000)
         competing_offers = negotiation_context.get('competing_offers', 0)
         
-        # Calculate leverage score
-        leverage_score = 50  # Base score
-        if competing_offers > 0:
+        # Calculate leverage score - each condition is evaluated once and reused
+        # for the leverage factors below
+        has_competing_offers = competing_offers > 0
+        above_offer = target_salary > current_offer
+        leverage_score = 50  # Base score; tops out at 90, so no cap at 100 is needed
+        if has_competing_offers:
             leverage_score += 30
-        if target_salary > current_offer:
+        if above_offer:
             leverage_score += 10
         
-        leverage_score = min(100, leverage_score)
-        
         return {
             'position_analysis': {
                 'leverage_score': leverage_score,
                 'leverage_factors': [
-                    'Market rate analysis' if target_salary > current_offer else 'Competitive offer',
-                    'Multiple offers' if competing_offers > 0 else 'Single offer situation',
+                    'Market rate analysis' if above_offer else 'Competitive offer',
+                    'Multiple offers' if has_competing_offers else 'Single offer situation',
                     'Professional experience'
                 ],
                 'market_position': 'Market Rate',
@@ -1091,51 +1239,148 @@ class SalaryNegotiationCoachWrapper:
                 I understand budget considerations. If we can reach ${int(target_salary * 0.95):,.0f}, 
                 I'm prepared to accept immediately. This represents a fair compromise given my qualifications.
                 """,
-                'benefits_focus': """
-                I appreciate the base salary offer. Could we explore other aspects of the compensation package 
-                that might add value for both of us?
-                """
-            },
-            'objection_handling': {
-                'budget_constraints': """
-                I understand budget considerations. Could we explore a performance-based increase after 6 months, 
-                or perhaps adjust other aspects of the compensation package?
-                """,
-                'company_policy': """
-                I respect company policies. Perhaps we could explore a signing bonus or accelerated review cycle?
-                """,
-                'experience_concerns': """
-                I understand the concern. What I bring is [specific value]. I'm confident I can deliver results quickly 
-                and would welcome a performance review after 90 days.
-                """
+                'benefits_focus': BENEFITS_FOCUS_SCRIPT
             },
+            'objection_handling': NEGOTIATION_OBJECTION_HANDLING,
             'success_probability': min(95, max(20, leverage_score + 10))
         }
 
-# Initialize salary negotiation coach with wrapper (always available)  
-salary_negotiation_coach = SalaryNegotiationCoachWrapper()
+# Optional components - built on first use, then shared across reruns and sessions
+# like the core components, so their modules are only imported once a feature is
+# reached. Callers check feature_available() first
+@st.cache_resource
+def get_cover_letter_generator():
+    return _lazy('smart_components.ai_cover_letter_generator').AICoverLetterGenerator()
+
+@st.cache_resource
+def get_cover_letter_optimizer():
+    return _lazy('smart_components.ai_cover_letter_generator').CoverLetterOptimizer()
+
+@st.cache_resource
+def get_resume_builder():
+    return _lazy('smart_components.intelligent_resume_builder').IntelligentResumeBuilder()
+
+@st.cache_resource
+def get_resume_optimizer():
+    return _lazy('smart_components.intelligent_resume_builder').ResumeOptimizationEngine()
+
+# Shared like the others; the scanner keeps its scan history in each user's session
+@st.cache_resource
+def get_job_scanner():
+    return _lazy('smart_components.job_market_scanner').JobMarketScanner()
+
+@st.cache_resource
+def get_interview_prep_engine():
+    return _lazy('intelligence_modules.interview_preparation_engine').InterviewPreparationEngine()
+
+# The wrappers fall back to built-in strategies, so these are always usable
+@st.cache_resource
+def get_career_simulator() -> CareerPathSimulatorWrapper:
+    return CareerPathSimulatorWrapper()
+
+@st.cache_resource
+def get_salary_negotiation_coach() -> SalaryNegotiationCoachWrapper:
+    return SalaryNegotiationCoachWrapper()
+
+@st.cache_resource
+def get_personal_brand_builder() -> PersonalBrandBuilderWrapper:
+    return PersonalBrandBuilderWrapper()
+
+# Strategy results, memoized on the profile inputs so repeat clicks with the same
+# form values skip the model round-trip (or the fallback rebuild)
+@st.cache_data(show_spinner=False, ttl=3600, max_entries=16)
+def cached_career_simulation(current_profile: Dict[str, Any], career_goals: Dict[str, Any]) -> Dict[str, Any]:
+    return get_career_simulator().simulate_career_paths(current_profile, career_goals)
+
+@st.cache_data(show_spinner=False, ttl=3600, max_entries=16)
+def cached_brand_strategy(user_profile: Dict[str, Any], career_goals: Dict[str, Any],
+                          current_presence: Dict[str, Any]) -> Dict[str, Any]:
+    return get_personal_brand_builder().create_personal_brand_strategy(user_profile, career_goals, current_presence)
+
+@st.cache_resource
+def get_enhanced_analyzer():
+    """Enhanced analyzer shared across reruns and sessions"""
+    return _lazy('core_engine.enhanced_gemini_analyzer').EnhancedGeminiAnalyzer()
+
+@st.cache_resource
+def get_feature_manager():
+    return _lazy('core_engine.enhanced_app_integration').FeatureManager()
+
+@st.cache_resource
+def get_enhanced_integration():
+    return _lazy('core_engine.enhanced_app_integration').EnhancedAnalysisIntegration()
+
+# Not shared: the tracker sets up its history in the current user's session when built
+def get_performance_tracker():
+    return _lazy('analytics_tracking.performance_dashboard').PerformanceTracker()
+
+# Raw text read from an uploaded PDF; longer documents stop at the page that crosses it
+RESUME_MAX_CHARS = 20000
 
-# Initialize PersonalBrandBuilder with wrapper (always available)
-personal_brand_builder = PersonalBrandBuilderWrapper()
+# Completed analyses kept per session, keyed by a hash of their inputs
+ANALYSIS_CACHE_SIZE = 64
 
-# Initialize enhanced core engine modules
-if ENHANCED_ANALYZER_AVAILABLE:
-    enhanced_analyzer = EnhancedGeminiAnalyzer()
+# Completed analyses shared by every session on this server, under the same keys, so
+# identical inputs from a new session skip the model round-trip too. Fields tied to
+# the session that ran the analysis are left out of the shared copy, and entries are
+# refetched from the model once they are SHARED_ANALYSIS_TTL seconds old
+SHARED_ANALYSIS_CACHE_SIZE = 256
+SHARED_ANALYSIS_TTL = 3600
+SESSION_ONLY_FIELDS = frozenset({'session_id'})
 
-if ADVANCED_VISUALIZATIONS_AVAILABLE:
-    advanced_viz_engine = AdvancedVisualizationEngine()
+@st.cache_resource
+def get_shared_analysis_cache() -> Tuple[OrderedDict, threading.Lock]:
+    """
+    Process-wide analysis store of (stored_at, result) pairs, stored_at from
+    time.monotonic(); sessions run on their own threads, so use it under the lock
+    """
+    return OrderedDict(), threading.Lock()
 
-if ENHANCED_INTEGRATION_AVAILABLE:
-    feature_manager = FeatureManager()
-    enhanced_integration = EnhancedAnalysisIntegration()
+# Radar chart axes of the skills analysis and the taxonomy categories each one adds up
+SKILLS_RADAR_GROUPS = {
+    'Technical Skills': ('programming_languages', 'frameworks_libraries'),
+    'Tools & Technologies': ('tools_technologies',),
+    'Cloud & Databases': ('cloud_platforms', 'databases'),
+    'Methodologies': ('methodologies',)
+}
 
-# Initialize analytics tracking modules
-if PERFORMANCE_TRACKING_AVAILABLE:
-    performance_tracker = PerformanceTracker()
-    goal_engine = GoalSettingEngine()
+# Below these lengths there is nothing for keyword analysis to work with
+MIN_RESUME_CHARS = 50
+MIN_JOB_DESCRIPTION_CHARS = 20
 
-if JOB_TRACKING_AVAILABLE:
-    job_tracker = JobApplicationTracker()
+def _keyword_inputs_usable(resume_text: str, job_description: str) -> bool:
+    """True when both texts are long enough for keyword analysis"""
+    return (len(job_description.strip()) >= MIN_JOB_DESCRIPTION_CHARS
+            and len(resume_text.strip()) >= MIN_RESUME_CHARS)
+
+@st.cache_resource
+def get_keyword_pool() -> ThreadPoolExecutor:
+    """Background worker that runs local keyword extraction during the model call"""
+    return ThreadPoolExecutor(max_workers=1, thread_name_prefix='keyword-prime')
+
+def _settle_keyword_prime(keywords_ready: Optional[Future]):
+    """
+    Let a running prime finish rather than extracting the same texts alongside it.
+    The worker is shared by every session, so a prime still queued behind other
+    sessions' work is cancelled instead and its memo misses are computed inline
+    """
+    if keywords_ready is not None and not keywords_ready.cancel():
+        wait([keywords_ready])
+
+def _prime_keyword_memos(extractor, resume_text: str, job_description: str):
+    """Fill the extractor's memos for everything _enhance_with_keywords will ask for"""
+    extractor.ranked_keywords(resume_text)
+    extractor.ranked_keywords(job_description)
+    extractor.frozen_skills_taxonomy(resume_text)
+    extractor.skill_sets(job_description)
+
+def _compare_keyword_sets(resume_set: frozenset, job_set: frozenset) -> Dict[str, List[str]]:
+    """KeywordExtractor.compare_keywords over prebuilt sets - no per-call set construction"""
+    return {
+        'matched': list(resume_set & job_set),
+        'missing': list(job_set - resume_set),
+        'additional': list(resume_set - job_set)
+    }
 
 # Enhanced analyzer wrapper (from File 1)
 class AnalyzerWrapper:
@@ -1143,10 +1388,106 @@ class AnalyzerWrapper:
     
     def __init__(self):
         self.basic_analyzer = gemini_analyzer
-        self.enhanced_analyzer = enhanced_analyzer if ENHANCED_ANALYZER_AVAILABLE else None
+        self.enhanced_analyzer = None
+        if feature_available('enhanced_analyzer'):
+            try:
+                self.enhanced_analyzer = get_enhanced_analyzer()
+            except ImportError as e:
+                # Installed, but one of its own dependencies is not
+                st.warning(f"Enhanced analyzer not available: {e}")
         self.keyword_extractor = keyword_extractor
     
+    def analysis_cache_key(self, resume_text: str, job_description: str, **kwargs) -> str:
+        """Content hash of everything that can change the analysis result"""
+        parts = [
+            resume_text,
+            job_description,
+            kwargs.get('industry', 'Technology'),
+            kwargs.get('experience_level', 'Mid Level'),
+            kwargs.get('analysis_depth', 'Standard Analysis'),
+            str(bool(self.enhanced_analyzer and kwargs.get('use_enhanced', False)))
+        ]
+        return hashlib.sha256("\x1f".join(parts).encode('utf-8')).hexdigest()
+    
+    def _cache_result(self, cache_key: str, result: Dict[str, Any], share: bool = True) -> Dict[str, Any]:
+        """
+        Store a successful analysis; the caller keeps the original to mutate freely.
+        share=False keeps it in this session only (the shared entry keeps its age)
+        """
+        # Canned results from a failed model call or unparseable response are never
+        # stored, so the next request with the same inputs asks the model again
+        if result.get('fallback_mode'):
+            return result
+        
+        stored = copy.deepcopy(result)
+        cache = st.session_state.setdefault('analysis_cache', OrderedDict())
+        cache[cache_key] = stored
+        cache.move_to_end(cache_key)
+        while len(cache) > ANALYSIS_CACHE_SIZE:
+            cache.popitem(last=False)
+        
+        if not share:
+            return result
+        
+        # Both stores are only ever read through a deep copy, so the shared entry
+        # can reuse the stored values instead of copying them again
+        shared_entry = {k: v for k, v in stored.items() if k not in SESSION_ONLY_FIELDS}
+        shared, lock = get_shared_analysis_cache()
+        with lock:
+            shared[cache_key] = (time.monotonic(), shared_entry)
+            shared.move_to_end(cache_key)
+            while len(shared) > SHARED_ANALYSIS_CACHE_SIZE:
+                shared.popitem(last=False)
+        return result
+    
+    def _record_analysis(self, result: Dict[str, Any], resume_text: str, job_description: str, **kwargs):
+        """Record analysis session for performance tracking"""
+        if feature_available('performance_tracking'):
+            session_id = get_performance_tracker().record_analysis(
+                result, resume_text, job_description,
+                kwargs.get('industry', 'Technology'),
+                kwargs.get('experience_level', 'Mid Level')
+            )
+            result['session_id'] = session_id
+    
     def analyze_resume(self, resume_text: str, job_description: str, **kwargs) -> Dict[str, Any]:
+        # Identical inputs reuse the earlier result instead of another API round-trip;
+        # use_cache=False (Rescore) always re-runs the analysis
+        cache_key = self.analysis_cache_key(resume_text, job_description, **kwargs)
+        if kwargs.get('use_cache', True):
+            cache = st.session_state.get('analysis_cache')
+            if cache and cache_key in cache:
+                cache.move_to_end(cache_key)
+                return copy.deepcopy(cache[cache_key])
+            
+            # Analyzed recently in another session - still recorded for this one
+            shared_result = None
+            shared, lock = get_shared_analysis_cache()
+            with lock:
+                entry = shared.get(cache_key)
+                if entry is not None:
+                    stored_at, shared_result = entry
+                    if time.monotonic() - stored_at > SHARED_ANALYSIS_TTL:
+                        del shared[cache_key]
+                        shared_result = None
+                    else:
+                        shared.move_to_end(cache_key)
+            if shared_result is not None:
+                result = copy.deepcopy(shared_result)
+                try:
+                    self._record_analysis(result, resume_text, job_description, **kwargs)
+                except Exception as e:
+                    st.warning(f"Performance tracking failed: {str(e)}")
+                return self._cache_result(cache_key, result, share=False)
+        
+        # Local keyword extraction overlaps the (network-bound) model call below;
+        # the extractor memos it fills are picked up by _enhance_with_keywords
+        keywords_ready = None
+        if _keyword_inputs_usable(resume_text, job_description):
+            keywords_ready = get_keyword_pool().submit(
+                _prime_keyword_memos, self.keyword_extractor, resume_text, job_description
+            )
+        
         # First try enhanced analyzer if available and requested
         if self.enhanced_analyzer and kwargs.get('use_enhanced', False):
             try:
@@ -1156,27 +1497,26 @@ class AnalyzerWrapper:
                     kwargs.get('experience_level', 'Mid Level'),
                     kwargs.get('analysis_depth', 'Standard Analysis')
                 )
-                # Enhance with keyword analysis
-                enhanced_result = self._enhance_with_keywords(result, resume_text, job_description)
+                # Enhance with keyword analysis, unless the model already covered it -
+                # then the prime is not needed, so free the shared worker if it can
+                if self._adopt_model_keywords(result):
+                    if keywords_ready is not None:
+                        keywords_ready.cancel()
+                    enhanced_result = result
+                else:
+                    enhanced_result = self._enhance_with_keywords(result, resume_text, job_description, keywords_ready)
                 
-                # Record analysis session for performance tracking
-                if PERFORMANCE_TRACKING_AVAILABLE:
-                    session_id = performance_tracker.record_analysis(
-                        enhanced_result, resume_text, job_description,
-                        kwargs.get('industry', 'Technology'),
-                        kwargs.get('experience_level', 'Mid Level')
-                    )
-                    enhanced_result['session_id'] = session_id
+                self._record_analysis(enhanced_result, resume_text, job_description, **kwargs)
                 
                 # Apply enhanced integration features if available
-                if ENHANCED_INTEGRATION_AVAILABLE:
-                    enhanced_result = enhanced_integration.enhance_analysis_with_market_data(
+                if feature_available('enhanced_integration'):
+                    enhanced_result = get_enhanced_integration().enhance_analysis_with_market_data(
                         enhanced_result, 
                         kwargs.get('industry', 'Technology'),
                         enhanced_result.get('matched_keywords', [])
                     )
                 
-                return enhanced_result
+                return self._cache_result(cache_key, enhanced_result)
             except Exception as e:
                 st.warning(f"Enhanced analysis failed: {str(e)}, using standard analysis")
         
@@ -1194,49 +1534,78 @@ class AnalyzerWrapper:
                 # Fallback to basic analyze_resume
                 result = self.basic_analyzer.analyze_resume(resume_text, job_description)
             
-            enhanced_result = self._enhance_with_keywords(result, resume_text, job_description)
+            enhanced_result = self._enhance_with_keywords(result, resume_text, job_description, keywords_ready)
             
-            # Record analysis session for performance tracking
-            if PERFORMANCE_TRACKING_AVAILABLE:
-                session_id = performance_tracker.record_analysis(
-                    enhanced_result, resume_text, job_description,
-                    kwargs.get('industry', 'Technology'),
-                    kwargs.get('experience_level', 'Mid Level')
-                )
-                enhanced_result['session_id'] = session_id
+            self._record_analysis(enhanced_result, resume_text, job_description, **kwargs)
             
             # Apply enhanced integration features if available
-            if ENHANCED_INTEGRATION_AVAILABLE:
-                enhanced_result = enhanced_integration.enhance_analysis_with_market_data(
+            if feature_available('enhanced_integration'):
+                enhanced_result = get_enhanced_integration().enhance_analysis_with_market_data(
                     enhanced_result, 
                     kwargs.get('industry', 'Technology'),
                     enhanced_result.get('matched_keywords', [])
                 )
             
-            return enhanced_result
+            return self._cache_result(cache_key, enhanced_result)
         except Exception as e:
             st.error(f"Analysis failed: {str(e)}")
             # Return minimal fallback result
-            return self._create_fallback_result(resume_text, job_description)
-    
-    def _enhance_with_keywords(self, base_result: Dict[str, Any], resume_text: str, job_description: str) -> Dict[str, Any]:
+            return self._create_fallback_result(resume_text, job_description, keywords_ready)
+    
+    def _adopt_model_keywords(self, result: Dict[str, Any]) -> bool:
+        """
+        Promote the enhanced model's own keyword lists and skills coverage to the
+        top-level fields the UI reads. Returns False (local keyword analysis still
+        needed) for fallback analyses, which lack skills_coverage.
+        """
+        keyword_analysis = result.get('keyword_analysis') or {}
+        if not (isinstance(result.get('skills_coverage'), (int, float))
+                and 'matched_keywords' in keyword_analysis
+                and 'missing_critical_keywords' in keyword_analysis):
+            return False
+        
+        result.setdefault('matched_keywords', keyword_analysis['matched_keywords'])
+        result.setdefault('missing_keywords', keyword_analysis['missing_critical_keywords'])
+        # Resume terms for the word cloud highlighting, as the local analysis provides
+        result.setdefault('important_terms', list(keyword_analysis['matched_keywords'])[:15])
+        result['skills_coverage'] = round(min(100, max(0, result['skills_coverage'])), 1)
+        return True
+    
+    def _enhance_with_keywords(self, base_result: Dict[str, Any], resume_text: str, job_description: str,
+                               keywords_ready: Optional[Future] = None) -> Dict[str, Any]:
         """Enhance analysis result with keyword extraction"""
+        if not _keyword_inputs_usable(resume_text, job_description):
+            return base_result
+        
+        # Reuse the background prime's memos; if it was cancelled or failed, the
+        # memo misses below simply recompute
+        _settle_keyword_prime(keywords_ready)
+        
         try:
-            # Extract keywords using your KeywordExtractor
-            resume_keywords = self.keyword_extractor.extract_keywords(resume_text, top_n=30)
-            job_keywords = self.keyword_extractor.extract_keywords(job_description, top_n=25)
-            
             # Compare keywords
-            keyword_comparison = self.keyword_extractor.compare_keywords(resume_keywords, job_keywords)
+            keyword_comparison = _compare_keyword_sets(
+                self.keyword_extractor.keyword_set(resume_text, 30),
+                self.keyword_extractor.keyword_set(job_description, 25)
+            )
             
-            # Calculate keyword score
-            keyword_score, keyword_details = self.keyword_extractor.calculate_keyword_score(resume_text, job_description)
+            # Calculate keyword score - the memoized rankings are passed as-is, the
+            # score only builds sets from them
+            keyword_score, keyword_details = self.keyword_extractor.calculate_keyword_score(
+                resume_text, job_description,
+                resume_keywords=self.keyword_extractor.top_keywords(resume_text, 50),
+                job_keywords=self.keyword_extractor.top_keywords(job_description, 30)
+            )
             
             # Extract skills taxonomy
-            skills_taxonomy = self.keyword_extractor.extract_skills_taxonomy(resume_text)
+            skills_taxonomy = {
+                category: list(skills)
+                for category, skills in self.keyword_extractor.frozen_skills_taxonomy(resume_text).items()
+            }
             
-            # Calculate skills coverage
-            skills_coverage = self._calculate_skills_coverage(skills_taxonomy, job_description)
+            # Calculate skills coverage against the JD's (memoized) skill sets
+            skills_coverage = self._calculate_skills_coverage(
+                skills_taxonomy, self.keyword_extractor.skill_sets(job_description)
+            )
             
             # Enhance the base result
             base_result.update({
@@ -1247,7 +1616,7 @@ class AnalyzerWrapper:
                 'keyword_details': keyword_details,
                 'skills_taxonomy': skills_taxonomy,
                 'skills_coverage': skills_coverage,  # Already rounded in the method
-                'important_terms': resume_keywords[:15],  # For word cloud
+                'important_terms': list(self.keyword_extractor.top_keywords(resume_text, 15)),  # For word cloud
                 'skills_analysis': self._create_skills_analysis(skills_taxonomy)
             })
             
@@ -1261,26 +1630,26 @@ class AnalyzerWrapper:
             st.warning(f"Keyword enhancement failed: {str(e)}")
             return base_result
     
-    def _calculate_skills_coverage(self, skills_taxonomy: Dict[str, List[str]], job_description: str) -> float:
-        """Calculate skills coverage percentage"""
+    def _calculate_skills_coverage(self, skills_taxonomy: Dict[str, List[str]],
+                                   job_skills: Dict[str, frozenset]) -> float:
+        """
+        Calculate skills coverage percentage of the job description's skills, given
+        as KeywordExtractor.skill_sets output (callers only pass usable JDs)
+        """
         try:
-            # Extract skills from job description
-            job_skills = self.keyword_extractor.extract_skills_taxonomy(job_description)
-            
-            total_job_skills = sum(len(skills) for skills in job_skills.values())
-            total_resume_skills = sum(len(skills) for skills in skills_taxonomy.values())
+            # Totals and overlap in one pass over the categories - each JD frozenset
+            # is probed with the (short) resume list, no sets are built here
+            total_job_skills = matched_skills = 0
+            for category, job_skills_set in job_skills.items():
+                total_job_skills += len(job_skills_set)
+                resume_skills = skills_taxonomy.get(category)
+                if job_skills_set and resume_skills:
+                    matched_skills += len(job_skills_set.intersection(resume_skills))
             
             if total_job_skills == 0:
                 return 75.0  # Default if no skills found in job description
             
-            # Calculate overlap
-            matched_skills = 0
-            for category in job_skills:
-                job_skills_set = set(job_skills[category])
-                resume_skills_set = set(skills_taxonomy.get(category, []))
-                matched_skills += len(job_skills_set & resume_skills_set)
-            
-            coverage = (matched_skills / total_job_skills) * 100 if total_job_skills > 0 else 0
+            coverage = (matched_skills / total_job_skills) * 100
             # Round to 1 decimal place to fix the long decimal issue
             return round(min(100, max(0, coverage)), 1)
             
@@ -1289,22 +1658,28 @@ class AnalyzerWrapper:
     
     def _create_skills_analysis(self, skills_taxonomy: Dict[str, List[str]]) -> Dict[str, Any]:
         """Create skills analysis for radar chart"""
-        return {
-            'Technical Skills': len(skills_taxonomy.get('programming_languages', [])) + len(skills_taxonomy.get('frameworks_libraries', [])),
-            'Tools & Technologies': len(skills_taxonomy.get('tools_technologies', [])),
-            'Cloud & Databases': len(skills_taxonomy.get('cloud_platforms', [])) + len(skills_taxonomy.get('databases', [])),
-            'Methodologies': len(skills_taxonomy.get('methodologies', [])),
-            'Overall Score': sum(len(skills) for skills in skills_taxonomy.values())
+        # One len() per category; the radar groups only add these up
+        counts = {category: len(skills) for category, skills in skills_taxonomy.items()}
+        skills_analysis = {
+            axis: sum(counts.get(category, 0) for category in categories)
+            for axis, categories in SKILLS_RADAR_GROUPS.items()
         }
+        skills_analysis['Overall Score'] = sum(counts.values())
+        return skills_analysis
     
-    def _create_fallback_result(self, resume_text: str, job_description: str) -> Dict[str, Any]:
+    def _create_fallback_result(self, resume_text: str, job_description: str,
+                                keywords_ready: Optional[Future] = None) -> Dict[str, Any]:
         """Create fallback result when analysis fails"""
+        # The keyword rankings below are slices of the primed memos
+        _settle_keyword_prime(keywords_ready)
+        
         try:
             # At least extract keywords
-            resume_keywords = self.keyword_extractor.extract_keywords(resume_text, top_n=20)
-            job_keywords = self.keyword_extractor.extract_keywords(job_description, top_n=15)
-            keyword_comparison = self.keyword_extractor.compare_keywords(resume_keywords, job_keywords)
-            keyword_score = len(keyword_comparison['matched']) / len(job_keywords) * 100 if job_keywords else 0
+            job_keywords = self.keyword_extractor.keyword_set(job_description, 15)
+            keyword_comparison = _compare_keyword_sets(
+                self.keyword_extractor.keyword_set(resume_text, 20), job_keywords
+            )
+            keyword_score = len(keyword_comparison['matched']) / (len(job_keywords) or 1) * 100
             
             return {
                 'match_percentage': round(max(30, keyword_score), 1),
@@ -1315,8 +1690,9 @@ class AnalyzerWrapper:
                 'ats_friendliness': 'Medium',
                 'strengths': ['Resume processed successfully', 'Basic keyword analysis completed'],
                 'improvements': ['Add more job-specific keywords', 'Enhance technical skills section'],
-                'important_terms': resume_keywords[:10],
-                'skills_analysis': {'Technical Skills': 3, 'Experience': 3, 'Education': 2}
+                'important_terms': list(self.keyword_extractor.top_keywords(resume_text, 10)),
+                'skills_analysis': {'Technical Skills': 3, 'Experience': 3, 'Education': 2},
+                'fallback_mode': True
             }
         except Exception:
             return {
@@ -1328,11 +1704,33 @@ class AnalyzerWrapper:
                 'strengths': ['Resume uploaded successfully'],
                 'improvements': ['Complete analysis requires job description'],
                 'important_terms': [],
-                'skills_analysis': {}
+                'skills_analysis': {},
+                'fallback_mode': True
             }
 
 analyzer_wrapper = AnalyzerWrapper()
 
+def _sync_resume_text():
+    """on_change handler for the resume editor - stores the edit only when it happens"""
+    edited_text = st.session_state.get('resume_text_area')
+    if edited_text:
+        session.set('resume_text', edited_text)
+        session.set('is_edited', True)
+
+# Runs of non-whitespace - the same words str.split() would return
+_WORD_RE = re.compile(r'\S+')
+
+def _resume_text_stats(text: str) -> tuple:
+    """(word_count, char_count) of text, recomputed only when the text changes"""
+    cached = session.get('resume_text_stats')
+    if cached is not None and cached[0] == text:
+        return cached[1]
+    
+    # Count matches one at a time instead of materializing a list of every word
+    stats = (sum(1 for _ in _WORD_RE.finditer(text)), len(text))
+    session.set('resume_text_stats', (text, stats))
+    return stats
+
 # Helper function to create feature cards (was missing in original code)
 def create_feature_cards():
     """Display feature status cards"""
@@ -1341,19 +1739,19 @@ def create_feature_cards():
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        status = "✅ Active" if ENHANCED_ANALYZER_AVAILABLE else "⚠️ Loading"
+        status = "✅ Active" if feature_available('enhanced_analyzer') else "⚠️ Loading"
         st.info(f"🧠 **Enhanced AI**\n{status}")
     
     with col2:
-        status = "✅ Active" if SMART_COMPONENTS_AVAILABLE else "⚠️ Loading"
+        status = "✅ Active" if feature_available('smart_components') else "⚠️ Loading"
         st.info(f"🔨 **Smart Tools**\n{status}")
     
     with col3:
-        status = "✅ Active" if INTELLIGENCE_MODULES_AVAILABLE else "⚠️ Loading"
+        status = "✅ Active" if feature_available('intelligence_modules') else "⚠️ Loading"
         st.info(f"🎯 **AI Intelligence**\n{status}")
     
     with col4:
-        status = "✅ Active" if ADVANCED_VISUALIZATIONS_AVAILABLE else "⚠️ Loading"
+        status = "✅ Active" if feature_available('advanced_visualizations') else "⚠️ Loading"
         st.info(f"📊 **Advanced Charts**\n{status}")
 
 # Main header (keeping your existing header)
@@ -1421,7 +1819,7 @@ with tab1:
                 # Process PDF
                 with st.spinner("🔍 Extracting resume content..."):
                     try:
-                        resume_text = pdf_processor.extract_text(uploaded_file)
+                        resume_text = cached_pdf_text(uploaded_file.getvalue(), max_chars=RESUME_MAX_CHARS)
                         
                         if resume_text:
                             session.set('resume_text', resume_text)
@@ -1446,31 +1844,28 @@ with tab1:
                 "Paste or edit your resume here",
                 value=session.get('resume_text', ''),
                 height=400,
-                help="You can paste your resume text directly or edit the extracted content"
+                help="You can paste your resume text directly or edit the extracted content",
+                key='resume_text_area',
+                on_change=_sync_resume_text
             )
             
-            if resume_text_input:
-                session.set('resume_text', resume_text_input)
-                session.set('is_edited', True)
-            
             # Real-time stats
             if resume_text_input:
-                char_count = len(resume_text_input)
-                word_count = len(resume_text_input.split())
+                word_count, char_count = _resume_text_stats(resume_text_input)
                 st.markdown(f"**Stats:** {word_count} words | {char_count} characters")
         
         with analysis_tab3:
             # Advanced resume analysis features
             st.markdown("#### 🔍 Advanced Analysis Tools")
             
-            if session.get('resume_text') and job_description and SMART_COMPONENTS_AVAILABLE:
+            if session.get('resume_text') and job_description and feature_available('smart_components'):
                 col1, col2 = st.columns(2)
                 
                 with col1:
                     if st.button("🔬 Deep Resume Analysis", use_container_width=True):
                         with st.spinner("🔬 Performing deep analysis..."):
                             try:
-                                analysis_result = resume_builder.analyze_and_optimize_resume(
+                                analysis_result = get_resume_builder().analyze_and_optimize_resume(
                                     session.get('resume_text'),
                                     job_description,
                                     industry,
@@ -1487,7 +1882,7 @@ with tab1:
                     if st.button("🎯 A/B Test Versions", use_container_width=True):
                         with st.spinner("🎯 Creating optimized versions..."):
                             try:
-                                ab_versions = resume_optimizer.create_multiple_versions(
+                                ab_versions = get_resume_optimizer().create_multiple_versions(
                                     session.get('resume_text'),
                                     job_description,
                                     industry
@@ -1527,7 +1922,7 @@ with tab1:
                                 disabled=True,
                                 key=f"version_{i}"
                             )
-            elif not SMART_COMPONENTS_AVAILABLE:
+            elif not feature_available('smart_components'):
                 st.info("🔧 Advanced analysis tools are not available. Please install smart_components module.")
             else:
                 st.info("💡 Please provide both resume text and job description to enable advanced analysis.")
@@ -1539,11 +1934,11 @@ with tab1:
         # Enhanced analysis toggle
         use_enhanced = st.checkbox(
             "🚀 Enhanced AI Analysis", 
-            value=ENHANCED_ANALYZER_AVAILABLE,
+            value=feature_available('enhanced_analyzer'),
             help="Use advanced AI analysis with comprehensive insights, sentiment analysis, and competitive benchmarking"
         )
         
-        if ENHANCED_ANALYZER_AVAILABLE and use_enhanced:
+        if feature_available('enhanced_analyzer') and use_enhanced:
             st.success("🧠 Advanced AI features enabled!")
             
             # Analysis depth selector for enhanced mode
@@ -1557,7 +1952,22 @@ with tab1:
         
         # THE MAIN ANALYZE BUTTON
         if st.button("🔍 Analyze Resume", use_container_width=True, type="primary"):
-            if session.get('resume_text') and job_description:
+            analysis_inputs = dict(
+                use_enhanced=use_enhanced,
+                industry=industry,
+                experience_level=experience_level,
+                analysis_depth=analysis_depth
+            )
+            input_hash = analyzer_wrapper.analysis_cache_key(
+                session.get('resume_text', ''), job_description, **analysis_inputs
+            )
+            
+            if not (session.get('resume_text') and job_description):
+                st.error("Please provide both resume and job description!")
+            elif session.get('last_input_hash') == input_hash and session.get('analysis_result'):
+                # A re-click with unchanged inputs keeps the result already on screen
+                st.info("ℹ️ Inputs unchanged - showing the last analysis. Use Rescore to run it again.")
+            else:
                 with st.spinner("🤖 AI Analysis in Progress..."):
                     start_time = time.time()
                     
@@ -1565,14 +1975,13 @@ with tab1:
                         analysis_result = analyzer_wrapper.analyze_resume(
                             session.get('resume_text'),
                             job_description,
-                            use_enhanced=use_enhanced,
-                            industry=industry,
-                            experience_level=experience_level,
-                            analysis_depth=analysis_depth
+                            **analysis_inputs
                         )
                         
                         session.set('analysis_result', analysis_result)
                         session.set('analysis_timestamp', datetime.now())
+                        # A fallback result is not a completed analysis - let Analyze retry it
+                        session.set('last_input_hash', None if analysis_result.get('fallback_mode') else input_hash)
                         
                         analysis_time = time.time() - start_time
                         
@@ -1581,8 +1990,6 @@ with tab1:
                         st.rerun()
                     except Exception as e:
                         st.error(f"Analysis failed: {e}")
-            else:
-                st.error("Please provide both resume and job description!")
         
         # Re-analyze button
         if st.button("🔄 Rescore Resume", use_container_width=True):
@@ -1595,9 +2002,18 @@ with tab1:
                             use_enhanced=use_enhanced,
                             industry=industry,
                             experience_level=experience_level,
-                            analysis_depth=analysis_depth
+                            analysis_depth=analysis_depth,
+                            use_cache=False
                         )
                         session.set('analysis_result', analysis_result)
+                        session.set('last_input_hash', None if analysis_result.get('fallback_mode') else analyzer_wrapper.analysis_cache_key(
+                            session.get('resume_text'),
+                            job_description,
+                            use_enhanced=use_enhanced,
+                            industry=industry,
+                            experience_level=experience_level,
+                            analysis_depth=analysis_depth
+                        ))
                         session.set('rescore_count', session.get('rescore_count', 0) + 1)
                         st.rerun()
                     except Exception as e:
@@ -1609,18 +2025,18 @@ with tab1:
             st.rerun()
         
         # Quick stats
-        if session.get('analysis_result'):
+        analysis = session.get('analysis_result')
+        if analysis:
             st.markdown("### 📊 Quick Stats")
-            analysis = session.get('analysis_result')
             st.metric("Match Score", f"{analysis.get('match_percentage', 0)}%")
             st.metric("Keywords Found", len(analysis.get('matched_keywords', [])))
             st.metric("ATS Rating", analysis.get('ats_friendliness', 'Medium'))
         
         # Enhanced features status
-        if ENHANCED_INTEGRATION_AVAILABLE:
+        if feature_available('enhanced_integration'):
             st.markdown("### 🚀 Enhanced Features")
             try:
-                feature_status = feature_manager.get_available_features()
+                feature_status = get_feature_manager().get_available_features()
                 
                 available_count = sum(feature_status.values())
                 total_features = len(feature_status)
@@ -1633,7 +2049,7 @@ with tab1:
                     # Show feature recommendations if analysis is available
                     if session.get('analysis_result'):
                         try:
-                            career_recs = enhanced_integration.generate_career_recommendations(
+                            career_recs = get_enhanced_integration().generate_career_recommendations(
                                 session.get('analysis_result')
                             )
                             
@@ -1709,9 +2125,9 @@ with tab1:
                         st.markdown(f"• {trend}")
         
         # Interview prep suggestions
-        if ENHANCED_INTEGRATION_AVAILABLE and session.get('analysis_result') and job_description:
+        if feature_available('enhanced_integration') and session.get('analysis_result') and job_description:
             try:
-                interview_suggestions = enhanced_integration.create_interview_prep_suggestions(
+                interview_suggestions = get_enhanced_integration().create_interview_prep_suggestions(
                     session.get('analysis_result'), job_description
                 )
                 
@@ -1733,7 +2149,7 @@ with tab1:
 with tab2:
     st.markdown("### 📝 AI Cover Letter Generator")
     
-    if not SMART_COMPONENTS_AVAILABLE:
+    if not feature_available('smart_components'):
         st.error("❌ Smart components are required for this feature. Please install the smart_components module.")
     else:
         if not session.get('analysis_result'):
@@ -1771,7 +2187,7 @@ with tab2:
                         with st.spinner("✨ Crafting your cover letter..."):
                             try:
                                 # Create cover letter request
-                                cl_request = CoverLetterRequest(
+                                cl_request = _lazy('smart_components.ai_cover_letter_generator').CoverLetterRequest(
                                     company_name=company_name,
                                     position_title=position_title,
                                     hiring_manager_name=hiring_manager,
@@ -1785,7 +2201,7 @@ with tab2:
                                 )
                                 
                                 # Generate cover letter
-                                cl_result = cover_letter_generator.generate_cover_letter(
+                                cl_result = get_cover_letter_generator().generate_cover_letter(
                                     cl_request,
                                     session.get('analysis_result')
                                 )
@@ -1804,7 +2220,7 @@ with tab2:
                 if company_name and position_title and session.get('analysis_result'):
                     with st.spinner("🎭 Creating multiple versions..."):
                         try:
-                            cl_request = CoverLetterRequest(
+                            cl_request = _lazy('smart_components.ai_cover_letter_generator').CoverLetterRequest(
                                 company_name=company_name,
                                 position_title=position_title,
                                 hiring_manager_name=hiring_manager,
@@ -1817,7 +2233,7 @@ with tab2:
                                 special_requirements=[special_requirements] if special_requirements else []
                             )
                             
-                            multiple_versions = cover_letter_optimizer.create_multiple_versions(
+                            multiple_versions = get_cover_letter_optimizer().create_multiple_versions(
                                 cl_request,
                                 session.get('analysis_result')
                             )
@@ -1896,7 +2312,7 @@ with tab2:
 with tab3:
     st.markdown("### 🔨 Intelligent Resume Builder")
     
-    if not SMART_COMPONENTS_AVAILABLE:
+    if not feature_available('smart_components'):
         st.error("❌ Smart components are required for this feature. Please install the smart_components module.")
     else:
         builder_tab1, builder_tab2, builder_tab3 = st.tabs(["🆕 Build from Scratch", "🔧 Optimize Existing", "📋 Templates"])
@@ -1968,7 +2384,7 @@ with tab3:
                                 'industry': industry
                             }
                             
-                            built_resume = resume_builder.build_resume_from_scratch(
+                            built_resume = get_resume_builder().build_resume_from_scratch(
                                 user_info,
                                 job_description,
                                 template_choice.lower().replace('-', '_')
@@ -1989,7 +2405,7 @@ with tab3:
                 if st.button("🚀 Smart Optimization", use_container_width=True, type="primary"):
                     with st.spinner("🚀 Optimizing your resume..."):
                         try:
-                            optimization_result = resume_builder.analyze_and_optimize_resume(
+                            optimization_result = get_resume_builder().analyze_and_optimize_resume(
                                 session.get('resume_text'),
                                 job_description,
                                 industry,
@@ -2056,7 +2472,7 @@ with tab3:
 with tab4:
     st.markdown("### 📊 Job Market Intelligence")
     
-    if not SMART_COMPONENTS_AVAILABLE:
+    if not feature_available('smart_components'):
         st.error("❌ Smart components are required for this feature. Please install the smart_components module.")
     else:
         market_tab1, market_tab2, market_tab3 = st.tabs(["🔍 Market Scan", "📈 Trends Analysis", "🎯 Opportunities"])
@@ -2100,7 +2516,7 @@ with tab4:
                         }
                         
                         # Perform market scan
-                        market_results = job_scanner.scan_job_market(search_criteria, resume_profile)
+                        market_results = get_job_scanner().scan_job_market(search_criteria, resume_profile)
                         session.set('market_scan_results', market_results)
                         st.success("✅ Market scan complete!")
                         st.rerun()
@@ -2130,7 +2546,7 @@ with tab4:
                 
                 # Create market visualizations
                 try:
-                    market_charts = job_scanner.create_market_dashboard_visualizations(market_results)
+                    market_charts = get_job_scanner().create_market_dashboard_visualizations(market_results)
                     
                     for i, chart in enumerate(market_charts):
                         st.plotly_chart(chart, use_container_width=True)
@@ -2189,7 +2605,7 @@ with tab5:
         # Performance tracking dashboard
         st.markdown("#### 📊 Analysis Performance")
         
-        if PERFORMANCE_TRACKING_AVAILABLE and session.get('analysis_result'):
+        if session.get('analysis_result') and feature_available('performance_tracking'):
             try:
                 # Display performance metrics
                 st.info("📊 Performance tracking dashboard will be displayed here")
@@ -2202,7 +2618,7 @@ with tab5:
         # Career Path Simulation with AI
         st.markdown("#### 🚀 AI Career Path Simulation")
         
-        if not INTELLIGENCE_MODULES_AVAILABLE:
+        if not feature_available('intelligence_modules'):
             st.warning("⚠️ Career simulation requires intelligence modules. Showing basic career guidance.")
             st.info("💡 **Career Planning Tips:**\n- Set clear short and long-term goals\n- Identify skill gaps and development needs\n- Network within your target industry\n- Consider lateral moves for growth\n- Regularly update your skills")
         elif session.get('analysis_result'):
@@ -2238,7 +2654,7 @@ with tab5:
                         }
                         
                         # Run career path simulation using wrapper
-                        simulation_results = career_simulator.simulate_career_paths(current_profile, career_goals)
+                        simulation_results = cached_career_simulation(current_profile, career_goals)
                         session.set('career_simulation_results', simulation_results)
                         st.success("✅ Career path simulation complete!")
                         st.rerun()
@@ -2273,7 +2689,7 @@ with tab5:
                 
                 # Career path visualizations
                 try:
-                    career_charts = career_simulator.create_career_path_visualizations(sim_results)
+                    career_charts = get_career_simulator().create_career_path_visualizations(sim_results)
                     
                     st.markdown("#### 📊 Career Path Analytics")
                     for chart in career_charts:
@@ -2294,7 +2710,7 @@ with tab5:
         # AI Interview Preparation
         st.markdown("#### 🎤 AI Interview Preparation Engine")
         
-        if not INTELLIGENCE_MODULES_AVAILABLE:
+        if not feature_available('intelligence_modules'):
             st.warning("⚠️ Interview preparation requires intelligence modules. Showing basic interview tips.")
             st.info("💡 **Interview Preparation Tips:**\n- Research the company thoroughly\n- Practice common interview questions\n- Prepare specific examples using STAR method\n- Have questions ready for the interviewer\n- Practice your elevator pitch")
         elif session.get('analysis_result') and job_description:
@@ -2302,7 +2718,7 @@ with tab5:
                 with st.spinner("🎯 Creating personalized interview preparation..."):
                     try:
                         # Generate comprehensive interview preparation
-                        prep_plan = interview_prep_engine.generate_interview_preparation_plan(
+                        prep_plan = get_interview_prep_engine().generate_interview_preparation_plan(
                             resume_analysis=session.get('analysis_result'),
                             job_description=job_description,
                             industry=industry,
@@ -2386,7 +2802,7 @@ with tab5:
         # AI Salary Negotiation Coach
         st.markdown("#### 💰 AI Salary Negotiation Coach")
         
-        if not INTELLIGENCE_MODULES_AVAILABLE:
+        if not feature_available('intelligence_modules'):
             st.warning("⚠️ Salary negotiation coaching requires intelligence modules. Showing basic negotiation tips.")
             st.info("💡 **Salary Negotiation Tips:**\n- Research market rates for your role\n- Document your achievements and value\n- Consider the full compensation package\n- Practice your negotiation pitch\n- Be prepared to walk away if needed")
         else:
@@ -2429,7 +2845,7 @@ with tab5:
                         }
                         
                         # Generate negotiation strategy using wrapper
-                        negotiation_strategy = salary_negotiation_coach.create_negotiation_strategy(
+                        negotiation_strategy = get_salary_negotiation_coach().create_negotiation_strategy(
                             negotiation_context, market_data, personal_factors
                         )
                         
@@ -2541,7 +2957,7 @@ with tab5:
                         }
                         
                         # Generate brand strategy using wrapper
-                        brand_strategy = personal_brand_builder.create_personal_brand_strategy(
+                        brand_strategy = cached_brand_strategy(
                             user_profile, career_goals, current_presence
                         )
                         
@@ -2626,12 +3042,11 @@ with tab5:
             st.info("💡 Complete a resume analysis first to enable personal brand building")
 
 # RESULTS SECTION - Enhanced with new metrics dashboard
-if session.get('analysis_result'):
+analysis = session.get('analysis_result')
+if analysis:
     st.markdown("---")
     st.markdown("## 📊 Analysis Results")
     
-    analysis = session.get('analysis_result')
-    
     # Enhanced metrics or basic metrics
     try:
         display_metrics_cards(analysis)  # Use your existing function
@@ -2663,10 +3078,10 @@ if session.get('analysis_result'):
     with viz_tab1:
         # Keyword matching visualization
         try:
-            fig_keywords = viz_engine.create_keyword_chart(
-                analysis.get('matched_keywords', []),
-                analysis.get('missing_keywords', [])
-            )
+            fig_keywords = result_figure(analysis, 'keywords', lambda: cached_keyword_chart(
+                tuple(analysis.get('matched_keywords', [])),
+                tuple(analysis.get('missing_keywords', []))
+            ))
             st.plotly_chart(fig_keywords, use_container_width=True)
         except Exception as e:
             st.warning(f"Keyword chart creation failed: {e}")
@@ -2688,9 +3103,9 @@ if session.get('analysis_result'):
     with viz_tab2:
         # Skills coverage radar chart
         try:
-            fig_skills = viz_engine.create_skills_radar(
-                analysis.get('skills_analysis', {})
-            )
+            fig_skills = result_figure(analysis, 'skills', lambda: cached_skills_radar(
+                tuple(analysis.get('skills_analysis', {}).items())
+            ))
             st.plotly_chart(fig_skills, use_container_width=True)
         except Exception as e:
             st.warning(f"Skills radar chart creation failed: {e}")
@@ -2698,9 +3113,10 @@ if session.get('analysis_result'):
     with viz_tab3:
         # Word cloud visualization
         try:
-            wordcloud_img = viz_engine.create_word_cloud(
+            # Not session-pinned: it reads the live resume text, which edits change
+            wordcloud_img = cached_word_cloud(
                 session.get('resume_text', ''),
-                analysis.get('important_terms', [])
+                tuple(analysis.get('important_terms', []))
             )
             st.image(wordcloud_img, use_column_width=True)
         except Exception as e:
@@ -2710,7 +3126,10 @@ if session.get('analysis_result'):
         # Detailed breakdown
         try:
             if hasattr(viz_engine, 'create_detailed_breakdown'):
-                breakdown_fig = viz_engine.create_detailed_breakdown(analysis)
+                score_breakdown = analysis.get('score_breakdown')
+                breakdown_fig = result_figure(analysis, 'breakdown', lambda: cached_detailed_breakdown(
+                    None if score_breakdown is None else tuple(score_breakdown.items())
+                ))
                 st.plotly_chart(breakdown_fig, use_container_width=True)
             else:
                 st.info("Detailed breakdown chart will be available when viz_engine.create_detailed_breakdown is implemented")
@@ -2783,9 +3202,9 @@ st.markdown(
             🎯 Resume Analysis • 📝 AI Cover Letters • 🔨 Resume Builder • 📊 Job Market Intel • 🚀 Career Simulation • 🎤 Interview Prep • 💰 Salary Negotiation • 🌟 Personal Brand • 🧠 Enhanced AI • 📈 Advanced Analytics
         </p>
         <p style='font-size: 0.6em; opacity: 0.5; margin-top: 10px;'>
-            🧠 Enhanced AI: {"✅ Active" if ENHANCED_ANALYZER_AVAILABLE else "⚠️ Loading"} • 
-            📊 Advanced Charts: {"✅ Active" if ADVANCED_VISUALIZATIONS_AVAILABLE else "⚠️ Loading"} • 
-            🔗 Smart Integration: {"✅ Active" if ENHANCED_INTEGRATION_AVAILABLE else "⚠️ Loading"}
+            🧠 Enhanced AI: {"✅ Active" if feature_available('enhanced_analyzer') else "⚠️ Loading"} • 
+            📊 Advanced Charts: {"✅ Active" if feature_available('advanced_visualizations') else "⚠️ Loading"} • 
+            🔗 Smart Integration: {"✅ Active" if feature_available('enhanced_integration') else "⚠️ Loading"}
         </p>
     </div>
     """,
@@ -304,7 +304,8 @@ class GeminiAnalyzer:
                 'Enhance technical skills section'
             ],
             'important_terms': ['experience', 'skills', 'education'],
-            'skills_coverage': 75
+            'skills_coverage': 75,
+            'fallback_mode': True
         }
     
     def _get_fallback_analysis(self, resume_text: str, job_description: str) -> Dict[str, Any]:
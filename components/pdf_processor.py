@@ -1,9 +1,16 @@
 import PyPDF2
 import io
 import streamlit as st
-from typing import Optional
+from typing import Iterable, Optional
 import re
 
+# PyMuPDF parses PDFs in its C engine, far faster than PyPDF2; when it is not
+# installed the PyPDF2 methods below do the extraction on their own
+try:
+    import fitz
+except ImportError:
+    fitz = None
+
 class PDFProcessor:
     """
     Handles PDF processing and text extraction with multiple fallback methods
@@ -11,17 +18,20 @@ class PDFProcessor:
     
     def __init__(self):
         self.extraction_methods = [
+            self._extract_with_pymupdf,
             self._extract_with_getvalue,
             self._extract_with_read,
             self._extract_with_pypdf2_direct
         ]
     
-    def extract_text(self, uploaded_file) -> Optional[str]:
+    def extract_text(self, uploaded_file, max_chars: Optional[int] = None) -> Optional[str]:
         """
         Extract text from PDF using multiple methods with fallbacks
         
         Args:
             uploaded_file: Streamlit UploadedFile object
+            max_chars: Stop reading further pages once this much raw text is
+                extracted (None reads every page)
             
         Returns:
             Extracted text content or None if extraction fails
@@ -32,7 +42,7 @@ class PDFProcessor:
         # Try each extraction method
         for method in self.extraction_methods:
             try:
-                text = method(uploaded_file)
+                text = method(uploaded_file, max_chars)
                 if text and len(text.strip()) > 0:
                     # Clean and normalize the text
                     cleaned_text = self._clean_text(text)
@@ -44,49 +54,76 @@ class PDFProcessor:
         st.error("Failed to extract text from PDF. Please ensure the PDF contains readable text.")
         return None
     
-    def _extract_with_getvalue(self, uploaded_file) -> str:
+    def _extract_with_pymupdf(self, uploaded_file, max_chars: Optional[int] = None) -> str:
+        """Extract using PyMuPDF, joining words hyphenated across line breaks"""
+        if fitz is None:
+            raise ImportError("PyMuPDF is not installed")
+        
+        file_bytes = uploaded_file.getvalue()
+        if not file_bytes:
+            raise ValueError("Empty file bytes")
+        
+        flags = fitz.TEXT_PRESERVE_WHITESPACE | fitz.TEXT_MEDIABOX_CLIP | fitz.TEXT_DEHYPHENATE
+        with fitz.open(stream=file_bytes, filetype="pdf") as doc:
+            if doc.needs_pass:
+                raise ValueError("PDF is encrypted")
+            return self._join_pages((page.get_text("text", flags=flags) for page in doc), max_chars)
+    
+    def _extract_with_getvalue(self, uploaded_file, max_chars: Optional[int] = None) -> str:
         """Extract using getvalue() method"""
         file_bytes = uploaded_file.getvalue()
-        return self._process_bytes(file_bytes)
+        return self._process_bytes(file_bytes, max_chars)
     
-    def _extract_with_read(self, uploaded_file) -> str:
+    def _extract_with_read(self, uploaded_file, max_chars: Optional[int] = None) -> str:
         """Extract using read() method with seek reset"""
         uploaded_file.seek(0)
         file_bytes = uploaded_file.read()
-        return self._process_bytes(file_bytes)
+        return self._process_bytes(file_bytes, max_chars)
     
-    def _extract_with_pypdf2_direct(self, uploaded_file) -> str:
+    def _extract_with_pypdf2_direct(self, uploaded_file, max_chars: Optional[int] = None) -> str:
         """Extract using PyPDF2 directly on the file object"""
         uploaded_file.seek(0)
         pdf_reader = PyPDF2.PdfReader(uploaded_file)
-        return self._extract_from_reader(pdf_reader)
+        return self._extract_from_reader(pdf_reader, max_chars)
     
-    def _process_bytes(self, file_bytes: bytes) -> str:
+    def _process_bytes(self, file_bytes: bytes, max_chars: Optional[int] = None) -> str:
         """Process PDF bytes and extract text"""
         if not file_bytes:
             raise ValueError("Empty file bytes")
         
         pdf_reader = PyPDF2.PdfReader(io.BytesIO(file_bytes))
-        return self._extract_from_reader(pdf_reader)
+        return self._extract_from_reader(pdf_reader, max_chars)
     
-    def _extract_from_reader(self, pdf_reader) -> str:
-        """Extract text from PyPDF2 reader object"""
+    def _extract_from_reader(self, pdf_reader, max_chars: Optional[int] = None) -> str:
+        """Extract text from PyPDF2 reader object, page by page"""
         if pdf_reader.is_encrypted:
             raise ValueError("PDF is encrypted")
         
-        text_content = ""
-        num_pages = len(pdf_reader.pages)
-        
-        for page_num in range(num_pages):
+        return self._join_pages(self._reader_page_texts(pdf_reader), max_chars)
+    
+    def _reader_page_texts(self, pdf_reader) -> Iterable[str]:
+        """Text of each page, skipping pages PyPDF2 fails to parse"""
+        for page in pdf_reader.pages:
             try:
-                page = pdf_reader.pages[page_num]
-                page_text = page.extract_text()
-                if page_text:
-                    text_content += page_text + "\n"
+                yield page.extract_text()
             except Exception:
                 continue
-        
-        return text_content
+    
+    def _join_pages(self, page_texts: Iterable[str], max_chars: Optional[int] = None) -> str:
+        """Join page texts, pulling pages from page_texts only until max_chars is reached"""
+        parts = []
+        extracted_chars = 0
+        
+        for page_text in page_texts:
+            if page_text:
+                parts.append(page_text)
+                extracted_chars += len(page_text) + 1
+                
+                # Later pages are never parsed once there is enough text
+                if max_chars is not None and extracted_chars >= max_chars:
+                    break
+        
+        return "\n".join(parts) + "\n" if parts else ""
     
     def _clean_text(self, text: str) -> str:
         """
@@ -1,11 +1,11 @@
 import io
+import csv
 from reportlab.lib.pagesizes import letter
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
 from reportlab.lib import colors
 from datetime import datetime
-import pandas as pd
 from typing import Dict, Any
 import json
 
@@ -178,35 +178,37 @@ class ReportGenerator:
         Generate CSV report with analysis data
         """
         # Prepare data for CSV
-        data = {
-            'Metric': [
-                'Overall Match Percentage',
-                'ATS Friendliness',
-                'Skills Coverage',
-                'Technical Skills',
-                'Soft Skills',
-                'Industry Knowledge',
-                'Experience Relevance',
-                'Keywords Matched',
-                'Keywords Missing',
-                'Total Keywords Analyzed'
-            ],
-            'Value': [
-                f"{analysis.get('match_percentage', 0)}%",
-                analysis.get('ats_friendliness', 'Medium'),
-                f"{analysis.get('skills_coverage', 0)}%",
-                f"{analysis.get('skills_analysis', {}).get('technical_skills', 0)}%",
-                f"{analysis.get('skills_analysis', {}).get('soft_skills', 0)}%",
-                f"{analysis.get('skills_analysis', {}).get('industry_knowledge', 0)}%",
-                f"{analysis.get('skills_analysis', {}).get('experience_relevance', 0)}%",
-                len(analysis.get('matched_keywords', [])),
-                len(analysis.get('missing_keywords', [])),
-                len(analysis.get('matched_keywords', [])) + len(analysis.get('missing_keywords', []))
-            ]
-        }
+        metrics = [
+            'Overall Match Percentage',
+            'ATS Friendliness',
+            'Skills Coverage',
+            'Technical Skills',
+            'Soft Skills',
+            'Industry Knowledge',
+            'Experience Relevance',
+            'Keywords Matched',
+            'Keywords Missing',
+            'Total Keywords Analyzed'
+        ]
+        values = [
+            f"{analysis.get('match_percentage', 0)}%",
+            analysis.get('ats_friendliness', 'Medium'),
+            f"{analysis.get('skills_coverage', 0)}%",
+            f"{analysis.get('skills_analysis', {}).get('technical_skills', 0)}%",
+            f"{analysis.get('skills_analysis', {}).get('soft_skills', 0)}%",
+            f"{analysis.get('skills_analysis', {}).get('industry_knowledge', 0)}%",
+            f"{analysis.get('skills_analysis', {}).get('experience_relevance', 0)}%",
+            len(analysis.get('matched_keywords', [])),
+            len(analysis.get('missing_keywords', [])),
+            len(analysis.get('matched_keywords', [])) + len(analysis.get('missing_keywords', []))
+        ]
         
-        df = pd.DataFrame(data)
-        return df.to_csv(index=False)
+        # Two fixed columns - the stdlib writer matches DataFrame.to_csv(index=False)
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator='\n')
+        writer.writerow(['Metric', 'Value'])
+        writer.writerows(zip(metrics, values))
+        return buffer.getvalue()
     
     def generate_text_summary(self, analysis: Dict[str, Any]) -> str:
         """
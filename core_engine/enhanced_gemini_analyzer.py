@@ -130,6 +130,7 @@ class EnhancedGeminiAnalyzer:
             "overall_score": <0-100>,
             "match_percentage": <0-100>,
             "ats_compatibility_score": <0-100>,
+            "skills_coverage": <0-100, share of the job's required skills evidenced in the resume>,
             
             "keyword_analysis": {{
                 "matched_keywords": ["keyword1", "keyword2", ...],
@@ -659,7 +660,8 @@ class EnhancedGeminiAnalyzer:
                 'Quantify achievements with metrics',
                 'Enhance technical skills section'
             ],
-            'raw_response': response_text[:500]
+            'raw_response': response_text[:500],
+            'fallback_mode': True
         }
     
     def _get_comprehensive_fallback_analysis(self, resume_text: str, job_description: str, industry: str) -> Dict[str, Any]:
@@ -138,7 +138,9 @@ class JobMarketScanner:
         # Create opportunity pipeline
         pipeline = self._create_opportunity_pipeline(matched_opportunities)
         
-        # Store scan results
+        # Store scan results - the scanner may be shared between sessions, so make
+        # sure the current one has its tracking state before writing to it
+        self._initialize_scanner()
         scan_record = {
             'timestamp': datetime.now(),
             'criteria': search_criteria,
@@ -1,8 +1,9 @@
 import re
 import nltk
 from collections import Counter
-from typing import List, Dict, Tuple
+from typing import List, Dict, Sequence, Tuple, Optional
 import string
+from functools import lru_cache
 
 # Download required NLTK data (run once)
 try:
@@ -18,6 +19,52 @@ except LookupError:
 from nltk.corpus import stopwords
 from nltk.tokenize import word_tokenize
 
+# Patterns are compiled once at import; the extraction methods run several
+# times per analysis
+
+# Common technical multi-word phrase patterns
+_TECHNICAL_PHRASE_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    r'\b(?:machine|deep)\s+learning\b',
+    r'\b(?:data)\s+(?:science|analysis|engineering|analytics)\b',
+    r'\b(?:software|web|mobile|full[\s-]?stack)\s+(?:development|developer|engineering|engineer)\b',
+    r'\b(?:project|product|program)\s+(?:management|manager)\b',
+    r'\b(?:business)\s+(?:analysis|analyst|intelligence)\b',
+    r'\b[a-z]+\s+(?:framework|library|platform|language)\b',
+    r'\b(?:version)\s+(?:control|management)\b',
+    r'\b(?:continuous)\s+(?:integration|deployment|delivery)\b'
+))
+
+# Skill patterns per taxonomy category (soft_skills has none)
+_SKILL_PATTERNS = {
+    'programming_languages': re.compile(
+        r'\b(?:python|java|javascript|typescript|c\+\+|c#|ruby|go|rust|swift|kotlin|php|r|scala|perl)\b'
+    ),
+    'frameworks_libraries': re.compile(
+        r'\b(?:react|angular|vue|django|flask|spring|express|rails|laravel|\.net|tensorflow|pytorch|keras)\b'
+    ),
+    'databases': re.compile(
+        r'\b(?:mysql|postgresql|mongodb|redis|elasticsearch|cassandra|oracle|sql server|dynamodb|sqlite)\b'
+    ),
+    'cloud_platforms': re.compile(
+        r'\b(?:aws|amazon web services|azure|google cloud|gcp|heroku|digitalocean)\b'
+    ),
+    'tools_technologies': re.compile(
+        r'\b(?:docker|kubernetes|jenkins|git|github|gitlab|jira|confluence|terraform|ansible|nginx|apache)\b'
+    ),
+    'methodologies': re.compile(
+        r'\b(?:agile|scrum|kanban|waterfall|devops|ci/cd|tdd|bdd|microservices|rest|graphql|mvc|mvvm)\b'
+    )
+}
+
+# Common patterns for technical terms
+_TECHNICAL_TERM_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    r'^[A-Z]+$',  # Acronyms like API, SQL, AWS
+    r'^[a-z]+\.js$',  # JavaScript libraries
+    r'^[a-z]+\+\+$',  # C++, etc.
+    r'^\d+[a-z]+$',  # es6, etc.
+    r'^[a-z]+\d+$',  # python3, etc.
+))
+
 class KeywordExtractor:
     """
     Extracts and analyzes keywords from resume and job descriptions
@@ -49,14 +96,22 @@ class KeywordExtractor:
             'data science', 'data analysis', 'data engineering',
             'ci/cd', 'devops', 'api', 'rest', 'graphql', 'microservices'
         }
+        
+        # Extraction is a pure function of the text, so repeat analyses of the same
+        # resume or job description reuse earlier results (per-instance memos)
+        self.ranked_keywords = lru_cache(maxsize=64)(self._ranked_keywords)
+        self.keyword_set = lru_cache(maxsize=128)(self._keyword_set)
+        self.frozen_skills_taxonomy = lru_cache(maxsize=128)(self._frozen_skills_taxonomy)
+        self.skill_sets = lru_cache(maxsize=32)(self._skill_sets)
     
-    def extract_keywords(self, text: str, top_n: int = 20) -> List[str]:
+    def extract_keywords(self, text: str, top_n: Optional[int] = 20) -> List[str]:
         """
         Extract top keywords from text
         
         Args:
             text: Input text
-            top_n: Number of top keywords to return
+            top_n: Number of top keywords to return (None for the full ranking;
+                any top_n result is a prefix of it)
             
         Returns:
             List of keywords
@@ -91,6 +146,18 @@ class KeywordExtractor:
         
         return top_keywords
     
+    def _ranked_keywords(self, text: str) -> Tuple[str, ...]:
+        """Full keyword ranking of text; one tokenization pass per distinct text"""
+        return tuple(self.extract_keywords(text, top_n=None))
+    
+    def top_keywords(self, text: str, top_n: int) -> Tuple[str, ...]:
+        """Top keywords of text, sliced from the memoized ranking"""
+        return self.ranked_keywords(text)[:top_n]
+    
+    def _keyword_set(self, text: str, top_n: int) -> frozenset:
+        """Top keywords of text as a frozenset (keywords are already lowercase)"""
+        return frozenset(self.top_keywords(text, top_n))
+    
     def _extract_technical_phrases(self, text: str) -> List[str]:
         """
         Extract technical multi-word phrases
@@ -109,20 +176,8 @@ class KeywordExtractor:
                 found_phrases.append(term)
         
         # Extract common patterns
-        patterns = [
-            r'\b(?:machine|deep)\s+learning\b',
-            r'\b(?:data)\s+(?:science|analysis|engineering|analytics)\b',
-            r'\b(?:software|web|mobile|full[\s-]?stack)\s+(?:development|developer|engineering|engineer)\b',
-            r'\b(?:project|product|program)\s+(?:management|manager)\b',
-            r'\b(?:business)\s+(?:analysis|analyst|intelligence)\b',
-            r'\b[a-z]+\s+(?:framework|library|platform|language)\b',
-            r'\b(?:version)\s+(?:control|management)\b',
-            r'\b(?:continuous)\s+(?:integration|deployment|delivery)\b'
-        ]
-        
-        for pattern in patterns:
-            matches = re.findall(pattern, text)
-            found_phrases.extend(matches)
+        for pattern in _TECHNICAL_PHRASE_PATTERNS:
+            found_phrases.extend(pattern.findall(text))
         
         return list(set(found_phrases))
     
@@ -151,20 +206,27 @@ class KeywordExtractor:
             'additional': additional
         }
     
-    def calculate_keyword_score(self, resume_text: str, job_text: str) -> Tuple[float, Dict]:
+    def calculate_keyword_score(self, resume_text: str, job_text: str,
+                                resume_keywords: Optional[Sequence[str]] = None,
+                                job_keywords: Optional[Sequence[str]] = None) -> Tuple[float, Dict]:
         """
         Calculate keyword matching score
         
         Args:
             resume_text: Resume content
             job_text: Job description content
+            resume_keywords: Precomputed top 50 resume keywords, if available
+                (any sequence, e.g. a top_keywords tuple)
+            job_keywords: Precomputed top 30 job keywords, if available
             
         Returns:
             Tuple of (score, details)
         """
-        # Extract keywords from both texts
-        resume_keywords = self.extract_keywords(resume_text, top_n=50)
-        job_keywords = self.extract_keywords(job_text, top_n=30)
+        # Extract keywords from both texts unless the caller already has them
+        if resume_keywords is None:
+            resume_keywords = self.extract_keywords(resume_text, top_n=50)
+        if job_keywords is None:
+            job_keywords = self.extract_keywords(job_text, top_n=30)
         
         # Compare keywords
         comparison = self.compare_keywords(resume_keywords, job_keywords)
@@ -255,17 +317,8 @@ class KeywordExtractor:
         Returns:
             True if likely technical, False otherwise
         """
-        # Common patterns for technical terms
-        technical_patterns = [
-            r'^[A-Z]+$',  # Acronyms like API, SQL, AWS
-            r'^[a-z]+\.js$',  # JavaScript libraries
-            r'^[a-z]+\+\+$',  # C++, etc.
-            r'^\d+[a-z]+$',  # es6, etc.
-            r'^[a-z]+\d+$',  # python3, etc.
-        ]
-        
-        for pattern in technical_patterns:
-            if re.match(pattern, term):
+        for pattern in _TECHNICAL_TERM_PATTERNS:
+            if pattern.match(term):
                 return True
         
         # Check for common technical suffixes
@@ -298,36 +351,26 @@ class KeywordExtractor:
             'soft_skills': []
         }
         
-        # Define patterns for each category
-        patterns = {
-            'programming_languages': [
-                r'\b(?:python|java|javascript|typescript|c\+\+|c#|ruby|go|rust|swift|kotlin|php|r|scala|perl)\b'
-            ],
-            'frameworks_libraries': [
-                r'\b(?:react|angular|vue|django|flask|spring|express|rails|laravel|\.net|tensorflow|pytorch|keras)\b'
-            ],
-            'databases': [
-                r'\b(?:mysql|postgresql|mongodb|redis|elasticsearch|cassandra|oracle|sql server|dynamodb|sqlite)\b'
-            ],
-            'cloud_platforms': [
-                r'\b(?:aws|amazon web services|azure|google cloud|gcp|heroku|digitalocean)\b'
-            ],
-            'tools_technologies': [
-                r'\b(?:docker|kubernetes|jenkins|git|github|gitlab|jira|confluence|terraform|ansible|nginx|apache)\b'
-            ],
-            'methodologies': [
-                r'\b(?:agile|scrum|kanban|waterfall|devops|ci/cd|tdd|bdd|microservices|rest|graphql|mvc|mvvm)\b'
-            ]
-        }
-        
         # Extract skills for each category
-        for category, category_patterns in patterns.items():
-            for pattern in category_patterns:
-                matches = re.findall(pattern, text_lower)
-                skills_taxonomy[category].extend(matches)
+        for category, pattern in _SKILL_PATTERNS.items():
+            skills_taxonomy[category].extend(pattern.findall(text_lower))
         
         # Remove duplicates
         for category in skills_taxonomy:
             skills_taxonomy[category] = list(set(skills_taxonomy[category]))
         
-        return skills_taxonomy
\ No newline at end of file
+        return skills_taxonomy
+    
+    def _frozen_skills_taxonomy(self, text: str) -> Dict[str, Tuple[str, ...]]:
+        """Immutable skills taxonomy, safe to share between callers"""
+        return {
+            category: tuple(skills)
+            for category, skills in self.extract_skills_taxonomy(text).items()
+        }
+    
+    def _skill_sets(self, text: str) -> Dict[str, frozenset]:
+        """Skills taxonomy as frozensets, for overlap checks"""
+        return {
+            category: frozenset(skills)
+            for category, skills in self.frozen_skills_taxonomy(text).items()
+        }
\ No newline at end of file
@@ -38,6 +38,9 @@ class SessionManager:
         """
         Get a value from session state
         
+        The stored object itself is returned, not a copy, so render code can
+        read large values (e.g. analysis_result) freely but must not mutate them.
+        
         Args:
             key: The key to retrieve
             default: Default value if key doesn't exist